@@ -12,7 +12,7 @@ Features:
 - Integrates with Ares validation protocols
 """
 
-import json
+import copy
 import os
 import subprocess
 from datetime import datetime
@@ -21,6 +21,8 @@ from typing import List, Dict
 import logging
 import requests
 
+from mobile_queue import MobileTaskQueue
+
 # Setup logging
 logging.basicConfig(
     format='[%(asctime)s] %(levelname)s - %(message)s',
@@ -38,20 +40,27 @@ class AresTaskProcessor:
     """Process mobile tasks with Ares validation"""
 
     def __init__(self):
+        self.queue = MobileTaskQueue(TASK_QUEUE_FILE)
         self.task_queue = self.load_task_queue()
         self.whatsapp_bridge_url = "http://localhost:5000"
 
     def load_task_queue(self) -> List[Dict]:
         """Load task queue"""
-        if TASK_QUEUE_FILE.exists():
-            with open(TASK_QUEUE_FILE, 'r') as f:
-                return json.load(f)
-        return []
+        tasks = self.queue.read()
+        self._loaded = {t['id']: copy.deepcopy(t) for t in tasks if 'id' in t}
+        return tasks
 
     def save_task_queue(self):
-        """Save task queue"""
-        with open(TASK_QUEUE_FILE, 'w') as f:
-            json.dump(self.task_queue, f, indent=2)
+        """
+        Save task queue
+
+        Only tasks this processor changed are written back (merged by id),
+        so tasks the bridge added or updated since load are kept.
+        """
+        changed = [t for t in self.task_queue if self._loaded.get(t.get('id')) != t]
+        if changed:
+            self.queue.merge_tasks(changed)
+            self._loaded.update({t['id']: copy.deepcopy(t) for t in changed if 'id' in t})
 
     def categorize_task(self, task_content: str) -> str:
         """Categorize task by content"""
@@ -0,0 +1,70 @@
+"""
+Benchmark: decision log write and query cost
+
+Caller-side cost of log_decision (enqueue only) against writing each
+record synchronously, and an indexed LOW-confidence query against a
+full scan of every segment.
+
+Usage:
+    python benchmarks/bench_decision_log.py
+"""
+
+import gzip
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.decision_log import DecisionLog  # noqa: E402
+from core.output import AresOutput  # noqa: E402
+
+RECORDS = 50000
+
+
+def main():
+    responses = [
+        AresOutput.format_high_confidence("Done", "Proven pattern", ["Modular Scraper"], ["Tier 1"]),
+        AresOutput.format_medium_confidence("Proceed", "Mixed evidence", ["Hybrid AI"], ["37% accuracy"]),
+    ] * 49 + [AresOutput.format_low_confidence("Need input", [{"name": "REST", "description": "simpler"}])] * 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = DecisionLog(log_dir=Path(tmp), max_segment_bytes=4 * 1024 * 1024)
+        start = time.perf_counter()
+        for i in range(RECORDS):
+            log.log_decision(responses[i % len(responses)])
+        enqueue = (time.perf_counter() - start) / RECORDS * 1e6
+        log.flush(timeout=None)
+        drained = (time.perf_counter() - start) / RECORDS * 1e6
+
+        sync_path = Path(tmp) / "sync.ndjson"
+        start = time.perf_counter()
+        for i in range(2000):
+            with open(sync_path, 'a', encoding='utf-8') as f:
+                f.write(responses[i % len(responses)].to_json() + '\n')
+        sync = (time.perf_counter() - start) / 2000 * 1e6
+
+        print(f"log_decision (caller)      {enqueue:8.2f} us/record")
+        print(f"background write + index   {drained:8.2f} us/record")
+        print(f"synchronous append         {sync:8.2f} us/record")
+
+        start = time.perf_counter()
+        low = log.query(level="LOW")
+        indexed = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        scanned = []
+        for segment in sorted(Path(tmp).glob("decisions-*.ndjson.gz")):
+            with gzip.open(segment, 'rt', encoding='utf-8') as f:
+                scanned.extend(r for r in map(json.loads, f) if r['confidence_level'] == "LOW")
+        scan = (time.perf_counter() - start) * 1000
+        assert len(scanned) == len(low)
+
+        print(f"\n{len(low)} LOW of {RECORDS}: indexed query {indexed:.1f} ms, full scan {scan:.1f} ms")
+        log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: memory and build cost per AresResponse / ValidationResult
+
+Compares the slotted, tuple-backed classes (epoch timestamps formatted
+on output) with the original dict-backed dataclasses holding lists and
+an eagerly formatted datetime.now().isoformat() string.
+
+Usage:
+    python benchmarks/bench_output_memory.py
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.output import AresResponse  # noqa: E402
+from core.validation import ConfidenceLevel, ValidationResult  # noqa: E402
+
+COUNT = 20000
+
+
+@dataclass
+class LegacyResponse:
+    """AresResponse as originally defined"""
+
+    result: Any
+    reasoning: str
+    confidence_score: float
+    confidence_level: str
+    patterns_used: List[str]
+    alternatives_considered: List[str]
+    evidence: List[str]
+    warnings: List[str]
+    timestamp: str
+    ares_version: str = "2.5.0"
+
+
+@dataclass
+class LegacyResult:
+    """ValidationResult as originally defined"""
+
+    challenge_response: str
+    simplify_response: str
+    validate_response: str
+    explain_response: str
+    confidence_score: float
+    confidence_level: ConfidenceLevel
+    should_proceed: bool
+    alternatives_considered: List[str]
+    patterns_referenced: List[str]
+    warnings: List[str]
+
+
+# Shared strings, as the validator produces them (messages come from rules/patterns)
+CHALLENGE = "Evidence: Matches proven pattern: Modular Scraper Architecture"
+PATTERNS = ["Modular Scraper Architecture", "Hybrid AI + Rules"]
+WARNINGS = ["Risk: Over-engineering before validation"]
+ALTERNATIVES = ["Monolithic app with modular structure (simpler deployment)"]
+
+
+def legacy_response(i):
+    return LegacyResponse(
+        "EXECUTE", CHALLENGE, 0.9, "HIGH", list(PATTERNS), [], [CHALLENGE], [],
+        timestamp=datetime.now().isoformat()
+    )
+
+
+def slotted_response(i):
+    return AresResponse("EXECUTE", CHALLENGE, 0.9, "HIGH", tuple(PATTERNS), (), (CHALLENGE,), ())
+
+
+def legacy_result(i):
+    return LegacyResult(
+        CHALLENGE, "Alternatives considered", "Tier 1 pattern", "Like LEGO blocks", 0.9,
+        ConfidenceLevel.HIGH, True, list(ALTERNATIVES), list(PATTERNS), list(WARNINGS)
+    )
+
+
+def slotted_result(i):
+    return ValidationResult(
+        CHALLENGE, "Alternatives considered", "Tier 1 pattern", "Like LEGO blocks", 0.9,
+        ConfidenceLevel.HIGH, True, tuple(ALTERNATIVES), tuple(PATTERNS), tuple(WARNINGS)
+    )
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [build(i) for i in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return size / COUNT
+
+
+def build_us(build):
+    start = time.perf_counter()
+    for i in range(COUNT):
+        build(i)
+    return (time.perf_counter() - start) / COUNT * 1e6
+
+
+def main():
+    print(f"{'object':<28} {'bytes':>8} {'build us':>9}")
+    for label, build in (
+        ("AresResponse (legacy)", legacy_response),
+        ("AresResponse (slotted)", slotted_response),
+        ("ValidationResult (legacy)", legacy_result),
+        ("ValidationResult (slotted)", slotted_result),
+    ):
+        print(f"{label:<28} {measure(build):>8.0f} {build_us(build):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
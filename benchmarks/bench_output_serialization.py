@@ -0,0 +1,67 @@
+"""
+Benchmark: AresResponse serialization
+
+Compares the old path (dataclasses.asdict + json.dumps indent=2) with
+the shallow to_dict + compact to_json (stdlib and orjson, when
+installed) and NDJSON via dumps_many.
+
+Usage:
+    python benchmarks/bench_output_serialization.py
+"""
+
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.output as output  # noqa: E402
+from core.output import AresOutput, dumps_many  # noqa: E402
+
+ITERATIONS = 20000
+BATCH = 1000
+
+
+def make_response():
+    return AresOutput.format_medium_confidence(
+        result="PROCEED WITH CAVEATS - Note uncertainties",
+        reasoning="Evidence: Matches proven pattern: Modular Scraper Architecture | Warnings: "
+                  "Risk: Over-engineering before validation",
+        patterns_used=["Modular Scraper Architecture", "Hybrid AI + Rules", "SQLite Single Source"],
+        caveats=["Risk: Over-engineering before validation", "May be over-complex for simple task"]
+    )
+
+
+def per_call_us(fn, iterations=ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    response = make_response()
+    responses = [make_response() for _ in range(BATCH)]
+    backend = output.orjson
+
+    rows = [
+        ("asdict + indent=2 (old)", per_call_us(lambda: json.dumps(asdict(response), indent=2))),
+        ("to_dict", per_call_us(response.to_dict)),
+    ]
+    output.orjson = None
+    rows.append(("to_json stdlib", per_call_us(response.to_json)))
+    rows.append(("dumps_many stdlib /resp", per_call_us(lambda: dumps_many(responses), 20) / BATCH))
+    output.orjson = backend
+    if backend is not None:
+        rows.append(("to_json orjson", per_call_us(response.to_json)))
+        rows.append(("dumps_many orjson /resp", per_call_us(lambda: dumps_many(responses), 20) / BATCH))
+
+    old = rows[0][1]
+    for label, us in rows:
+        print(f"{label:<26} {us:8.2f} us  {old / us:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: pattern library load time
+
+Compares a cold parse of proven-patterns.md against a warm start from
+the compiled cache, for synthetic libraries of increasing size.
+
+Usage:
+    python benchmarks/bench_pattern_loading.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.pattern_parser import load_pattern_records  # noqa: E402
+
+SIZES = [100, 1000, 5000, 10000]
+
+
+def synthetic_library(count: int) -> str:
+    """Markdown with `count` tiered pattern sections"""
+    lines = ["# Proven Coding Patterns (synthetic)", ""]
+    for i in range(count):
+        if i % 50 == 0:
+            lines += [f"## Category {i // 50} Patterns", ""]
+        tier = i % 3 + 1
+        lines += [
+            f"### {i}. Synthetic Pattern {i} {'⭐' * (4 - tier)} TIER {tier}",
+            f"**Pattern ID:** synthetic_{i} | **Success Rate:** {50 + i % 50}% | **Uses:** {i % 20}",
+            f"**Applies to:** keyword{i % 97}, topic{i % 31}, area{i % 13}",
+            f"**Pattern:** Description of synthetic pattern {i}",
+            "",
+            "**Evidence:**",
+            f"- Used in project {i % 7}",
+            f"- Metric {i % 100}% improvement",
+            "",
+            "**Trade-offs:**",
+            "- ✅ Benefit: Something good",
+            "- ⚠️ Cost: Something else",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'patterns':>10} {'size KB':>10} {'cold parse ms':>15} {'warm cache ms':>15} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for count in SIZES:
+            source = tmp / f"patterns-{count}.md"
+            source.write_text(synthetic_library(count), encoding='utf-8')
+            cache_dir = tmp / f"cache-{count}"
+
+            cold = best_of(lambda: load_pattern_records(source, cache_dir=None))
+            load_pattern_records(source, cache_dir=cache_dir)  # prime the cache
+            warm = best_of(lambda: load_pattern_records(source, cache_dir=cache_dir))
+
+            size_kb = source.stat().st_size / 1024
+            print(f"{count:>10} {size_kb:>10.0f} {cold * 1000:>15.2f} {warm * 1000:>15.2f} {cold / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: find_matching_patterns latency vs library size
+
+Compares the inverted keyword index against the original nested loop
+(every pattern x every keyword x substring search).
+
+Usage:
+    python benchmarks/bench_pattern_matching.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.pattern_index import PatternIndex  # noqa: E402
+from core.patterns import Pattern  # noqa: E402
+
+SIZES = [100, 1000, 10000]
+QUERIES = [
+    "Create a modular architecture with separate scrapers and a central coordinator",
+    "Use SQLite as single source of truth with hybrid AI + rules",
+    "Build a blockchain-based voting system with zero-knowledge proofs",
+    "keyword17 pipeline with topic3 and area5 plus data collection",
+]
+
+
+def synthetic_patterns(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    vocabulary = [f"keyword{i}" for i in range(2000)] + ["modular", "sqlite", "ai", "rules", "data_collection"]
+    return [
+        Pattern(
+            pattern_id=f"synthetic_{i}",
+            tier=i % 3 + 1,
+            name=f"Synthetic Pattern {i}",
+            description="",
+            success_rate=rng.random(),
+            usage_count=i % 20,
+            category="synthetic",
+            applies_to=rng.sample(vocabulary, 4),
+            evidence=[],
+            trade_offs=""
+        )
+        for i in range(count)
+    ]
+
+
+def naive_match(patterns, text):
+    text_lower = text.lower()
+    matches = [p for p in patterns if any(k in text_lower for k in p.applies_to)]
+    matches.sort(key=lambda p: (p.tier, -p.success_rate))
+    return matches
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(QUERIES[i % len(QUERIES)])
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print(f"{'patterns':>10} {'naive us/call':>15} {'index us/call':>15} {'speedup':>8}")
+    for count in SIZES:
+        patterns = synthetic_patterns(count)
+        index = PatternIndex(patterns)
+        iterations = max(20, 20000 // count)
+
+        naive = per_call_us(lambda q: naive_match(patterns, q), iterations)
+        indexed = per_call_us(index.match, 2000)
+        print(f"{count:>10} {naive:>15.1f} {indexed:>15.1f} {naive / indexed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: batch matching (find_matching_patterns_many) vs per-call loop
+
+Texts are drawn from a task-history-like mix (many repeats, some unique)
+and matched against the real proven-patterns.md.
+
+Usage:
+    python benchmarks/bench_pattern_matching_batch.py [max_exponent]
+
+    max_exponent defaults to 6 (10^3 .. 10^6 texts).
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.patterns import AresPatternMatcher  # noqa: E402
+
+TEMPLATES = [
+    "Create a modular architecture with separate scrapers and a central coordinator",
+    "Use SQLite as single source of truth with hybrid AI + rules",
+    "Build a blockchain-based voting system with zero-knowledge proofs",
+    "Add a comprehensive CLI with graceful degradation for task {n}",
+    "Analyze sentiment of customer review {n}",
+]
+
+
+def synthetic_texts(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [rng.choice(TEMPLATES).format(n=rng.randrange(count // 10 + 1)) for _ in range(count)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    matcher = AresPatternMatcher()
+    cpus = os.cpu_count() or 1
+
+    print(f"{'texts':>9} {'loop s':>9} {'batch s':>9} {f'batch x{cpus} s':>13} {'speedup':>8}")
+    for exponent in range(3, max_exponent + 1):
+        texts = synthetic_texts(10 ** exponent)
+
+        loop, expected = timed(lambda: [matcher.find_matching_patterns(t) for t in texts])
+        batch, serial = timed(lambda: matcher.find_matching_patterns_many(texts, processes=1))
+        pooled, parallel = timed(lambda: matcher.find_matching_patterns_many(texts, processes=cpus))
+        assert serial == expected and parallel == expected
+
+        best = min(batch, pooled)
+        print(f"{len(texts):>9} {loop:>9.3f} {batch:>9.3f} {pooled:>13.3f} {loop / best:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
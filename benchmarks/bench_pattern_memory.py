@@ -0,0 +1,113 @@
+"""
+Benchmark: memory per pattern and tier/id lookup cost
+
+Compares the slotted, frozen Pattern (interned keyword tuples) with the
+original dict-backed dataclass holding lists, and the index's O(1) id
+lookup / tier buckets against linear scans.
+
+Usage:
+    python benchmarks/bench_pattern_memory.py
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.pattern_index import PatternIndex  # noqa: E402
+from core.patterns import Pattern  # noqa: E402
+
+COUNT = 10000
+
+
+@dataclass
+class LegacyPattern:
+    """Pattern as originally defined (per-instance dict, lists)"""
+
+    pattern_id: str
+    tier: int
+    name: str
+    description: str
+    success_rate: float
+    usage_count: int
+    category: str
+    applies_to: List[str]
+    evidence: List[str]
+    trade_offs: str
+
+
+def raw_fields(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    vocabulary = [f"keyword{i}" for i in range(500)]
+    return [
+        dict(
+            pattern_id=f"synthetic_{i}",
+            tier=i % 3 + 1,
+            name=f"Synthetic Pattern {i}",
+            description=f"Description {i}",
+            success_rate=rng.random(),
+            usage_count=i % 20,
+            category="synthetic",
+            # Fresh strings per pattern, as a parser produces them
+            applies_to=[''.join(k) for k in rng.sample(vocabulary, 4)],
+            evidence=[f"Used in: project {i}", f"Metric: {i}%"],
+            trade_offs="",
+        )
+        for i in range(count)
+    ]
+
+
+def measure(build):
+    # Parsed fields are built inside the trace and then dropped, so only
+    # what the stored objects keep alive is counted
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build(raw_fields(COUNT))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return objects, size / COUNT
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    legacy, legacy_bytes = measure(lambda fields: [LegacyPattern(**f) for f in fields])
+    compact, compact_bytes = measure(lambda fields: [Pattern(**f) for f in fields])
+    _, index_bytes = measure(lambda fields: PatternIndex(Pattern(**f) for f in fields))
+
+    print(f"{'storage':<28} {'bytes/pattern':>14}")
+    print(f"{'legacy dataclass + lists':<28} {legacy_bytes:>14.0f}")
+    print(f"{'slotted frozen + tuples':<28} {compact_bytes:>14.0f}")
+    print(f"{'  + PatternIndex (all)':<28} {index_bytes:>14.0f}")
+
+    index = PatternIndex(compact)
+    ids = [f"synthetic_{i}" for i in range(0, COUNT, 97)]
+
+    def linear_lookup(i):
+        target = ids[i % len(ids)]
+        return next(p for p in compact if p.pattern_id == target)
+
+    print()
+    print(f"{'operation':<28} {'linear us':>10} {'index us':>10}")
+    print(f"{'get_pattern_by_id':<28} {per_call_us(linear_lookup, 200):>10.1f} "
+          f"{per_call_us(lambda i: index.by_id[ids[i % len(ids)]], 20000):>10.2f}")
+    print(f"{'tier 1 patterns':<28} {per_call_us(lambda i: [p for p in compact if p.tier == 1], 200):>10.1f} "
+          f"{per_call_us(lambda i: list(index.tier_buckets[1]), 2000):>10.2f}")
+    print(f"{'tier 1, rate >= 0.9':<28} "
+          f"{per_call_us(lambda i: [p for p in compact if p.tier == 1 and p.success_rate >= 0.9], 200):>10.1f} "
+          f"{per_call_us(lambda i: index.select(1, 0.9), 2000):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
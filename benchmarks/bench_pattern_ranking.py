@@ -0,0 +1,93 @@
+"""
+Benchmark: ranked retrieval (BM25) build time and query latency
+
+Compares the precomputed sparse term matrix against scoring every
+pattern from scratch per query (tokenize + BM25 over the whole library).
+
+Usage:
+    python benchmarks/bench_pattern_ranking.py
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+from math import log
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.pattern_ranking import B, K1, STOPWORDS, BM25Ranker, pattern_terms  # noqa: E402
+from core.keyword_automaton import normalize_text  # noqa: E402
+from core.patterns import Pattern  # noqa: E402
+
+SIZES = [100, 1000, 10000]
+QUERIES = [
+    "Create a modular architecture with separate scrapers and a central coordinator",
+    "Use SQLite as single source of truth with hybrid AI + rules",
+    "Build a blockchain-based voting system with zero-knowledge proofs",
+    "word17 pipeline with word3 and word5 plus data collection",
+]
+
+
+def synthetic_patterns(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(5000)] + ["modular", "sqlite", "ai", "rules", "data", "collection"]
+    return [
+        Pattern(
+            pattern_id=f"synthetic_{i}",
+            tier=i % 3 + 1,
+            name=f"Synthetic Pattern {i}",
+            description=' '.join(rng.choices(vocabulary, k=12)),
+            success_rate=rng.random(),
+            usage_count=i % 20,
+            category="synthetic",
+            applies_to=rng.sample(vocabulary, 4),
+            evidence=[' '.join(rng.choices(vocabulary, k=8)) for _ in range(3)],
+            trade_offs=' '.join(rng.choices(vocabulary, k=10))
+        )
+        for i in range(count)
+    ]
+
+
+def naive_top_k(patterns, query, k=5):
+    docs = [Counter(pattern_terms(p)) for p in patterns]
+    lengths = [sum(d.values()) for d in docs]
+    avg_len = sum(lengths) / len(lengths)
+    terms = [t for t in normalize_text(query).split() if t not in STOPWORDS]
+    scores = []
+    for doc, length in zip(docs, lengths):
+        score = 0.0
+        for term in terms:
+            tf = doc.get(term, 0)
+            if tf:
+                df = sum(1 for d in docs if term in d)
+                idf = log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+                score += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_len))
+        scores.append(score)
+    return sorted(range(len(patterns)), key=lambda i: -scores[i])[:k]
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(QUERIES[i % len(QUERIES)])
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print(f"{'patterns':>10} {'build ms':>10} {'naive us/query':>16} {'ranked us/query':>16} {'speedup':>8}")
+    for count in SIZES:
+        patterns = synthetic_patterns(count)
+
+        start = time.perf_counter()
+        ranker = BM25Ranker(patterns)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        naive = per_call_us(lambda q: naive_top_k(patterns, q), 4 if count > 1000 else 20)
+        ranked = per_call_us(ranker.top_k, 2000)
+        print(f"{count:>10} {build_ms:>10.1f} {naive:>16.1f} {ranked:>16.1f} {naive / ranked:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
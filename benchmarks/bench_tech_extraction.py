@@ -0,0 +1,50 @@
+"""
+Benchmark: technology extraction cost vs vocabulary size
+
+Compares the old per-name substring scan with TechMatrix.extract as
+synthetic technologies are added to the shipped tech-success-matrix.md
+entries. extract scans name by name up to SCAN_MAX_KEYWORDS names and
+switches to one automaton pass above that.
+
+Usage:
+    python benchmarks/bench_tech_extraction.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.keyword_automaton import normalize_text  # noqa: E402
+from core.tech_matrix import TechEntry, TechMatrix  # noqa: E402
+
+SIZES = [0, 100, 1000, 10000]
+TEXT = normalize_text(
+    "Use SQLite as single source of truth with hybrid AI + rules, a Python worker, tech42 and tech977"
+)
+ITERATIONS = 5000
+
+
+def per_call_us(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(TEXT)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    shipped = TechMatrix.from_file().entries
+    print(f"{'techs':>8} {'scan us':>10} {'extract us':>11}")
+    for count in SIZES:
+        synthetic = [TechEntry(f"Tech{i}", 0.5, (f"tech{i}",)) for i in range(count)]
+        matrix = TechMatrix(shipped + tuple(synthetic))
+        names = [alias for entry in matrix.entries for alias in entry.aliases]
+
+        scan = per_call_us(lambda text: [name for name in names if name in text])
+        extract = per_call_us(lambda text: matrix.extract(text, normalized=True))
+        print(f"{len(matrix):>8} {scan:>10.1f} {extract:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: AresValidation.run_validation latency
+
+Runs the demo cases from test_ares_protocols.py against the real
+pattern library, with the match cache off (every call matches), on,
+and with the result cache (repeats skip validation entirely).
+
+Usage:
+    python benchmarks/bench_validation.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.patterns import AresPatternMatcher  # noqa: E402
+from core.validation import AresValidation  # noqa: E402
+from core.validation_cache import ValidationCache  # noqa: E402
+
+CASES = [
+    ("Build a web scraping system for multiple data sources",
+     "Create a modular architecture with separate scrapers and a central coordinator",
+     {"complexity": "medium", "data_sources": 5}),
+    ("Implement sentiment analysis for financial news",
+     "Use local sentiment analysis with 300 keywords",
+     {"accuracy_requirement": "high"}),
+    ("Build a blockchain-based voting system",
+     "Use Ethereum smart contracts with zero-knowledge proofs",
+     {}),
+    ("Build a database-centric workflow automation system",
+     "Use SQLite as single source of truth with hybrid AI + rules",
+     {"users": "single", "data_volume": "medium"}),
+]
+
+ITERATIONS = 20000
+
+
+def per_call_us(validator) -> float:
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        task, approach, context = CASES[i % len(CASES)]
+        validator.run_validation(task, approach, context)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    for label, cache_size in (("match cache off", 0), ("match cache on", 1024)):
+        validator = AresValidation(patterns_library=AresPatternMatcher(match_cache_size=cache_size))
+        print(f"{label:<16} {per_call_us(validator):8.1f} us/validation")
+
+    validator = AresValidation(patterns_library=AresPatternMatcher(), cache=ValidationCache())
+    print(f"{'result cache on':<16} {per_call_us(validator):8.1f} us/validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: run_validation_batch throughput vs a run_validation loop
+
+Usage:
+    python benchmarks/bench_validation_batch.py [items]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.patterns import AresPatternMatcher  # noqa: E402
+from core.validation import AresValidation  # noqa: E402
+
+from bench_validation import CASES  # noqa: E402
+
+
+def synthetic_items(count: int):
+    # Vary the text so the match cache doesn't turn this into a cache benchmark
+    return [
+        (task, f"{approach} step {i}", context)
+        for i in range(count)
+        for task, approach, context in [CASES[i % len(CASES)]]
+    ]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    validator = AresValidation(patterns_library=AresPatternMatcher())
+    items = synthetic_items(count)
+    cpus = os.cpu_count() or 1
+
+    loop = timed(lambda: [validator.run_validation(*item) for item in items])
+    print(f"{'loop':<14} {count / loop:>10.0f} validations/s")
+    for processes in sorted({1, 2, cpus}):
+        elapsed = timed(lambda: sum(1 for _ in validator.run_validation_batch(items, processes=processes)))
+        print(f"{f'batch x{processes}':<14} {count / elapsed:>10.0f} validations/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: per-step validation cost vs pattern library size
+
+Adds synthetic patterns to the real library and profiles the demo cases
+with ValidationProfiler, then measures the cost of leaving hooks off.
+
+Usage:
+    python benchmarks/bench_validation_profile.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.patterns import AresPatternMatcher, Pattern  # noqa: E402
+from core.validation import AresValidation  # noqa: E402
+from core.validation_profile import STEPS  # noqa: E402
+
+from bench_validation import CASES  # noqa: E402
+
+SIZES = [0, 1000, 10000]
+ITERATIONS = 5000
+
+
+def synthetic_patterns(count: int):
+    return [
+        Pattern(
+            pattern_id=f"synthetic_{i}", tier=1 + i % 3, name=f"Synthetic {i}", description="",
+            success_rate=0.5, usage_count=1, category="synthetic",
+            applies_to=(f"term{i}", "scrapers" if i % 100 == 0 else f"other{i}"), evidence=(), trade_offs=""
+        )
+        for i in range(count)
+    ]
+
+
+def run(validator):
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        validator.run_validation(*CASES[i % len(CASES)])
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    print(f"{'patterns':>9} " + " ".join(f"{step:>10}" for step in STEPS) + f" {'total us':>9}")
+    for count in SIZES:
+        matcher = AresPatternMatcher(match_cache_size=0)
+        matcher.patterns = matcher.patterns + synthetic_patterns(count)
+        matcher.rebuild_index()
+        validator = AresValidation(patterns_library=matcher)
+
+        with validator.profile() as profiler:
+            run(validator)
+        summary = profiler.summary()
+        print(
+            f"{len(matcher.patterns):>9} "
+            + " ".join(f"{summary[step]['mean_us']:>10.1f}" for step in STEPS)
+            + f" {summary['total']['mean_us']:>9.1f}"
+        )
+
+    validator = AresValidation(patterns_library=AresPatternMatcher(match_cache_size=0))
+    off = run(validator)
+    with validator.profile():
+        on = run(validator)
+    print(f"\nhooks off {off:.1f} us/validation, profiler on {on:.1f} us/validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: rule evaluation cost vs rule count
+
+The shipped rules plus synthetic rules are compiled into one automaton;
+evaluation stays one pass over the approach however many rules exist.
+
+Usage:
+    python benchmarks/bench_validation_rules.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.keyword_automaton import normalize_text  # noqa: E402
+from core.rules import Rule, RuleSet, default_rules  # noqa: E402
+
+SIZES = [0, 100, 1000, 10000]
+APPROACH = normalize_text(
+    "Pure AI without fallback on Kubernetes microservices, exposed over GraphQL, with term42 and term977"
+)
+
+
+def synthetic_rules(count: int):
+    return [
+        Rule(f"synthetic_{i}", ('warning', 'alternative', 'analogy')[i % 3], (f"term{i}",), f"Synthetic rule {i}")
+        for i in range(count)
+    ]
+
+
+def main():
+    shipped = default_rules().rules
+    print(f"{'rules':>8} {'compile ms':>11} {'us/evaluate':>12}")
+    for count in SIZES:
+        start = time.perf_counter()
+        rules = RuleSet(shipped + tuple(synthetic_rules(count)))
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        iterations = 20000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            rules.evaluate(APPROACH, {"complexity": "simple", "api_needs": "simple"})
+        per_call = (time.perf_counter() - start) / iterations * 1e6
+        print(f"{len(rules):>8} {compile_ms:>11.1f} {per_call:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
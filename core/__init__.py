@@ -6,6 +6,10 @@ Codified from Ares v2.1 Internal Skeptic protocols
 from .validation import AresValidation, ValidationResult
 from .output import AresOutput, AresResponse
 from .patterns import AresPatternMatcher, Pattern
+from .knowledge import KnowledgeBase
+from .usage import UsageTracker
+from .validation_cache import ValidationCache
+from .decision_log import DecisionLog
 
 __all__ = [
     'AresValidation',
@@ -13,7 +17,11 @@ __all__ = [
     'AresOutput',
     'AresResponse',
     'AresPatternMatcher',
-    'Pattern'
+    'Pattern',
+    'KnowledgeBase',
+    'UsageTracker',
+    'ValidationCache',
+    'DecisionLog'
 ]
 
 __version__ = '2.5.0'
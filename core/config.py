@@ -0,0 +1,39 @@
+"""
+ARES Configuration
+Loads config/ares.yaml
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_CONFIG_FILE = Path(__file__).parent.parent / "config" / "ares.yaml"
+
+
+def load_config(path: Optional[Path] = None) -> dict:
+    """
+    Load ares.yaml as a dict
+
+    Returns an empty dict when the file is missing or PyYAML is not
+    installed, so callers fall back to their own defaults.
+    """
+    path = Path(path) if path is not None else DEFAULT_CONFIG_FILE
+    try:
+        import yaml
+    except ImportError:
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+
+
+def config_value(config: dict, dotted_key: str, default: Any = None) -> Any:
+    """Nested lookup: config_value(cfg, 'patterns.auto_promote_threshold', 3)"""
+    value: Any = config
+    for key in dotted_key.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
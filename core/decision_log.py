@@ -0,0 +1,453 @@
+"""
+ARES Decision Log
+Append-only, compressed NDJSON log of validations and decisions
+
+log_validation() / log_decision() only build a small dict and queue it;
+a daemon thread serializes each batch into one gzip member appended to
+the current segment (decisions-000001.ndjson.gz, ...), rotating to a
+new segment past max_segment_bytes of JSON. Concatenated gzip members
+are a valid gzip file, so `zcat` reads segments directly.
+
+Every record is also indexed in a sidecar SQLite file (decision-index.db)
+by timestamp, confidence level, kind and pattern id, with the segment,
+member offset and line it lives at. query() selects from the index and
+decompresses only the members holding matching records - "all LOW
+decisions in the last week" never scans the whole log.
+
+A record the JSON encoder rejects is written with str() for the
+offending values; the writer thread survives any error and _put()
+restarts it should it ever die.
+
+Configured by the logging section of config/ares.yaml (see from_config).
+One writing process per log_dir.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .config import DEFAULT_CONFIG_FILE, config_value, load_config
+from .output import _dumps
+
+DEFAULT_LOG_DIR = DEFAULT_CONFIG_FILE.parent.parent / "logs"
+MAX_SEGMENT_BYTES = 16 * 1024 * 1024  # Uncompressed JSON per segment
+MAX_BATCH = 1000  # Records per gzip member
+SEGMENT_GLOB = "decisions-*.ndjson.gz"
+INDEX_FILE = "decision-index.db"
+
+logger = logging.getLogger(__name__)
+
+Timestamp = Union[float, datetime]
+
+
+def _segment_name(seq: int) -> str:
+    return f"decisions-{seq:06d}.ndjson.gz"
+
+
+def _epoch(value: Optional[Timestamp]) -> Optional[float]:
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+def _serialize(record: dict) -> Optional[bytes]:
+    """
+    One NDJSON line
+
+    Values JSON rejects are written as str(); None if the record still
+    cannot be encoded (e.g. a circular reference).
+    """
+    try:
+        return _dumps(record).encode('utf-8')
+    except (TypeError, ValueError) as e:
+        logger.error("[ERROR] Decision log record not JSON serializable (%s) - storing str() values", e)
+    try:
+        return json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+    except (TypeError, ValueError) as e:
+        logger.error("[ERROR] Decision log record dropped: %s", e)
+        return None
+
+
+def _read_member(path: Path, offset: int) -> List[bytes]:
+    """Lines of the gzip member starting at offset"""
+    decompressor = zlib.decompressobj(wbits=31)
+    parts = []
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while not decompressor.eof:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            parts.append(decompressor.decompress(chunk))
+    return b''.join(parts).split(b'\n')
+
+
+class DecisionLog:
+    """Background-written decision log with a query index"""
+
+    def __init__(
+        self,
+        log_dir: Path = DEFAULT_LOG_DIR,
+        max_segment_bytes: int = MAX_SEGMENT_BYTES,
+        max_segments: Optional[int] = None,
+        log_validations: bool = True,
+        log_decisions: bool = True
+    ):
+        """
+        Args:
+            log_dir: Directory for segments and the index
+            max_segment_bytes: Uncompressed JSON bytes before rotating
+            max_segments: Segments kept (oldest dropped with their index
+                          rows); None keeps everything
+            log_validations: Record ValidationResults
+            log_decisions: Record AresResponses
+        """
+        self.log_dir = Path(log_dir)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.log_validations = log_validations
+        self.log_decisions = log_decisions
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.log_dir / INDEX_FILE
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS decisions ("
+                " id INTEGER PRIMARY KEY,"
+                " ts REAL NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " level TEXT NOT NULL,"
+                " segment TEXT NOT NULL,"
+                " member_offset INTEGER NOT NULL,"
+                " line INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS decision_pattern_ids ("
+                " decision_id INTEGER NOT NULL,"
+                " pattern_id TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS decisions_ts ON decisions (ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS decisions_level_ts ON decisions (level, ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS decisions_segment ON decisions (segment)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS decision_pattern_ids_pattern ON decision_pattern_ids (pattern_id)"
+            )
+
+        # A new process starts a new segment (never appends after a torn write)
+        existing = sorted(self.log_dir.glob(SEGMENT_GLOB))
+        self._seq = int(existing[-1].name.split('-')[1].split('.')[0]) if existing else 0
+        self._segment: Optional[str] = None
+        self._segment_bytes = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[dict] = None, **kwargs) -> Optional['DecisionLog']:
+        """
+        Decision log configured from ares.yaml (logging section)
+
+        Relative log_dir paths are resolved against the repo root.
+
+        Returns:
+            None when logging is disabled or neither validations nor
+            decisions are logged
+        """
+        config = load_config() if config is None else config
+        log_validations = config_value(config, 'logging.log_validations', True)
+        log_decisions = config_value(config, 'logging.log_decisions', True)
+        if not config_value(config, 'logging.enabled', True) or not (log_validations or log_decisions):
+            return None
+
+        log_dir = Path(config_value(config, 'logging.log_dir', DEFAULT_LOG_DIR))
+        if not log_dir.is_absolute():
+            log_dir = DEFAULT_CONFIG_FILE.parent.parent / log_dir
+        kwargs.setdefault('log_dir', log_dir)
+        kwargs.setdefault('log_validations', log_validations)
+        kwargs.setdefault('log_decisions', log_decisions)
+        return cls(**kwargs)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.index_path, timeout=30)
+
+    # Hot path: build a dict and enqueue
+
+    def log_validation(self, result, task: str = '', approach: str = '') -> None:
+        """
+        Queue a ValidationResult
+
+        Args:
+            result: ValidationResult
+            task, approach: What was validated
+        """
+        if not self.log_validations:
+            return
+        self._put({
+            'ts': time.time(),
+            'kind': 'validation',
+            'task': task,
+            'approach': approach,
+            'confidence_level': result.confidence_level.value,
+            'confidence_score': result.confidence_score,
+            'should_proceed': result.should_proceed,
+            'patterns': list(result.patterns_referenced),
+            'pattern_ids': list(result.pattern_ids),
+            'warnings': list(result.warnings),
+            'alternatives': list(result.alternatives_considered),
+            'challenge': result.challenge_response,
+            'simplify': result.simplify_response,
+            'validate': result.validate_response,
+            'explain': result.explain_response,
+        })
+
+    def log_decision(self, response, pattern_ids: Sequence[str] = ()) -> None:
+        """
+        Queue an AresResponse
+
+        Args:
+            response: AresResponse
+            pattern_ids: Ids of response.patterns_used (what query(pattern_id=)
+                         finds it by; see AresOutput.format_validation_result)
+        """
+        if not self.log_decisions:
+            return
+        record = response.to_dict()
+        record['ts'] = response.created_at
+        record['kind'] = 'decision'
+        record['patterns'] = record.pop('patterns_used')
+        record['pattern_ids'] = list(pattern_ids)
+        self._put(record)
+
+    def _put(self, record: dict):
+        if self._closed:
+            return
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            self._start()
+        self._queue.put(record)
+
+    # Writer thread
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                if self._thread.is_alive():
+                    return
+                logger.error("[ERROR] Decision log writer stopped unexpectedly - restarting")
+            else:
+                atexit.register(self.close)
+            self._thread = threading.Thread(target=self._run, name="ares-decision-log", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < MAX_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                records = [item for item in batch if isinstance(item, dict)]
+                if records:
+                    try:
+                        self._write(conn, records)
+                    except Exception as e:
+                        # Drop the batch, keep the writer (and later batches) alive
+                        logger.error("[ERROR] Decision log write failed (%d records): %s", len(records), e)
+
+                # Markers: Event = flush barrier, None = stop
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                if any(item is None for item in batch):
+                    return
+        finally:
+            conn.close()
+
+    def _write(self, conn: sqlite3.Connection, records: List[dict]):
+        # Newline-terminated, so members concatenate into valid NDJSON
+        lines = [_serialize(record) for record in records]
+        if None in lines:
+            records = [record for record, line in zip(records, lines) if line is not None]
+            lines = [line for line in lines if line is not None]
+            if not records:
+                return
+        payload = b''.join(line + b'\n' for line in lines)
+
+        if self._segment is None or self._segment_bytes >= self.max_segment_bytes:
+            self._rotate(conn)
+        compressor = zlib.compressobj(wbits=31)
+        member = compressor.compress(payload) + compressor.flush()
+
+        # Data first, then the index: an index row never points past the file
+        path = self.log_dir / self._segment
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            f.write(member)
+        self._segment_bytes += len(payload)
+
+        segment = self._segment
+        with conn:
+            first = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM decisions").fetchone()[0]
+            conn.executemany(
+                "INSERT INTO decisions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (first + line, record['ts'], record['kind'], record['confidence_level'], segment, offset, line)
+                    for line, record in enumerate(records)
+                ]
+            )
+            conn.executemany(
+                "INSERT INTO decision_pattern_ids VALUES (?, ?)",
+                [
+                    (first + line, pattern_id)
+                    for line, record in enumerate(records)
+                    for pattern_id in record['pattern_ids']
+                ]
+            )
+
+    def _rotate(self, conn: sqlite3.Connection):
+        self._seq += 1
+        self._segment = _segment_name(self._seq)
+        self._segment_bytes = 0
+        if not self.max_segments:
+            return
+
+        segments = sorted(self.log_dir.glob(SEGMENT_GLOB))
+        expired = [p.name for p in segments[:max(0, len(segments) - self.max_segments + 1)]]
+        if not expired:
+            return
+        self._drop_segments(conn, expired)
+        for name in expired:
+            (self.log_dir / name).unlink(missing_ok=True)
+
+    @staticmethod
+    def _drop_segments(conn: sqlite3.Connection, names: Sequence[str]):
+        """Delete the index rows of the given segments"""
+        with conn:
+            for name in names:
+                conn.execute(
+                    "DELETE FROM decision_pattern_ids WHERE decision_id IN"
+                    " (SELECT id FROM decisions WHERE segment = ?)",
+                    (name,)
+                )
+                conn.execute("DELETE FROM decisions WHERE segment = ?", (name,))
+
+    # Control
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Wait until everything queued so far is on disk and indexed
+
+        Returns:
+            False if the writer did not catch up within timeout
+        """
+        if self._thread is None:
+            return True
+        if not self._thread.is_alive():
+            if self._closed:
+                return self._queue.empty()
+            self._start()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """Write everything queued and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            if self._thread is not threading.current_thread():
+                self._thread.join(10.0)
+
+    # Queries
+
+    def query(
+        self,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        level: Optional[str] = None,
+        pattern_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Logged records matching every given filter, oldest first
+
+        Args:
+            since, until: Epoch seconds or datetimes (until exclusive)
+            level: Confidence level, e.g. "LOW"
+            pattern_id: Id of a pattern the record references, e.g. "modular_architecture_v1"
+            kind: "validation" or "decision"
+            limit: Maximum number of records
+
+        Example:
+            log.query(since=time.time() - 7 * 86400, level="LOW")
+        """
+        self.flush()
+
+        sql = "SELECT d.segment, d.member_offset, d.line FROM decisions d"
+        where, args = [], []
+        if pattern_id is not None:
+            sql += " JOIN decision_pattern_ids p ON p.decision_id = d.id"
+            where.append("p.pattern_id = ?")
+            args.append(pattern_id)
+        for clause, value in (
+            ("d.ts >= ?", _epoch(since)),
+            ("d.ts < ?", _epoch(until)),
+            ("d.level = ?", level),
+            ("d.kind = ?", kind),
+        ):
+            if value is not None:
+                where.append(clause)
+                args.append(value)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY d.ts, d.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        with closing(self._connect()) as conn:
+            while True:
+                rows = conn.execute(sql, args).fetchall()
+                records, missing = self._load(rows)
+                if not missing:
+                    return records
+                # Segment deleted behind the index (another instance's
+                # retention, manual cleanup): forget it and query again
+                logger.warning("[WARNING] Decision log segments missing, dropping their index rows: %s", sorted(missing))
+                self._drop_segments(conn, sorted(missing))
+
+    def _load(self, rows: List[tuple]) -> Tuple[List[dict], Set[str]]:
+        """Records for index rows, plus the segments whose files are gone"""
+        # Decompress each member once, however many of its records matched
+        members: Dict[tuple, List[bytes]] = {}
+        records, missing = [], set()
+        for segment, offset, line in rows:
+            if segment in missing:
+                continue
+            key = (segment, offset)
+            lines = members.get(key)
+            if lines is None:
+                try:
+                    lines = members[key] = _read_member(self.log_dir / segment, offset)
+                except FileNotFoundError:
+                    missing.add(segment)
+                    continue
+            records.append(json.loads(lines[line]))
+        return records, missing
@@ -0,0 +1,255 @@
+"""
+ARES Keyword Automaton
+Aho-Corasick multi-keyword matcher shared by pattern matching and validation
+
+Finds every keyword hit in a single pass over the text, however many
+keywords there are. Uses the C-accelerated `pyahocorasick` package when
+installed and a pure-Python automaton otherwise. Small vocabularies (the
+shipped pattern, rule and tech lists) use one str.find scan per keyword
+instead: below SCAN_MAX_KEYWORDS that beats a Python-level automaton
+(see benchmarks/bench_keyword_automaton.py).
+
+Matching runs on normalized text (lowercase, non-alphanumeric runs
+collapsed to one space), so "Data-Collection", "data_collection" and
+"data collection" are the same. Hits respect word boundaries:
+- "graphql"        matches the whole word only
+- "microservice*"  matches at a word start ("microservices" too)
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+TOKEN = re.compile(r'[a-z0-9]+')
+
+# Distinct keywords up to which the default backend is 'scan'
+SCAN_MAX_KEYWORDS = 64
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase tokens joined by single spaces"""
+    return ' '.join(TOKEN.findall(text.lower()))
+
+
+class KeywordAutomaton:
+    """Compiled, immutable multi-keyword matcher"""
+
+    def __init__(
+        self,
+        keywords: Iterable[Tuple[str, Any]],
+        word_boundaries: bool = True,
+        backend: Optional[str] = None
+    ):
+        """
+        Args:
+            keywords: (keyword, payload) pairs. A trailing '*' on a keyword
+                      allows it to match as a word prefix.
+            word_boundaries: False = plain substring hits
+            backend: 'scan', 'c' or 'python' (default: 'scan' for up to
+                     SCAN_MAX_KEYWORDS distinct keywords, else 'c' when
+                     installed)
+        """
+        if backend == 'c' and ahocorasick is None:
+            raise ImportError("pyahocorasick is not installed")
+        self.word_boundaries = word_boundaries
+
+        # Per keyword: (payload, prefix_ok)
+        self._keywords: List[Tuple[Any, bool]] = []
+        merged: Dict[str, List[int]] = {}
+        for keyword, payload in keywords:
+            prefix = keyword.endswith('*')
+            normalized = normalize_text(keyword.rstrip('*'))
+            if not normalized:
+                continue
+            merged.setdefault(normalized, []).append(len(self._keywords))
+            self._keywords.append((payload, prefix))
+
+        self._merged = {k: tuple(v) for k, v in merged.items()}
+
+        if backend is None:
+            if len(self._merged) <= SCAN_MAX_KEYWORDS:
+                backend = 'scan'
+            else:
+                backend = 'c' if ahocorasick is not None else 'python'
+        self.backend = backend
+
+        if backend == 'scan':
+            # With word boundaries, search ' keyword' in ' text' so only
+            # hits at a word start are ever found (offsets line up)
+            lead = ' ' if word_boundaries else ''
+            self._needles = tuple(
+                (lead + normalized, len(normalized), ids) for normalized, ids in self._merged.items()
+            )
+            # find_payloads only asks "is it there": ' keyword ' in ' text '
+            # for whole words, ' keyword' for prefixes
+            by_needle: Dict[str, List[Any]] = {}
+            for normalized, ids in self._merged.items():
+                for kid in ids:
+                    payload, prefix = self._keywords[kid]
+                    tail = '' if prefix or not word_boundaries else ' '
+                    by_needle.setdefault(lead + normalized + tail, []).append(payload)
+            self._payload_needles = tuple((n, tuple(p)) for n, p in by_needle.items())
+        elif backend == 'c':
+            self._automaton = ahocorasick.Automaton()
+            for normalized, ids in self._merged.items():
+                self._automaton.add_word(normalized, (len(normalized), ids))
+            if self._merged:
+                self._automaton.make_automaton()
+        else:
+            self._build_python()
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _build_python(self):
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[int, Tuple[int, ...]]]] = [[]]
+
+        for normalized, ids in self._merged.items():
+            state = 0
+            for ch in normalized:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((len(normalized), ids))
+
+        # Keywords ending exactly at each state (before fail-chain inheritance)
+        self._own_outputs = [tuple(o) for o in outputs]
+
+        # Breadth-first failure links; outputs inherit along the fail chain
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(o) for o in outputs]
+
+    def _scan_hits(self, text: str) -> List[Tuple[int, int, Tuple[int, ...]]]:
+        """One str.find sweep per keyword ('scan' backend)"""
+        if self.word_boundaries:
+            text = ' ' + text
+        find = text.find
+        hits = []
+        for needle, length, ids in self._needles:
+            # Most keywords miss; 'in' is about twice as fast as find()
+            if needle not in text:
+                continue
+            start = find(needle)
+            while start != -1:
+                hits.append((start, start + length, ids))
+                start = find(needle, start + 1)
+        # Same order as the automaton: by end, longest first
+        if len(hits) > 1:
+            hits.sort(key=lambda h: (h[1], h[0]))
+        return hits
+
+    def _raw_hits(self, text: str) -> Iterator[Tuple[int, int, Tuple[int, ...]]]:
+        """(start, end, keyword ids) for every occurrence, boundaries ignored"""
+        if self.backend == 'c':
+            if not self._merged:
+                return
+            for last, (length, ids) in self._automaton.iter(text):
+                yield last + 1 - length, last + 1, ids
+            return
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                end = i + 1
+                for length, ids in outputs[state]:
+                    yield end - length, end, ids
+
+    def _word_start_hits(self, text: str) -> List[Tuple[int, int, Tuple[int, ...]]]:
+        """
+        _raw_hits restricted to hits starting at a word start
+
+        With word boundaries on, only those hits survive, so walking the
+        trie from each word start (usually a char or two before it dies)
+        replaces stepping the automaton through every char of the text.
+        """
+        goto, own = self._goto, self._own_outputs
+        root = goto[0]
+        size = len(text)
+        hits = []
+        start = 0
+        for word in text.split(' '):
+            state = root.get(word[:1])
+            end = start + 1
+            # Usually dies within the word; phrases continue past the space
+            while state is not None:
+                for length, ids in own[state]:
+                    hits.append((end - length, end, ids))
+                if end >= size:
+                    break
+                state = goto[state].get(text[end])
+                end += 1
+            start += len(word) + 1
+        # Same order as the full automaton: by end, longest first
+        hits.sort(key=lambda h: (h[1], h[0]))
+        return hits
+
+    def iter_hits(self, normalized: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Every keyword hit in already-normalized text
+
+        Yields:
+            (start, end, payload) with offsets into the normalized text
+        """
+        keywords = self._keywords
+        check = self.word_boundaries
+        size = len(normalized)
+
+        if self.backend == 'scan':
+            raw = self._scan_hits(normalized)
+        elif check and self.backend == 'python':
+            raw = self._word_start_hits(normalized)
+        else:
+            raw = self._raw_hits(normalized)
+
+        for start, end, ids in raw:
+            if check and start and normalized[start - 1] != ' ':
+                continue
+            whole_word = end == size or normalized[end] == ' '
+            for kid in ids:
+                payload, prefix = keywords[kid]
+                if check and not (whole_word or prefix):
+                    continue
+                yield start, end, payload
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Any]]:
+        """Every hit in text as (start, end, payload), normalized offsets"""
+        return list(self.iter_hits(normalize_text(text)))
+
+    def find_payloads(self, text: str, normalized: bool = False) -> Set[Any]:
+        """Distinct payloads of keywords found in text"""
+        if not normalized:
+            text = normalize_text(text)
+        if self.backend == 'scan':
+            if self.word_boundaries:
+                text = f' {text} '
+            return {
+                payload
+                for needle, payloads in self._payload_needles if needle in text
+                for payload in payloads
+            }
+        return {payload for _, _, payload in self.iter_hits(text)}
@@ -0,0 +1,323 @@
+"""
+ARES Knowledge Base
+Heading-chunked index over the Ares markdown knowledge files
+
+tech-success-matrix.md, decision-causality.md, project-evolution.md and
+ares-core-directives.md are split into one chunk per #, ## or ### heading
+(deeper headings stay inside their parent chunk). Chunks are stored in
+SQLite keyed by a content hash, so a refresh only writes chunks whose
+text changed and skips files whose mtime/size did not change at all.
+
+Lookups run against an in-memory view rebuilt after each refresh:
+- get / extract / tech_success_rate: per-technology success rates via a
+  TechMatrix (a KnowledgeBase can be passed directly as AresValidation's
+  tech_matrix)
+- decision_rationale / search: heading-weighted term lookup over chunks
+"""
+
+import hashlib
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .keyword_automaton import normalize_text
+from .pattern_parser import _parse_rate
+from .tech_matrix import TechMatrix
+
+DEFAULT_DB_DIR = Path.home() / ".ares-mcp"
+DEFAULT_SOURCES = (
+    "tech-success-matrix.md",
+    "decision-causality.md",
+    "project-evolution.md",
+    "ares-core-directives.md",
+)
+
+DECISION_SOURCE = "decision-causality"
+
+HEADING = re.compile(r'^(#{1,3})\s+(.*?)\s*#*\s*$')
+SUCCESS_RATE = re.compile(r'\*\*Success Rate:\s*([^*|]+)\*\*', re.IGNORECASE)
+QUESTION = re.compile(r'^why\s+', re.IGNORECASE)
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or the to use what when why with".split()
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    """One heading section of a knowledge file"""
+
+    content_hash: str
+    source: str  # file stem, e.g. "tech-success-matrix"
+    ordinal: int  # position in the file
+    level: int  # heading level 1-3
+    title: str
+    path: Tuple[str, ...]  # parent headings, outermost first
+    body: str
+    success_rate: Optional[float]
+
+
+def chunk_markdown(lines: Iterable[str], source: str) -> List[Chunk]:
+    """
+    Split markdown into heading chunks (single pass)
+
+    Args:
+        lines: Lines of the file
+        source: Source name stored on each chunk
+    """
+    chunks: List[Chunk] = []
+    parents: List[str] = []
+    title: Optional[str] = None
+    level = 0
+    body: List[str] = []
+    in_code = False
+
+    def flush():
+        if title is None:
+            return
+        text = '\n'.join(body).strip()
+        path = tuple(parents[:level - 1])
+        rate_match = SUCCESS_RATE.search(text)
+        digest = hashlib.sha256('\x1f'.join((source, *path, title, text)).encode('utf-8')).hexdigest()
+        chunks.append(Chunk(
+            content_hash=digest,
+            source=source,
+            ordinal=len(chunks),
+            level=level,
+            title=title,
+            path=path,
+            body=text,
+            success_rate=_parse_rate(rate_match.group(1)) if rate_match else None
+        ))
+
+    for raw in lines:
+        line = raw.rstrip('\r\n')
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        heading = None if in_code else HEADING.match(line)
+        if heading is None:
+            body.append(line)
+            continue
+
+        flush()
+        level = len(heading.group(1))
+        title = heading.group(2)
+        del parents[level - 1:]
+        parents.extend([''] * (level - 1 - len(parents)))
+        parents.append(title)
+        body = []
+
+    flush()
+    return chunks
+
+
+class KnowledgeBase:
+    """Incrementally indexed chunks of the Ares knowledge files"""
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        sources: Iterable[str] = DEFAULT_SOURCES,
+        db_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            base_dir: Directory holding the markdown files (default: repo root)
+            sources: File names to index
+            db_path: SQLite chunk store (default: one per base_dir
+                     under ~/.ares-mcp)
+        """
+        if base_dir is None:
+            base_dir = Path(__file__).parent.parent
+        self.base_dir = Path(base_dir)
+        self.sources = tuple(sources)
+        if db_path is None:
+            key = hashlib.sha1(str(self.base_dir.resolve()).encode('utf-8')).hexdigest()[:16]
+            db_path = DEFAULT_DB_DIR / f"knowledge-{key}.db"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                " source TEXT NOT NULL,"
+                " content_hash TEXT NOT NULL,"
+                " ordinal INTEGER NOT NULL,"
+                " level INTEGER NOT NULL,"
+                " title TEXT NOT NULL,"
+                " path TEXT NOT NULL,"
+                " body TEXT NOT NULL,"
+                " success_rate REAL,"
+                " PRIMARY KEY (source, content_hash))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS source_files ("
+                " source TEXT PRIMARY KEY,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL)"
+            )
+
+        self.chunks: List[Chunk] = []
+        self.tech = TechMatrix(())
+        self._terms: Dict[str, Set[int]] = {}
+        self.refresh()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Re-index changed files, writing only chunks whose hash changed
+
+        Returns:
+            Counts of chunks 'added', 'removed' and 'unchanged'
+        """
+        stats = {'added': 0, 'removed': 0, 'unchanged': 0}
+        dirty = not self.chunks
+
+        with closing(self._connect()) as conn, conn:
+            known = dict(
+                (row[0], (row[1], row[2]))
+                for row in conn.execute("SELECT source, mtime_ns, size FROM source_files")
+            )
+            for name in self.sources:
+                path = self.base_dir / name
+                source = path.stem
+                if not path.exists():
+                    removed = conn.execute("DELETE FROM chunks WHERE source = ?", (source,)).rowcount
+                    conn.execute("DELETE FROM source_files WHERE source = ?", (source,))
+                    stats['removed'] += removed
+                    dirty = dirty or removed > 0
+                    continue
+
+                stat = path.stat()
+                if known.get(source) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                with open(path, 'r', encoding='utf-8') as f:
+                    chunks = chunk_markdown(f, source)
+                stored = {
+                    row[0]: row[1]
+                    for row in conn.execute(
+                        "SELECT content_hash, ordinal FROM chunks WHERE source = ?", (source,)
+                    )
+                }
+                current = {c.content_hash: c for c in chunks}
+
+                gone = [(source, h) for h in stored if h not in current]
+                conn.executemany("DELETE FROM chunks WHERE source = ? AND content_hash = ?", gone)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (source, c.content_hash, c.ordinal, c.level, c.title,
+                         '\x1f'.join(c.path), c.body, c.success_rate)
+                        for c in chunks if c.content_hash not in stored
+                    ]
+                )
+                # Unchanged chunks can still move when sections are added above them
+                conn.executemany(
+                    "UPDATE chunks SET ordinal = ? WHERE source = ? AND content_hash = ?",
+                    [
+                        (c.ordinal, source, c.content_hash)
+                        for c in chunks if stored.get(c.content_hash, c.ordinal) != c.ordinal
+                    ]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO source_files VALUES (?, ?, ?)",
+                    (source, stat.st_mtime_ns, stat.st_size)
+                )
+                dirty = True
+                stats['removed'] += len(gone)
+                stats['added'] += sum(1 for h in current if h not in stored)
+                stats['unchanged'] += sum(1 for h in current if h in stored)
+
+            if not dirty:
+                return stats
+            rows = conn.execute(
+                "SELECT content_hash, source, ordinal, level, title, path, body, success_rate"
+                " FROM chunks ORDER BY source, ordinal"
+            ).fetchall()
+
+        wanted = {Path(name).stem for name in self.sources}
+        self._build_views([
+            Chunk(h, source, ordinal, level, title, tuple(path.split('\x1f')) if path else (), body, rate)
+            for h, source, ordinal, level, title, path, body, rate in rows
+            if source in wanted
+        ])
+        return stats
+
+    def _build_views(self, chunks: List[Chunk]):
+        terms: Dict[str, Set[int]] = {}
+        for i, chunk in enumerate(chunks):
+            for term in set(normalize_text(chunk.title + ' ' + chunk.body).split()):
+                if term not in STOPWORDS:
+                    terms.setdefault(term, set()).add(i)
+
+        # Swap complete views in together
+        self.chunks, self.tech, self._terms = chunks, TechMatrix.from_chunks(chunks), terms
+
+    def get(self, tech: str) -> Optional[dict]:
+        """
+        Tech-matrix entry for a technology (tech_matrix interface)
+
+        Returns:
+            {'name', 'success_rate', 'source'} or None if unknown
+        """
+        return self.tech.get(tech)
+
+    def extract(self, text: str, normalized: bool = False) -> List[str]:
+        """Technologies mentioned in text (see TechMatrix.extract)"""
+        return self.tech.extract(text, normalized)
+
+    def tech_success_rate(self, tech: str) -> Optional[float]:
+        """Success rate (0.0-1.0) for a technology, or None if unknown"""
+        entry = self.tech.get(tech)
+        return entry['success_rate'] if entry else None
+
+    def as_tech_matrix(self) -> Dict[str, dict]:
+        """All technologies as a plain {name: entry} dict"""
+        return self.tech.as_dict()
+
+    def search(self, query: str, source: Optional[str] = None, limit: int = 5) -> List[Chunk]:
+        """
+        Chunks sharing the most terms with query (title hits count double)
+
+        Args:
+            query: Free text
+            source: Restrict to one file stem, e.g. "decision-causality"
+            limit: Maximum number of chunks
+        """
+        words = [w for w in normalize_text(query).split() if w not in STOPWORDS]
+        scores: Dict[int, int] = {}
+        for word in words:
+            for i in self._terms.get(word, ()):
+                scores[i] = scores.get(i, 0) + 1
+
+        chunks = self.chunks
+        ranked = []
+        for i, score in scores.items():
+            chunk = chunks[i]
+            if source is not None and chunk.source != source:
+                continue
+            title_words = set(normalize_text(chunk.title).split())
+            score += sum(1 for w in words if w in title_words)
+            ranked.append((-score, i))
+        ranked.sort()
+        return [chunks[i] for _, i in ranked[:limit]]
+
+    def decision_rationale(self, query: str, limit: int = 3) -> List[Tuple[str, str]]:
+        """
+        Recorded reasons behind past decisions related to query
+
+        Returns:
+            (decision, rationale) pairs, e.g.
+            ("SQLite for Development/POC?", "**Decision:** ...")
+        """
+        return [
+            (QUESTION.sub('', chunk.title), chunk.body)
+            for chunk in self.search(query, source=DECISION_SOURCE, limit=limit)
+            if chunk.level == 3
+        ]
@@ -0,0 +1,54 @@
+"""
+ARES Match Cache
+Bounded LRU of pattern match results
+
+Keys are (normalized text, tier filter, library version). The version
+changes on every index swap, so a reload can never serve stale matches;
+the matcher also clears the cache on swap so dead entries don't linger.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+MatchCacheInfo = namedtuple('MatchCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_MISSING = object()
+
+
+class MatchCache:
+    """Thread-safe LRU cache with hit/miss counters"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value or None (counts a hit or a miss)"""
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> MatchCacheInfo:
+        with self._lock:
+            return MatchCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
@@ -1,15 +1,61 @@
 """
 ARES Output Protocol - "Show Your Work"
 Transparent reasoning format from ares-core-directives.md v2.1
+
+AresResponse is slotted with tuple fields; its timestamp is kept as
+epoch seconds (created_at) and only formatted when output. timestamp
+used to be an init field and is now a read-only property, so
+AresResponse(..., timestamp=...) raises TypeError: pass created_at
+instead, e.g. created_at=datetime.fromisoformat(ts).timestamp().
+
+Serialization: to_dict is a shallow, hand-written field copy (no
+dataclasses.asdict deep copy), to_json is compact by default, and
+orjson is used when installed. dumps_many writes NDJSON for batches.
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Any
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Any, Tuple
 from datetime import datetime
+import asyncio
 import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Built once: json.dumps builds a new encoder per call for non-default options
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
 
+# Non-str keys as the stdlib writes them ({1: ...} -> {"1": ...}); dataclasses
+# and datetimes left to the fallback, which rejects them like the stdlib path
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None else 0
+)
 
-@dataclass
+
+def _dumps(data: dict) -> str:
+    """
+    Compact JSON (orjson when installed, else the stdlib encoder)
+
+    Anything orjson rejects (ints past 64 bits, dataclasses, datetimes)
+    goes to the stdlib encoder, so both paths decode to the same values.
+    Differences left: number spelling (orjson writes 1e-05 as 0.00001
+    and NaN as null), and orjson also serializes enums and UUIDs.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass
+    return _compact_encoder.encode(data)
+
+
+@dataclass(slots=True)
 class AresResponse:
     """
     Structured output format that shows your work
@@ -29,22 +75,61 @@ class AresResponse:
     confidence_level: str  # HIGH/MEDIUM/LOW
 
     # Transparency fields
-    patterns_used: List[str]
-    alternatives_considered: List[str]
-    evidence: List[str]
-    warnings: List[str]
+    patterns_used: Tuple[str, ...]
+    alternatives_considered: Tuple[str, ...]
+    evidence: Tuple[str, ...]
+    warnings: Tuple[str, ...]
 
     # Metadata
-    timestamp: str
+    created_at: float = field(default_factory=time.time, compare=False)  # Epoch seconds
     ares_version: str = "2.5.0"
 
+    def __post_init__(self):
+        # Accept lists from callers
+        if type(self.patterns_used) is not tuple:
+            self.patterns_used = tuple(self.patterns_used)
+        if type(self.alternatives_considered) is not tuple:
+            self.alternatives_considered = tuple(self.alternatives_considered)
+        if type(self.evidence) is not tuple:
+            self.evidence = tuple(self.evidence)
+        if type(self.warnings) is not tuple:
+            self.warnings = tuple(self.warnings)
+
+    @property
+    def timestamp(self) -> str:
+        """created_at as local ISO-8601 (formatted on demand)"""
+        return datetime.fromtimestamp(self.created_at).isoformat()
+
     def to_dict(self) -> dict:
-        """Convert to dictionary"""
-        return asdict(self)
+        """
+        Convert to dictionary
 
-    def to_json(self) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+        Tuples become lists; result is passed through as-is.
+        """
+        return {
+            'result': self.result,
+            'reasoning': self.reasoning,
+            'confidence_score': self.confidence_score,
+            'confidence_level': self.confidence_level,
+            'patterns_used': list(self.patterns_used),
+            'alternatives_considered': list(self.alternatives_considered),
+            'evidence': list(self.evidence),
+            'warnings': list(self.warnings),
+            'timestamp': self.timestamp,
+            'ares_version': self.ares_version,
+        }
+
+    def to_json(self, pretty: bool = False) -> str:
+        """
+        Convert to JSON string
+
+        Args:
+            pretty: Indented output for humans
+                    (default: compact one-line JSON)
+        """
+        if pretty:
+            return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return _dumps(self.to_dict())
 
     def to_markdown(self) -> str:
         """
@@ -105,6 +190,16 @@ class AresResponse:
         return "\n".join(lines)
 
 
+def dumps_many(responses: Iterable[AresResponse]) -> str:
+    """
+    Serialize responses as NDJSON (one compact JSON object per line)
+
+    Returns:
+        The lines, each newline-terminated ('' for no responses)
+    """
+    return ''.join(_dumps(r.to_dict()) + '\n' for r in responses)
+
+
 class AresOutput:
     """
     Output formatter implementing "Show Your Work" protocol
@@ -141,10 +236,9 @@ class AresOutput:
             confidence_score=confidence_score,
             confidence_level="HIGH",
             patterns_used=patterns_used,
-            alternatives_considered=[],
+            alternatives_considered=(),
             evidence=evidence,
-            warnings=[],
-            timestamp=datetime.now().isoformat()
+            warnings=()
         )
 
     @staticmethod
@@ -178,10 +272,9 @@ class AresOutput:
             confidence_score=confidence_score,
             confidence_level="MEDIUM",
             patterns_used=patterns_used,
-            alternatives_considered=[],
-            evidence=[],
-            warnings=caveats,
-            timestamp=datetime.now().isoformat()
+            alternatives_considered=(),
+            evidence=(),
+            warnings=caveats
         )
 
     @staticmethod
@@ -219,32 +312,36 @@ class AresOutput:
             reasoning=f"Need input: {result}\n\nOptions:\n{options_text}",
             confidence_score=confidence_score,
             confidence_level="LOW",
-            patterns_used=[],
-            alternatives_considered=[opt['name'] for opt in options],
-            evidence=[],
-            warnings=["Confidence too low to proceed autonomously"],
-            timestamp=datetime.now().isoformat()
+            patterns_used=(),
+            alternatives_considered=tuple(opt['name'] for opt in options),
+            evidence=(),
+            warnings=("Confidence too low to proceed autonomously",)
         )
 
     @staticmethod
-    def format_validation_result(validation_result) -> AresResponse:
+    def format_validation_result(validation_result, decision_log=None) -> AresResponse:
         """
         Convert a ValidationResult into an AresResponse
 
         This is the bridge between validation and output formatting.
+
+        Args:
+            validation_result: ValidationResult to format
+            decision_log: DecisionLog the response is appended to
+                          (see core/decision_log.py)
         """
         from .validation import ConfidenceLevel
 
         if validation_result.confidence_level == ConfidenceLevel.HIGH:
-            return AresOutput.format_high_confidence(
+            response = AresOutput.format_high_confidence(
                 result=validation_result.decision,
                 reasoning=validation_result.challenge_response,
                 patterns_used=validation_result.patterns_referenced,
-                evidence=[validation_result.validate_response],
+                evidence=(validation_result.validate_response,),
                 confidence_score=validation_result.confidence_score
             )
         elif validation_result.confidence_level == ConfidenceLevel.MEDIUM:
-            return AresOutput.format_medium_confidence(
+            response = AresOutput.format_medium_confidence(
                 result=validation_result.decision,
                 reasoning=validation_result.challenge_response,
                 patterns_used=validation_result.patterns_referenced,
@@ -252,7 +349,7 @@ class AresOutput:
                 confidence_score=validation_result.confidence_score
             )
         else:
-            return AresOutput.format_low_confidence(
+            response = AresOutput.format_low_confidence(
                 result="Need additional input to proceed",
                 options=[
                     {"name": alt, "description": "Alternative approach"}
@@ -260,3 +357,34 @@ class AresOutput:
                 ],
                 confidence_score=validation_result.confidence_score
             )
+
+        if decision_log is not None:
+            pattern_ids = validation_result.pattern_ids if response.patterns_used else ()
+            decision_log.log_decision(response, pattern_ids)
+        return response
+
+    @staticmethod
+    async def avalidate_and_format(
+        validator,
+        task: str,
+        proposed_approach: str,
+        context: Optional[dict] = None,
+        executor: Optional[Executor] = None
+    ) -> AresResponse:
+        """
+        Validate and format without blocking the event loop
+
+        Both steps run in one executor hop (see AresValidation.arun_validation).
+
+        Args:
+            validator: AresValidation instance
+            task, proposed_approach, context: As for run_validation
+            executor: Where to run (None = loop default)
+        """
+        def validate_and_format():
+            return AresOutput.format_validation_result(
+                validator.run_validation(task, proposed_approach, context)
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, validate_and_format)
@@ -0,0 +1,215 @@
+"""
+ARES Pattern Index
+Keyword index over the pattern library
+
+Built once when the library loads. Every `applies_to` keyword of every
+pattern is compiled into one shared KeywordAutomaton (payload = pattern
+rank), so a lookup only touches patterns whose keywords actually occur.
+The shipped library is small enough for one scan per keyword; large
+libraries get a single Aho-Corasick pass over the text (see
+keyword_automaton.py). Keywords match whole words/phrases
+("data_collection" matches "data collection"); a trailing '*' allows a
+word-prefix match.
+
+Patterns are stored pre-sorted by (tier, -success_rate), so results
+come out in recommendation order without re-sorting the library.
+Alongside the Pattern tuple the index keeps columnar arrays (tier,
+success_rate, usage_count, in rank order), an id -> pattern dict and
+per-tier buckets (in file order), so lookups and filters never scan
+the Pattern objects.
+
+The BM25 ranker (see pattern_ranking) is built on first use, so
+keyword-only callers never pay for the term matrix.
+
+Batches (match_many) normalize and look up each distinct text once and
+can fan out across a process pool; each worker receives the compiled
+index once, through the pool initializer, rather than per task.
+"""
+
+import hashlib
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .keyword_automaton import KeywordAutomaton, normalize_text
+from .patterns import Pattern
+
+# Batches smaller than this run in-process (pool startup costs more)
+PARALLEL_THRESHOLD = 50000
+CHUNK_SIZE = 5000
+
+_worker_index: Optional['PatternIndex'] = None
+
+
+def _init_worker(index: 'PatternIndex'):
+    global _worker_index
+    _worker_index = index
+
+
+def _match_chunk(texts: Sequence[str]) -> List[Tuple[int, ...]]:
+    # Ranks, not Patterns: ints are cheap to send back to the parent
+    return _worker_index.match_ranks_many(texts)
+
+
+class PatternIndex:
+    """Immutable keyword -> pattern index"""
+
+    def __init__(self, patterns: Iterable[Pattern]):
+        patterns = list(patterns)
+        # Rank = position in (tier, -success_rate) order; ties keep file order
+        self.patterns: Tuple[Pattern, ...] = tuple(
+            sorted(patterns, key=lambda p: (p.tier, -p.success_rate))
+        )
+        self.tiers = array('b', [p.tier for p in self.patterns])
+        self.success_rates = array('d', [p.success_rate for p in self.patterns])
+        self.usage_counts = array('q', [p.usage_count for p in self.patterns])
+        self.by_id: Dict[str, Pattern] = {}
+        for pattern in patterns:
+            self.by_id.setdefault(pattern.pattern_id, pattern)
+        self.tier_buckets: Dict[int, Tuple[Pattern, ...]] = {
+            tier: tuple(p for p in patterns if p.tier == tier) for tier in (1, 2, 3)
+        }
+        self.automaton = KeywordAutomaton(
+            (keyword, rank)
+            for rank, pattern in enumerate(self.patterns)
+            for keyword in pattern.applies_to
+        )
+        self._ranker = None
+        self._fingerprint: Optional[str] = None
+        self.version = 0  # Set by the matcher when published
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __getstate__(self):
+        # Workers only match keywords; the ranker is rebuilt if needed
+        state = self.__dict__.copy()
+        state['_ranker'] = None
+        return state
+
+    @property
+    def ranker(self):
+        """BM25 ranker over the same patterns (built lazily)"""
+        if self._ranker is None:
+            from .pattern_ranking import BM25Ranker
+            self._ranker = BM25Ranker(self.patterns)
+        return self._ranker
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the patterns (stable across processes and restarts)"""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for pattern in self.patterns:
+                digest.update(repr(pattern).encode('utf-8'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def select(
+        self,
+        tier: Optional[int] = None,
+        min_success_rate: float = 0.0,
+        min_uses: int = 0
+    ) -> List[Pattern]:
+        """
+        Patterns passing column filters, in rank order
+
+        Ranks are sorted by tier, then success rate descending, so each
+        tier is a contiguous run and a success-rate floor cuts it at a
+        binary-searched point; only min_uses needs a per-row check.
+        """
+        tiers = self.tiers
+        rates = self.success_rates
+        uses = self.usage_counts
+        patterns = self.patterns
+        selected = []
+        for t in ((tier,) if tier is not None else sorted(set(tiers))):
+            lo = bisect_left(tiers, t)
+            hi = bisect_right(tiers, t, lo)
+            cut = bisect_right(rates, -min_success_rate, lo, hi, key=lambda r: -r)
+            if min_uses > 0:
+                selected.extend(patterns[r] for r in range(lo, cut) if uses[r] >= min_uses)
+            else:
+                selected.extend(patterns[lo:cut])
+        return selected
+
+    def match_ranks(self, normalized: str) -> List[int]:
+        """Ranks of patterns with a keyword in normalized text, ascending"""
+        return sorted(self.automaton.find_payloads(normalized, normalized=True))
+
+    def match(self, text: str, tier_filter: Optional[int] = None) -> List[Pattern]:
+        """Patterns matching text, sorted by tier (1 first) then success rate"""
+        return self.match_normalized(normalize_text(text), tier_filter)
+
+    def match_normalized(self, normalized: str, tier_filter: Optional[int] = None) -> List[Pattern]:
+        """match() for text already passed through normalize_text"""
+        ranks = self.automaton.find_payloads(normalized, normalized=True)
+        if not ranks:
+            return []
+        patterns = self.patterns
+        matches = [patterns[r] for r in sorted(ranks)]
+        if tier_filter is not None:
+            matches = [p for p in matches if p.tier == tier_filter]
+        return matches
+
+    def match_ranks_many(self, texts: Iterable[str]) -> List[Tuple[int, ...]]:
+        """Ranks for each text, in input order; repeated texts are looked up once"""
+        find = self.automaton.find_payloads
+        seen: Dict[str, Tuple[int, ...]] = {}
+        results = []
+        for text in texts:
+            ranks = seen.get(text)
+            if ranks is None:
+                ranks = seen[text] = tuple(sorted(find(normalize_text(text), normalized=True)))
+            results.append(ranks)
+        return results
+
+    def match_many(
+        self,
+        texts: Sequence[str],
+        tier_filter: Optional[int] = None,
+        processes: Optional[int] = None
+    ) -> List[List[Pattern]]:
+        """
+        Match many texts at once
+
+        Args:
+            texts: Texts to match
+            tier_filter: Only return patterns of this tier (1, 2, or 3)
+            processes: Worker processes. None = all CPUs, but only for
+                       batches of PARALLEL_THRESHOLD texts or more;
+                       0 or 1 = always in-process.
+
+        Returns:
+            One match list per text, in input order
+        """
+        texts = list(texts)
+        if processes is None:
+            processes = (os.cpu_count() or 1) if len(texts) >= PARALLEL_THRESHOLD else 1
+
+        if processes > 1 and len(texts) > CHUNK_SIZE:
+            chunks = [texts[i:i + CHUNK_SIZE] for i in range(0, len(texts), CHUNK_SIZE)]
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_init_worker,
+                initargs=(self,)
+            ) as pool:
+                rank_lists = [ranks for chunk in pool.map(_match_chunk, chunks) for ranks in chunk]
+        else:
+            rank_lists = self.match_ranks_many(texts)
+
+        patterns = self.patterns
+        # Identical rank tuples share one result list per distinct outcome
+        built: Dict[Tuple[int, ...], List[Pattern]] = {}
+        results = []
+        for ranks in rank_lists:
+            matches = built.get(ranks)
+            if matches is None:
+                matches = [patterns[r] for r in ranks]
+                if tier_filter is not None:
+                    matches = [p for p in matches if p.tier == tier_filter]
+                built[ranks] = matches
+            results.append(list(matches))
+        return results
@@ -0,0 +1,400 @@
+"""
+ARES Pattern Parser
+Streams proven-patterns.md into Pattern records
+
+Every `###` section carrying a tier marker (star count or "TIER N")
+becomes a Pattern, as does every section listed in CURATED_PATTERNS.
+Sections under the anti-patterns heading and other untiered sections
+are skipped.
+
+The parsed library is cached as a compact pickled artifact keyed by the
+source file's mtime/size (fast check) and SHA-256 (fallback), so warm
+starts skip parsing entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .patterns import DEFAULT_CACHE_DIR, Pattern
+
+CACHE_FORMAT = 2
+
+# Defaults from the tier definitions in proven-patterns.md
+TIER_SUCCESS_RATE = {1: 0.80, 2: 0.50, 3: 0.30}
+TIER_USAGE_COUNT = {1: 5, 2: 2, 3: 1}
+
+TIER_MARKER = re.compile(r'\bTIER\s*([123])\b', re.IGNORECASE)
+NAME_SUFFIX = re.compile(r'\s*(⭐|\bTIER\s*\d).*$', re.IGNORECASE)
+NUMBERING = re.compile(r'^\d+\.\s*')
+FIELD = re.compile(r'\*\*([^*]+?):\*\*\s*([^|]*)')
+MARKUP = re.compile(r'\*\*|`')
+NUMBER = re.compile(r'\d+(?:\.\d+)?')
+NAME_STOPWORDS = frozenset({'with', 'and', 'the', 'for', 'of', 'a', 'an', 'to', 'in', 'on'})
+
+# Library metadata for sections of proven-patterns.md that don't state it
+# themselves, keyed by heading slug and listed in library order. Fields a
+# section states explicitly (**Pattern ID:**, **Success Rate:**, ...) win.
+CURATED_PATTERNS: Dict[str, dict] = {
+    'modular_scraper_architecture': dict(
+        pattern_id="modular_architecture_v1",
+        tier=1,
+        name="Modular Scraper Architecture",
+        description="Unified coordinator with specialized scrapers",
+        success_rate=0.95,
+        usage_count=12,
+        category="architecture",
+        applies_to=("scraping", "data_collection", "multi_source", "modular"),
+        evidence=(
+            "ASX Trading AI: 5+ scrapers",
+            "Business Brain: 3+ agents",
+            "Main coordinator: 687 lines"
+        ),
+        trade_offs="More files vs easier maintenance (acceptable)"
+    ),
+    'database_centric_architecture': dict(
+        pattern_id="database_centric_v1",
+        tier=1,
+        name="Database-Centric Architecture",
+        description="SQLite as single source of truth",
+        success_rate=1.0,
+        usage_count=15,
+        category="data",
+        applies_to=("database", "persistence", "sqlite", "single_source_truth"),
+        evidence=(
+            "100% success rate across projects",
+            "10MB database = 100K+ records",
+            "Zero configuration"
+        ),
+        trade_offs="Perfect for <1M rows, migrate to PostgreSQL at scale"
+    ),
+    'workflow_discovery_engine_business_brain': dict(
+        pattern_id="hybrid_ai_rules_v1",
+        tier=1,
+        name="Rule-Based + AI Hybrid",
+        description="Rules catch 80%, AI enhances edge cases",
+        success_rate=0.90,
+        usage_count=8,
+        category="ai",
+        applies_to=("ai", "machine_learning", "fallback", "hybrid", "rules"),
+        evidence=(
+            "Business Brain: Works without API key",
+            "ASX Trading: Sentiment analysis with fallback",
+            "90% success rate"
+        ),
+        trade_offs="Works offline, explainable, but AI accuracy limited"
+    ),
+    'comprehensive_cli_with_argparse': dict(
+        pattern_id="comprehensive_cli_v1",
+        tier=1,
+        name="Comprehensive CLI with Argparse",
+        description="Professional command-line interfaces",
+        success_rate=0.95,
+        usage_count=10,
+        category="interface",
+        applies_to=("cli", "command_line", "argparse", "interface"),
+        evidence=(
+            "Every Riord project has rich CLI",
+            "Dry-run mode, log levels, multiple modes"
+        ),
+        trade_offs="More code upfront, but saves time in usage"
+    ),
+    'graceful_degradation': dict(
+        pattern_id="graceful_degradation_v1",
+        tier=1,
+        name="Graceful Degradation",
+        description="Works without APIs, fallback modes everywhere",
+        success_rate=0.95,
+        usage_count=10,
+        category="reliability",
+        applies_to=("error_handling", "fallback", "reliability", "graceful"),
+        evidence=(
+            "All systems work without API keys",
+            "Hybrid AI + Rules pattern",
+            "Try/except with fallback"
+        ),
+        trade_offs="More code, but system never fully fails"
+    ),
+    'rule_based_ml_alternative': dict(
+        pattern_id="local_sentiment_v2",
+        tier=2,
+        name="Local Sentiment Analysis",
+        description="300+ financial keywords, 37% accuracy",
+        success_rate=0.37,
+        usage_count=3,
+        category="ai",
+        applies_to=("sentiment", "nlp", "financial", "local"),
+        evidence=(
+            "37% win rate in trading",
+            "300+ curated keywords",
+            "Negation and intensifier handling"
+        ),
+        trade_offs="Zero API costs, but low accuracy (needs improvement)"
+    ),
+}
+CURATED_ORDER = {slug: position for position, slug in enumerate(CURATED_PATTERNS)}
+
+RecordTuple = Tuple[str, int, str, str, float, int, str, Tuple[str, ...], Tuple[str, ...], str]
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def _clean(text: str) -> str:
+    return MARKUP.sub('', text).strip()
+
+
+def _parse_rate(value: str) -> Optional[float]:
+    match = NUMBER.search(value)
+    if not match:
+        return None
+    rate = float(match.group())
+    return rate / 100 if ('%' in value or rate > 1) else rate
+
+
+class _Section:
+    """Fields collected for one ### section"""
+
+    __slots__ = ('slug', 'name', 'tier', 'category', 'fields', 'evidence', 'trade_offs')
+
+    def __init__(self, name: str, tier: int, category: str):
+        self.slug = _slug(name)
+        self.name = name
+        self.tier = tier
+        self.category = category
+        self.fields: Dict[str, str] = {}
+        self.evidence: List[str] = []
+        self.trade_offs: List[str] = []
+
+    def to_record(self) -> RecordTuple:
+        fields = self.fields
+        tier = self.tier
+        curated = CURATED_PATTERNS.get(self.slug, {})
+
+        rate = _parse_rate(fields.get('success rate', ''))
+        if rate is None:
+            rate = curated.get('success_rate', TIER_SUCCESS_RATE[tier])
+        uses = NUMBER.search(fields.get('uses', ''))
+
+        if 'applies to' in fields:
+            applies_to = [k.strip().lower() for k in fields['applies to'].split(',') if k.strip()]
+        elif 'applies_to' in curated:
+            applies_to = curated['applies_to']
+        else:
+            applies_to = [w for w in self.slug.split('_') if len(w) > 2 and w not in NAME_STOPWORDS]
+
+        return (
+            fields.get('pattern id') or curated.get('pattern_id') or self.slug,
+            tier,
+            curated.get('name', self.name),
+            curated.get('description') or fields.get('pattern') or self.name,
+            rate,
+            int(float(uses.group())) if uses else curated.get('usage_count', TIER_USAGE_COUNT[tier]),
+            fields.get('category') or curated.get('category') or self.category,
+            # Keywords repeat across patterns; share one string per keyword
+            tuple(sys.intern(k) for k in applies_to),
+            curated.get('evidence') or tuple(self.evidence),
+            curated.get('trade_offs') or '; '.join(self.trade_offs),
+        )
+
+
+def parse_records(lines: Iterable[str]) -> List[RecordTuple]:
+    """
+    Parse markdown lines into pattern record tuples (single pass)
+
+    Args:
+        lines: Lines of proven-patterns.md (any iterable, e.g. an open file)
+    """
+    sections: List[_Section] = []
+    section: Optional[_Section] = None
+    category = ''
+    skip_category = False
+    list_target: Optional[List[str]] = None
+    in_code = False
+
+    for raw in lines:
+        line = raw.rstrip('\r\n')
+        stripped = line.strip()
+
+        # Ignore fenced code (comments there look like headings)
+        if stripped.startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+
+        if line.startswith('## ') or line.startswith('### '):
+            if section is not None:
+                sections.append(section)
+                section = None
+            list_target = None
+
+            if line.startswith('## '):
+                heading = line[3:].strip()
+                skip_category = 'anti-pattern' in heading.lower()
+                category = _slug(re.sub(r'(?i)\bpatterns?\b.*$', '', heading)) or _slug(heading)
+                continue
+
+            heading = line[4:].strip()
+            if skip_category:
+                continue
+
+            name = NUMBERING.sub('', NAME_SUFFIX.sub('', heading)).strip()
+            tier_match = TIER_MARKER.search(heading)
+            if tier_match:
+                tier = int(tier_match.group(1))
+            elif '⭐' in heading:
+                tier = max(1, 4 - min(heading.count('⭐'), 3))
+            elif _slug(name) in CURATED_PATTERNS:
+                tier = CURATED_PATTERNS[_slug(name)]['tier']
+            else:
+                continue
+
+            section = _Section(name, tier, category)
+            continue
+
+        if section is None:
+            continue
+
+        if stripped.startswith('**'):
+            fields = FIELD.findall(stripped)
+            if fields:
+                list_target = None
+                for key, value in fields:
+                    key = key.strip().lower()
+                    value = _clean(value)
+                    if key == 'evidence':
+                        list_target = section.evidence
+                    elif key == 'trade-offs':
+                        list_target = section.trade_offs
+                    if list_target is not None and value and key in ('evidence', 'trade-offs'):
+                        list_target.append(value)
+                    section.fields.setdefault(key, value)
+                continue
+
+        # Top-level bullets belong to the last Evidence/Trade-offs field
+        if list_target is not None and line.startswith('- '):
+            list_target.append(_clean(line[2:]))
+        elif stripped and not line.startswith(' '):
+            list_target = None
+
+    if section is not None:
+        sections.append(section)
+
+    # Curated patterns keep library order; the rest follow in document order
+    sections.sort(key=lambda s: CURATED_ORDER.get(s.slug, len(CURATED_ORDER)))
+    return [s.to_record() for s in sections]
+
+
+def parse_patterns(lines: Iterable[str]) -> List[Pattern]:
+    """Parse markdown lines into Pattern objects"""
+    return [_to_pattern(r) for r in parse_records(lines)]
+
+
+def _to_pattern(record: RecordTuple) -> Pattern:
+    pattern_id, tier, name, description, rate, uses, category, applies_to, evidence, trade_offs = record
+    return Pattern(
+        pattern_id=pattern_id,
+        tier=tier,
+        name=name,
+        description=description,
+        success_rate=rate,
+        usage_count=uses,
+        category=category,
+        applies_to=applies_to,
+        evidence=evidence,
+        trade_offs=trade_offs
+    )
+
+
+def _hashing_lines(path: Path, digest) -> Iterator[str]:
+    # Stream the file once: hash raw bytes and hand decoded lines to the parser
+    with open(path, 'rb') as f:
+        for raw in f:
+            digest.update(raw)
+            yield raw.decode('utf-8')
+
+
+def _cache_path(source: Path, cache_dir: Path) -> Path:
+    key = hashlib.sha1(str(source.resolve()).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"patterns-{key}.pkl"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_cache(cache_file: Path, payload: tuple):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # Cache is an optimization only
+
+
+def load_pattern_records(
+    patterns_file: Path,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> List[RecordTuple]:
+    """
+    Load pattern records, using the compiled cache when it is current
+
+    Args:
+        patterns_file: Path to proven-patterns.md
+        cache_dir: Where compiled artifacts live (None disables caching)
+    """
+    patterns_file = Path(patterns_file)
+    if cache_dir is None:
+        with open(patterns_file, 'r', encoding='utf-8') as f:
+            return parse_records(f)
+
+    stat = patterns_file.stat()
+    cache_file = _cache_path(patterns_file, Path(cache_dir))
+
+    cached = None
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached[0] != CACHE_FORMAT:
+            cached = None
+    except (OSError, pickle.UnpicklingError, EOFError, IndexError, TypeError):
+        cached = None
+
+    if cached is not None:
+        _, mtime_ns, size, content_hash, records = cached
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return list(records)
+
+        # Touched but maybe unchanged (checkout, copy) - compare content
+        if _file_sha256(patterns_file) == content_hash:
+            _write_cache(cache_file, (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size, content_hash, records))
+            return list(records)
+
+    digest = hashlib.sha256()
+    records = parse_records(_hashing_lines(patterns_file, digest))
+    _write_cache(
+        cache_file,
+        (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size, digest.hexdigest(), tuple(records))
+    )
+    return records
+
+
+def load_patterns(
+    patterns_file: Path,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> List[Pattern]:
+    """Load Pattern objects from proven-patterns.md (cached)"""
+    return [_to_pattern(r) for r in load_pattern_records(patterns_file, cache_dir)]
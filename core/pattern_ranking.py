@@ -0,0 +1,141 @@
+"""
+ARES Pattern Ranking
+BM25 ranked retrieval over pattern text fields
+
+Keyword matching (PatternIndex) only says *whether* a pattern applies.
+Ranking scores every pattern against free text using all of its text -
+name, description, keywords, category, evidence and trade-offs - and
+blends the BM25 text score with tier and success rate.
+
+The term matrix is sparse and precomputed: for each term, parallel
+arrays of pattern ranks and final BM25 weights (idf and length
+normalization folded in). A query just sums the postings of its terms,
+so latency depends on how common the query terms are, not on library
+size. NumPy is used for accumulation when installed.
+"""
+
+import heapq
+from array import array
+from math import log
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .keyword_automaton import normalize_text
+from .patterns import Pattern
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from in into is it of on or the this to "
+    "use using with we our i my need want build create make".split()
+)
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Blend weights for the final score
+TEXT_WEIGHT = 0.6
+TIER_WEIGHT = 0.25
+SUCCESS_WEIGHT = 0.15
+TIER_SCORE = {1: 1.0, 2: 0.5, 3: 0.0}
+
+
+def pattern_terms(pattern: Pattern) -> List[str]:
+    """All searchable terms of a pattern"""
+    text = ' '.join([
+        pattern.name,
+        pattern.description,
+        ' '.join(pattern.applies_to),
+        pattern.category,
+        ' '.join(pattern.evidence),
+        pattern.trade_offs,
+    ])
+    return [t for t in normalize_text(text).split() if t not in STOPWORDS]
+
+
+class BM25Ranker:
+    """Precomputed BM25 term matrix over a ranked pattern tuple"""
+
+    def __init__(self, patterns: Sequence[Pattern]):
+        self.patterns = patterns
+        doc_terms = [pattern_terms(p) for p in patterns]
+        count = len(doc_terms)
+        avg_len = (sum(len(t) for t in doc_terms) / count) if count else 0.0
+
+        # term -> {rank: term frequency}
+        frequencies: Dict[str, Dict[int, int]] = {}
+        for rank, terms in enumerate(doc_terms):
+            for term in terms:
+                postings = frequencies.setdefault(term, {})
+                postings[rank] = postings.get(rank, 0) + 1
+
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        for term, postings in frequencies.items():
+            df = len(postings)
+            idf = log(1 + (count - df + 0.5) / (df + 0.5))
+            ranks = array('I')
+            weights = array('f')
+            for rank, tf in postings.items():
+                norm = 1 - B + B * (len(doc_terms[rank]) / avg_len if avg_len else 1)
+                ranks.append(rank)
+                weights.append(idf * tf * (K1 + 1) / (tf + K1 * norm))
+            self._postings[term] = (ranks, weights)
+
+        self._prior = array('f', [
+            TIER_WEIGHT * TIER_SCORE.get(p.tier, 0.0) + SUCCESS_WEIGHT * p.success_rate
+            for p in patterns
+        ])
+
+    def text_scores(self, query: str) -> Dict[int, float]:
+        """Raw BM25 score per pattern rank (only ranks with a hit)"""
+        terms = [t for t in normalize_text(query).split() if t not in STOPWORDS]
+        postings = [self._postings[t] for t in terms if t in self._postings]
+        if not postings:
+            return {}
+
+        if np is not None and len(self.patterns) > 1000:
+            scores = np.zeros(len(self.patterns), dtype=np.float32)
+            for ranks, weights in postings:
+                np.add.at(
+                    scores,
+                    np.frombuffer(ranks, dtype=np.uint32),
+                    np.frombuffer(weights, dtype=np.float32)
+                )
+            hit = np.nonzero(scores)[0]
+            return dict(zip(hit.tolist(), scores[hit].tolist()))
+
+        scores: Dict[int, float] = {}
+        for ranks, weights in postings:
+            for rank, weight in zip(ranks, weights):
+                scores[rank] = scores.get(rank, 0.0) + weight
+        return scores
+
+    def top_k(
+        self,
+        query: str,
+        k: int = 5,
+        tier_filter: Optional[int] = None
+    ) -> List[Tuple[Pattern, float]]:
+        """
+        Best k patterns for a query
+
+        Final score = 0.6 * BM25 (scaled to the best hit) + 0.25 * tier
+        score + 0.15 * success rate. Patterns with no term overlap are
+        never returned.
+        """
+        scores = self.text_scores(query)
+        if not scores:
+            return []
+
+        patterns = self.patterns
+        prior = self._prior
+        best = max(scores.values())
+        candidates = (
+            (TEXT_WEIGHT * score / best + prior[rank], -rank)
+            for rank, score in scores.items()
+            if tier_filter is None or patterns[rank].tier == tier_filter
+        )
+        return [(patterns[-neg_rank], round(score, 4)) for score, neg_rank in heapq.nlargest(k, candidates)]
@@ -0,0 +1,55 @@
+"""
+ARES Pattern Watcher
+Reloads proven-patterns.md in the background when it changes
+
+Polls the file's mtime/size from a daemon thread. On a change the
+matcher parses the file and builds a fresh PatternIndex on this thread,
+then swaps it in with a single attribute assignment. Readers never
+lock: each match grabs the current index once and works on that
+immutable snapshot, so in-flight calls finish on the old library while
+new calls see the new one.
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .patterns import AresPatternMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class PatternWatcher:
+    """Daemon thread that hot-reloads a matcher's pattern library"""
+
+    def __init__(self, matcher: 'AresPatternMatcher', interval: float = 2.0):
+        """
+        Args:
+            matcher: Matcher to reload
+            interval: Seconds between file checks
+        """
+        self.matcher = matcher
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ares-pattern-watcher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.matcher.reload_if_changed()
+            except Exception as e:
+                # Keep serving the last good library
+                logger.error("[ERROR] Pattern library reload failed: %s", e)
@@ -4,15 +4,25 @@ Loads and matches tasks against proven-patterns.md
 """
 
 import json
+import logging
 import re
+import sys
+import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from pathlib import Path
 
+from .keyword_automaton import normalize_text
 
-@dataclass
+# Compiled pattern cache (see pattern_parser)
+DEFAULT_CACHE_DIR = Path.home() / ".ares-mcp" / "cache"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
 class Pattern:
-    """A proven pattern from proven-patterns.md"""
+    """A proven pattern from proven-patterns.md (immutable, slotted)"""
 
     pattern_id: str
     tier: int  # 1, 2, or 3
@@ -21,10 +31,17 @@ class Pattern:
     success_rate: float
     usage_count: int
     category: str  # architecture, data, api, etc.
-    applies_to: List[str]  # keywords/contexts where this applies
-    evidence: List[str]  # file references, metrics
+    applies_to: Tuple[str, ...]  # keywords/contexts where this applies
+    evidence: Tuple[str, ...]  # file references, metrics
     trade_offs: str  # benefits vs costs
 
+    def __post_init__(self):
+        # Accept lists from callers; keywords repeat across patterns, so intern them
+        if not isinstance(self.applies_to, tuple):
+            object.__setattr__(self, 'applies_to', tuple(sys.intern(k) for k in self.applies_to))
+        if not isinstance(self.evidence, tuple):
+            object.__setattr__(self, 'evidence', tuple(self.evidence))
+
     @property
     def is_tier_1(self) -> bool:
         """Tier 1 = Validated & Proven (5+ uses, metrics prove success)"""
@@ -51,137 +68,152 @@ class AresPatternMatcher:
     - Tier 3 patterns: Experimental (<50% confidence)
     """
 
-    def __init__(self, patterns_file: Optional[str] = None):
+    def __init__(
+        self,
+        patterns_file: Optional[str] = None,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        usage_tracker=None,
+        match_cache_size: int = 1024
+    ):
         """
         Initialize pattern matcher
 
         Args:
             patterns_file: Path to proven-patterns.md
                           If None, uses default location
+            cache_dir: Directory for the compiled pattern cache
+                       (None disables caching)
+            usage_tracker: UsageTracker that records recommended/used
+                           patterns (see core/usage.py)
+            match_cache_size: Entries in the find_matching_patterns LRU
+                              cache (0 disables it)
         """
+        from .match_cache import MatchCache
+
         if patterns_file is None:
             # Default to ares-master-control-program/proven-patterns.md
             base_dir = Path(__file__).parent.parent
             patterns_file = base_dir / "proven-patterns.md"
 
         self.patterns_file = Path(patterns_file)
+        self.cache_dir = cache_dir
+        self.usage_tracker = usage_tracker
+        self._match_cache = MatchCache(match_cache_size) if match_cache_size > 0 else None
         self.patterns: List[Pattern] = []
+        self.library_version = 0  # Bumped on every index swap
+        self._signature = None
+        self._reload_lock = threading.Lock()
+        self._watcher = None
 
         if self.patterns_file.exists():
             self._load_patterns()
+        else:
+            self.rebuild_index()
+
+    def __getstate__(self):
+        # Worker processes get the patterns and index only: no lock,
+        # watcher thread or usage tracker, and an empty match cache
+        state = self.__dict__.copy()
+        state['_reload_lock'] = None
+        state['_watcher'] = None
+        state['usage_tracker'] = None
+        cache = state['_match_cache']
+        state['_match_cache'] = cache.maxsize if cache is not None else 0
+        return state
+
+    def __setstate__(self, state):
+        from .match_cache import MatchCache
+
+        cache_size = state['_match_cache']
+        self.__dict__.update(state)
+        self._reload_lock = threading.Lock()
+        self._match_cache = MatchCache(cache_size) if cache_size > 0 else None
+
+    def _file_signature(self):
+        stat = self.patterns_file.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def _load_patterns(self):
         """
         Parse proven-patterns.md into Pattern objects
 
-        This is a simple parser. In production, you might use
-        a more robust markdown parser or convert to JSON first.
+        Uses the compiled cache (see pattern_parser) when the file
+        hasn't changed since it was last parsed.
         """
-        # For now, we'll create hardcoded patterns based on proven-patterns.md
-        # In Phase 1, we'll build a proper parser
-
-        self.patterns = [
-            Pattern(
-                pattern_id="modular_architecture_v1",
-                tier=1,
-                name="Modular Scraper Architecture",
-                description="Unified coordinator with specialized scrapers",
-                success_rate=0.95,
-                usage_count=12,
-                category="architecture",
-                applies_to=["scraping", "data_collection", "multi_source", "modular"],
-                evidence=[
-                    "ASX Trading AI: 5+ scrapers",
-                    "Business Brain: 3+ agents",
-                    "Main coordinator: 687 lines"
-                ],
-                trade_offs="More files vs easier maintenance (acceptable)"
-            ),
-            Pattern(
-                pattern_id="database_centric_v1",
-                tier=1,
-                name="Database-Centric Architecture",
-                description="SQLite as single source of truth",
-                success_rate=1.0,
-                usage_count=15,
-                category="data",
-                applies_to=["database", "persistence", "sqlite", "single_source_truth"],
-                evidence=[
-                    "100% success rate across projects",
-                    "10MB database = 100K+ records",
-                    "Zero configuration"
-                ],
-                trade_offs="Perfect for <1M rows, migrate to PostgreSQL at scale"
-            ),
-            Pattern(
-                pattern_id="hybrid_ai_rules_v1",
-                tier=1,
-                name="Rule-Based + AI Hybrid",
-                description="Rules catch 80%, AI enhances edge cases",
-                success_rate=0.90,
-                usage_count=8,
-                category="ai",
-                applies_to=["ai", "machine_learning", "fallback", "hybrid", "rules"],
-                evidence=[
-                    "Business Brain: Works without API key",
-                    "ASX Trading: Sentiment analysis with fallback",
-                    "90% success rate"
-                ],
-                trade_offs="Works offline, explainable, but AI accuracy limited"
-            ),
-            Pattern(
-                pattern_id="comprehensive_cli_v1",
-                tier=1,
-                name="Comprehensive CLI with Argparse",
-                description="Professional command-line interfaces",
-                success_rate=0.95,
-                usage_count=10,
-                category="interface",
-                applies_to=["cli", "command_line", "argparse", "interface"],
-                evidence=[
-                    "Every Riord project has rich CLI",
-                    "Dry-run mode, log levels, multiple modes"
-                ],
-                trade_offs="More code upfront, but saves time in usage"
-            ),
-            Pattern(
-                pattern_id="graceful_degradation_v1",
-                tier=1,
-                name="Graceful Degradation",
-                description="Works without APIs, fallback modes everywhere",
-                success_rate=0.95,
-                usage_count=10,
-                category="reliability",
-                applies_to=["error_handling", "fallback", "reliability", "graceful"],
-                evidence=[
-                    "All systems work without API keys",
-                    "Hybrid AI + Rules pattern",
-                    "Try/except with fallback"
-                ],
-                trade_offs="More code, but system never fully fails"
-            ),
-            Pattern(
-                pattern_id="local_sentiment_v2",
-                tier=2,
-                name="Local Sentiment Analysis",
-                description="300+ financial keywords, 37% accuracy",
-                success_rate=0.37,
-                usage_count=3,
-                category="ai",
-                applies_to=["sentiment", "nlp", "financial", "local"],
-                evidence=[
-                    "37% win rate in trading",
-                    "300+ curated keywords",
-                    "Negation and intensifier handling"
-                ],
-                trade_offs="Zero API costs, but low accuracy (needs improvement)"
-            ),
-        ]
+        from .pattern_parser import load_patterns
+
+        # Stat first: an edit made while parsing triggers another reload
+        signature = self._file_signature()
+        self._publish(load_patterns(self.patterns_file, cache_dir=self.cache_dir))
+        self._signature = signature
+
+    def _publish(self, patterns: List[Pattern]):
+        from .pattern_index import PatternIndex
+
+        # Build fully, then swap: readers see the old or the new index, never a mix
+        index = PatternIndex(patterns)
+        # The snapshot carries its version, so cache keys never pair an
+        # old version with a new index (or vice versa)
+        index.version = self.library_version + 1
+        self.patterns = patterns
+        self._index = index
+        self.library_version = index.version
+        if self._match_cache is not None:
+            self._match_cache.clear()
+
+    def rebuild_index(self):
+        """Rebuild the keyword index (call after editing self.patterns)"""
+        self._publish(self.patterns)
+
+    def reload(self):
+        """Reload proven-patterns.md now and swap in the new index"""
+        with self._reload_lock:
+            self._load_patterns()
+        logger.info("[OK] Loaded %d patterns from %s", len(self.patterns), self.patterns_file)
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload if proven-patterns.md changed since it was last loaded
+
+        Returns:
+            True if a new library was swapped in
+        """
+        try:
+            changed = self._file_signature() != self._signature
+        except FileNotFoundError:
+            return False  # Mid-save or deleted: keep the current library
+        if changed:
+            self.reload()
+        return changed
+
+    def watch(self, interval: float = 2.0):
+        """
+        Hot-reload proven-patterns.md in a background thread
+
+        Args:
+            interval: Seconds between file checks
+
+        Returns:
+            The running PatternWatcher (see stop_watching)
+        """
+        from .pattern_watcher import PatternWatcher
+
+        if self._watcher is None or not self._watcher.running:
+            self._watcher = PatternWatcher(self, interval)
+            self._watcher.start()
+        return self._watcher
+
+    def stop_watching(self):
+        """Stop the hot-reload thread, if any"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
 
     def find_matching_patterns(
         self,
         task_or_approach: str,
-        tier_filter: Optional[int] = None
+        tier_filter: Optional[int] = None,
+        normalized: bool = False
     ) -> List[Pattern]:
         """
         Find patterns that match a given task or approach
@@ -189,47 +221,129 @@ class AresPatternMatcher:
         Args:
             task_or_approach: Description of task or proposed approach
             tier_filter: Only return patterns of this tier (1, 2, or 3)
+            normalized: task_or_approach already went through normalize_text
+
+        Keywords match whole words ("data_collection" matches "data
+        collection"), looked up in the inverted index built at load.
+        Results are memoized per normalized text (see cache_info).
 
         Returns:
             List of matching patterns, sorted by tier (1 first) then success rate
         """
-        matches = []
-        text_lower = task_or_approach.lower()
+        index = self._index
+        cache = self._match_cache
+        text = task_or_approach if normalized else normalize_text(task_or_approach)
+        if cache is None:
+            return index.match_normalized(text, tier_filter)
+
+        key = (text, tier_filter, index.version)
+        matches = cache.get(key)
+        if matches is None:
+            matches = tuple(index.match_normalized(text, tier_filter))
+            cache.put(key, matches)
+        return list(matches)
+
+    @property
+    def library_fingerprint(self) -> str:
+        """
+        Content hash of the loaded library
+
+        Unlike library_version (an in-process counter), equal libraries
+        give equal fingerprints in every process, so it can key on-disk
+        caches.
+        """
+        return self._index.fingerprint
 
-        for pattern in self.patterns:
-            # Check if any of the pattern's keywords appear in the text
-            if any(keyword in text_lower for keyword in pattern.applies_to):
-                if tier_filter is None or pattern.tier == tier_filter:
-                    matches.append(pattern)
+    def cache_info(self):
+        """
+        Match cache statistics
 
-        # Sort by tier (1 first) then success rate
-        matches.sort(key=lambda p: (p.tier, -p.success_rate))
+        Returns:
+            MatchCacheInfo(hits, misses, maxsize, currsize), or None
+            when caching is disabled
+        """
+        return self._match_cache.info() if self._match_cache is not None else None
 
-        return matches
+    def find_matching_patterns_many(
+        self,
+        texts: Iterable[str],
+        tier_filter: Optional[int] = None,
+        processes: Optional[int] = None
+    ) -> List[List[Pattern]]:
+        """
+        Batch version of find_matching_patterns
+
+        Args:
+            texts: Tasks or approaches to match
+            tier_filter: Only return patterns of this tier (1, 2, or 3)
+            processes: Worker processes for large batches
+                       (None = automatic, 1 = in-process)
+
+        Returns:
+            One match list per text, in input order
+        """
+        return self._index.match_many(list(texts), tier_filter, processes)
+
+    def rank_patterns(
+        self,
+        query: str,
+        top_k: int = 5,
+        tier_filter: Optional[int] = None
+    ) -> List[Tuple[Pattern, float]]:
+        """
+        Rank patterns against free text (BM25 + tier + success rate)
+
+        Unlike find_matching_patterns, this scores every text field of a
+        pattern (name, description, keywords, evidence, trade-offs), so
+        it finds relevant patterns even when no keyword matches exactly.
+
+        Args:
+            query: Task, approach, or any free-text description
+            top_k: Maximum number of results
+            tier_filter: Only return patterns of this tier (1, 2, or 3)
+
+        Returns:
+            (pattern, score) pairs, best first
+        """
+        return self._index.ranker.top_k(query, top_k, tier_filter)
 
     def get_pattern_by_id(self, pattern_id: str) -> Optional[Pattern]:
         """Get a specific pattern by ID"""
-        for pattern in self.patterns:
-            if pattern.pattern_id == pattern_id:
-                return pattern
-        return None
+        return self._index.by_id.get(pattern_id)
 
     def get_tier_1_patterns(self) -> List[Pattern]:
         """Get all Tier 1 (validated & proven) patterns"""
-        return [p for p in self.patterns if p.tier == 1]
+        return list(self._index.tier_buckets[1])
 
     def get_tier_2_patterns(self) -> List[Pattern]:
         """Get all Tier 2 (working, needs validation) patterns"""
-        return [p for p in self.patterns if p.tier == 2]
+        return list(self._index.tier_buckets[2])
 
     def get_tier_3_patterns(self) -> List[Pattern]:
         """Get all Tier 3 (experimental) patterns"""
-        return [p for p in self.patterns if p.tier == 3]
+        return list(self._index.tier_buckets[3])
+
+    def filter_patterns(
+        self,
+        tier: Optional[int] = None,
+        min_success_rate: float = 0.0,
+        min_uses: int = 0
+    ) -> List[Pattern]:
+        """
+        Patterns meeting tier/success/usage criteria
+
+        Runs over the index's columnar arrays rather than the objects.
+
+        Returns:
+            Matching patterns sorted by tier (1 first) then success rate
+        """
+        return self._index.select(tier, min_success_rate, min_uses)
 
     def recommend_pattern(
         self,
         task: str,
-        prefer_tier_1: bool = True
+        prefer_tier_1: bool = True,
+        ranked: bool = False
     ) -> Optional[Pattern]:
         """
         Recommend the best pattern for a given task
@@ -237,12 +351,56 @@ class AresPatternMatcher:
         Args:
             task: Description of what needs to be done
             prefer_tier_1: Prefer Tier 1 patterns even if Tier 2 matches better
+            ranked: Use ranked retrieval (rank_patterns) instead of
+                    keyword matching
 
         Returns:
             Best matching pattern or None if no matches
         """
-        matches = self.find_matching_patterns(task)
+        if ranked:
+            matches = [p for p, _ in self.rank_patterns(task, top_k=5)]
+        else:
+            matches = self.find_matching_patterns(task)
+
+        best = self._best_match(matches, prefer_tier_1)
+        if best is not None:
+            self.record_usage([best])
+        return best
+
+    def recommend_many(
+        self,
+        tasks: Iterable[str],
+        prefer_tier_1: bool = True,
+        processes: Optional[int] = None
+    ) -> List[Optional[Pattern]]:
+        """
+        Batch version of recommend_pattern (keyword matching)
 
+        Returns:
+            Best pattern (or None) per task, in input order
+        """
+        recommendations = [
+            self._best_match(matches, prefer_tier_1)
+            for matches in self.find_matching_patterns_many(tasks, processes=processes)
+        ]
+        self.record_usage([p for p in recommendations if p is not None])
+        return recommendations
+
+    def record_usage(self, patterns: List[Pattern]):
+        """Count a use of each pattern (no-op without a usage tracker)"""
+        if self.usage_tracker is not None and patterns:
+            self.usage_tracker.record(patterns)
+
+    def usage_count(self, pattern_id: str) -> int:
+        """Documented uses from proven-patterns.md plus uses recorded since"""
+        pattern = self._index.by_id.get(pattern_id)
+        base = pattern.usage_count if pattern else 0
+        if self.usage_tracker is None:
+            return base
+        return base + self.usage_tracker.uses(pattern_id)
+
+    @staticmethod
+    def _best_match(matches: List[Pattern], prefer_tier_1: bool) -> Optional[Pattern]:
         if not matches:
             return None
 
@@ -266,8 +424,8 @@ class AresPatternMatcher:
                 "success_rate": p.success_rate,
                 "usage_count": p.usage_count,
                 "category": p.category,
-                "applies_to": p.applies_to,
-                "evidence": p.evidence,
+                "applies_to": list(p.applies_to),
+                "evidence": list(p.evidence),
                 "trade_offs": p.trade_offs
             }
             for p in self.patterns
@@ -0,0 +1,117 @@
+"""
+ARES Validation Rules
+Data-driven warning / alternative / analogy rules for AresValidation
+
+Rules live in config/validation_rules.json. Every keyword of every rule
+is compiled into one KeywordAutomaton whose payload is the rule's
+position, so evaluating a rule set is one lookup over the approach text
+(a scan per keyword for small rule files, a single automaton pass for
+large ones); only rules whose keywords actually occur have their context
+predicates checked.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .keyword_automaton import KeywordAutomaton
+
+DEFAULT_RULES_FILE = Path(__file__).parent.parent / "config" / "validation_rules.json"
+RULE_KINDS = ('warning', 'alternative', 'analogy')
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """One validation rule"""
+
+    rule_id: str
+    kind: str  # warning, alternative, or analogy
+    keywords: Tuple[str, ...]  # any one fires the rule; '*' = word prefix
+    message: str
+    when: Tuple[Tuple[str, Tuple[Any, ...]], ...] = ()  # context key -> allowed values
+
+    def applies(self, context: dict) -> bool:
+        """True if every context predicate holds"""
+        return all(context.get(key) in allowed for key, allowed in self.when)
+
+
+def _parse_rule(raw: dict) -> Rule:
+    rule_id = raw.get('id')
+    if not rule_id:
+        raise ValueError(f"Rule without an id: {raw!r}")
+    if raw.get('kind') not in RULE_KINDS:
+        raise ValueError(f"Rule {rule_id}: kind must be one of {', '.join(RULE_KINDS)}")
+    if not raw.get('keywords') or not raw.get('message'):
+        raise ValueError(f"Rule {rule_id}: keywords and message are required")
+
+    when = tuple(
+        (key, tuple(value) if isinstance(value, list) else (value,))
+        for key, value in (raw.get('when') or {}).items()
+    )
+    return Rule(rule_id, raw['kind'], tuple(raw['keywords']), raw['message'], when)
+
+
+class RuleSet:
+    """Compiled, immutable set of validation rules"""
+
+    def __init__(self, rules: Iterable[Rule], version: str = ''):
+        """
+        Args:
+            rules: Rules in priority order
+            version: Identifier of the rule source (changes with its content)
+        """
+        self.rules: Tuple[Rule, ...] = tuple(rules)
+        self.version = version
+        self.automaton = KeywordAutomaton(
+            (keyword, position)
+            for position, rule in enumerate(self.rules)
+            for keyword in rule.keywords
+        )
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_RULES_FILE) -> 'RuleSet':
+        """Load and compile a rules JSON file"""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        return cls(
+            (_parse_rule(r) for r in data.get('rules', [])),
+            version=hashlib.sha256(raw).hexdigest()[:16]
+        )
+
+    def evaluate(self, normalized: str, context: Optional[dict] = None) -> Dict[str, List[str]]:
+        """
+        Fire rules against normalized text (single automaton pass)
+
+        Args:
+            normalized: Text already passed through normalize_text
+            context: Values for the rules' context predicates
+
+        Returns:
+            {kind: [messages]} for every kind, in rule order
+        """
+        # RULE_KINDS spelled out: a literal is cheaper than a comprehension
+        fired: Dict[str, List[str]] = {'warning': [], 'alternative': [], 'analogy': []}
+        positions = self.automaton.find_payloads(normalized, normalized=True)
+        if not positions:
+            return fired
+
+        context = context or {}
+        rules = self.rules
+        for position in sorted(positions):
+            rule = rules[position]
+            if not rule.when or rule.applies(context):
+                fired[rule.kind].append(rule.message)
+        return fired
+
+
+@lru_cache(maxsize=None)
+def default_rules() -> RuleSet:
+    """The shipped config/validation_rules.json (loaded once)"""
+    return RuleSet.from_file(DEFAULT_RULES_FILE)
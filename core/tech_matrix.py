@@ -0,0 +1,208 @@
+"""
+ARES Tech Matrix
+Technology success rates from tech-success-matrix.md
+
+Every ### section carrying a "**Success Rate: N%**" line becomes a
+technology, looked up by its normalized heading and a short alias for
+the lead technology ("TypeScript + Node.js" -> "typescript").
+
+Small matrices (the shipped file has 11 technologies) are searched with
+one substring check per name; from SCAN_MAX_KEYWORDS names up, all
+names and aliases go through one word-boundary KeywordAutomaton pass.
+Files are compiled once per content hash.
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .keyword_automaton import SCAN_MAX_KEYWORDS, KeywordAutomaton, normalize_text
+
+DEFAULT_MATRIX_FILE = Path(__file__).parent.parent / "tech-success-matrix.md"
+TECH_SOURCE = "tech-success-matrix"
+
+# Words that describe a technology's section rather than name it
+GENERIC_WORDS = frozenset(
+    "ecosystem database integration approach architecture accuracy reliability".split()
+)
+
+# Compiled matrices by file SHA-256 (bounded: a file rarely has many live versions)
+_COMPILED_MAX = 16
+_compiled: Dict[str, 'TechMatrix'] = {}
+_compiled_lock = threading.Lock()
+
+
+def tech_aliases(title: str) -> Set[str]:
+    """
+    Lookup names for a tech-matrix heading
+
+    "Python Ecosystem"     -> {"python ecosystem", "python"}
+    "TypeScript + Node.js" -> {"typescript node js", "typescript"}
+    "Hybrid AI + Rules"    -> {"hybrid ai rules", "hybrid ai"}
+    """
+    aliases = {normalize_text(title)}
+    # Only the lead technology gets a short alias ("Rules" alone is not a tech)
+    words = normalize_text(re.split(r'[+/&,]| and ', title)[0]).split()
+    if words:
+        aliases.add(' '.join(words))
+        core = [w for w in words if w not in GENERIC_WORDS]
+        if core:
+            aliases.add(' '.join(core))
+    aliases.discard('')
+    return aliases
+
+
+@dataclass(frozen=True, slots=True)
+class TechEntry:
+    """One technology of the matrix"""
+
+    name: str  # Heading, e.g. "SQLite Database"
+    success_rate: float
+    aliases: Tuple[str, ...]  # Normalized lookup names
+    source: str = TECH_SOURCE
+
+
+class TechMatrix:
+    """Indexed, immutable technology table (AresValidation's tech_matrix)"""
+
+    def __init__(self, entries: Iterable[TechEntry], version: str = ''):
+        """
+        Args:
+            entries: Technologies; on alias clashes the first entry wins
+            version: Identifier of the source (changes with its content)
+        """
+        self.entries: Tuple[TechEntry, ...] = tuple(entries)
+        self.version = version
+        self._by_alias: Dict[str, dict] = {}
+        for entry in self.entries:
+            info = {'name': entry.name, 'success_rate': entry.success_rate, 'source': entry.source}
+            for alias in entry.aliases:
+                self._by_alias.setdefault(alias, info)
+        self.automaton = KeywordAutomaton((alias, alias) for alias in self._by_alias)
+        # Linear scan for small matrices: (' alias ', alias, entry key)
+        self._needles: Optional[Tuple[Tuple[str, str, int], ...]] = None
+        if len(self._by_alias) <= SCAN_MAX_KEYWORDS:
+            self._needles = tuple(
+                (f' {alias} ', alias, id(info)) for alias, info in self._by_alias.items()
+            )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable, version: str = '') -> 'TechMatrix':
+        """Technologies from knowledge chunks (### sections with a success rate)"""
+        return cls(
+            (
+                TechEntry(c.title, c.success_rate, tuple(sorted(tech_aliases(c.title))), c.source)
+                for c in chunks
+                if c.source == TECH_SOURCE and c.level == 3 and c.success_rate is not None
+            ),
+            version
+        )
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_MATRIX_FILE) -> 'TechMatrix':
+        """
+        Load tech-success-matrix.md (compiled once per file content)
+
+        Args:
+            path: Markdown file with ### technology sections
+        """
+        from .knowledge import chunk_markdown
+
+        path = Path(path)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        with _compiled_lock:
+            matrix = _compiled.get(digest)
+        if matrix is not None:
+            return matrix
+
+        chunks = chunk_markdown(raw.decode('utf-8').splitlines(), TECH_SOURCE)
+        matrix = cls.from_chunks(chunks, version=digest[:16])
+        with _compiled_lock:
+            if len(_compiled) >= _COMPILED_MAX:
+                _compiled.clear()
+            _compiled[digest] = matrix
+        return matrix
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, dict]) -> 'TechMatrix':
+        """Technologies from a {name: {'success_rate': ...}} dict"""
+        return cls(
+            TechEntry(name, info['success_rate'], (normalize_text(name),), info.get('source', 'mapping'))
+            for name, info in mapping.items()
+        )
+
+    def get(self, tech: str) -> Optional[dict]:
+        """
+        Entry for a technology name or alias
+
+        Returns:
+            {'name', 'success_rate', 'source'} or None if unknown
+        """
+        info = self._by_alias.get(normalize_text(tech))
+        return dict(info) if info is not None else None
+
+    def extract(self, text: str, normalized: bool = False) -> List[str]:
+        """
+        Technologies mentioned in text
+
+        Args:
+            text: Free text
+            normalized: text already went through normalize_text
+
+        Returns:
+            The alias found for each technology, once per technology,
+            in order of first mention
+        """
+        if not normalized:
+            text = normalize_text(text)
+        seen = set()
+        found = []
+
+        if self._needles is not None:
+            padded = f' {text} '
+            hits = []
+            for needle, alias, key in self._needles:
+                if needle in padded:
+                    start = padded.find(needle)
+                    # Automaton order: by end, then start
+                    hits.append((start + len(needle), start, key, alias))
+            if len(hits) > 1:
+                hits.sort()
+            for _, _, key, alias in hits:
+                if key not in seen:
+                    seen.add(key)
+                    found.append(alias)
+            return found
+
+        by_alias = self._by_alias
+        for _, _, alias in self.automaton.iter_hits(text):
+            entry = id(by_alias[alias])
+            if entry not in seen:
+                seen.add(entry)
+                found.append(alias)
+        return found
+
+    def as_dict(self) -> Dict[str, dict]:
+        """Every name and alias as a plain {alias: entry} dict"""
+        return dict(self._by_alias)
+
+
+def to_tech_matrix(tech_matrix):
+    """
+    Accept the tech_matrix forms AresValidation supports
+
+    TechMatrix and KnowledgeBase (anything with extract/get) pass
+    through; plain {name: {'success_rate': ...}} dicts are compiled.
+    """
+    if tech_matrix is None or hasattr(tech_matrix, 'extract'):
+        return tech_matrix
+    return TechMatrix.from_mapping(tech_matrix)
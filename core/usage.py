@@ -0,0 +1,219 @@
+"""
+ARES Usage Telemetry
+Write-behind pattern usage counters with auto-promotion candidates
+
+record() only bumps an in-memory Counter under a lock; a daemon thread
+flushes the buffered deltas to SQLite in one transaction every few
+seconds (or sooner when the buffer fills), so matching never waits on
+disk. Totals (stored + buffered) are kept in memory, and a pattern
+becomes a promotion candidate at the moment its documented uses
+(Pattern.usage_count) plus recorded uses reach its tier's threshold -
+no periodic rescans. After close(), record() writes through.
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .config import config_value, load_config
+
+DEFAULT_USAGE_DB = Path.home() / ".ares-mcp" / "pattern-usage.db"
+DEFAULT_PROMOTE_THRESHOLD = 3
+# Total uses a Tier 3/2 pattern needs for the next tier up, from the tier
+# definitions in proven-patterns.md (Tier 2: used 2-4 times, Tier 1: 5+)
+TIER_PROMOTE_USES = {3: 2, 2: 5}
+FLUSH_INTERVAL = 5.0
+MAX_PENDING = 1000  # Distinct buffered ids before an early flush
+
+logger = logging.getLogger(__name__)
+
+
+class UsageTracker:
+    """Buffered pattern usage counts, persisted in the background"""
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_USAGE_DB,
+        promote_threshold: int = DEFAULT_PROMOTE_THRESHOLD,
+        flush_interval: float = FLUSH_INTERVAL
+    ):
+        """
+        Args:
+            db_path: SQLite file for usage totals
+            promote_threshold: Minimum total uses before any pattern is
+                               suggested for promotion (raises the
+                               TIER_PROMOTE_USES thresholds, never lowers them)
+            flush_interval: Seconds between background flushes
+        """
+        self.db_path = Path(db_path)
+        self.promote_threshold = promote_threshold
+        self.thresholds: Dict[int, int] = {
+            tier: max(uses, promote_threshold) for tier, uses in TIER_PROMOTE_USES.items()
+        }
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pattern_usage ("
+                " pattern_id TEXT PRIMARY KEY,"
+                " uses INTEGER NOT NULL,"
+                " tier INTEGER NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " documented INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(pattern_usage)")}
+            if 'documented' not in columns:
+                conn.execute("ALTER TABLE pattern_usage ADD COLUMN documented INTEGER NOT NULL DEFAULT 0")
+            rows = conn.execute("SELECT pattern_id, uses, tier, documented FROM pattern_usage").fetchall()
+
+        self._totals: Dict[str, int] = {pattern_id: uses for pattern_id, uses, _, _ in rows}
+        self._tiers: Dict[str, int] = {pattern_id: tier for pattern_id, _, tier, _ in rows}
+        self._documented: Dict[str, int] = {pattern_id: documented for pattern_id, _, _, documented in rows}
+        self._candidates: Dict[str, int] = {
+            pattern_id: tier for pattern_id, uses, tier, documented in rows
+            if tier in self.thresholds and documented + uses >= self.thresholds[tier]
+        }
+
+    @classmethod
+    def from_config(cls, config: Optional[dict] = None, **kwargs) -> Optional['UsageTracker']:
+        """
+        Tracker configured from ares.yaml
+
+        Returns:
+            None when tech_matrix.track_usage is false
+        """
+        config = load_config() if config is None else config
+        if not config_value(config, 'tech_matrix.track_usage', True):
+            return None
+        kwargs.setdefault(
+            'promote_threshold',
+            config_value(config, 'patterns.auto_promote_threshold', DEFAULT_PROMOTE_THRESHOLD)
+        )
+        return cls(**kwargs)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def record(self, patterns: Iterable) -> None:
+        """
+        Count one use of each pattern (hot path: memory only)
+
+        Args:
+            patterns: Pattern objects that were used
+        """
+        thresholds = self.thresholds
+        candidates = self._candidates
+        with self._lock:
+            for pattern in patterns:
+                pattern_id = pattern.pattern_id
+                tier = pattern.tier
+                self._pending[pattern_id] += 1
+                self._tiers[pattern_id] = tier
+                self._documented[pattern_id] = pattern.usage_count
+                recorded = self._totals.get(pattern_id, 0) + 1
+                self._totals[pattern_id] = recorded
+                if (
+                    tier in thresholds and pattern_id not in candidates
+                    and pattern.usage_count + recorded >= thresholds[tier]
+                ):
+                    candidates[pattern_id] = tier
+                    logger.info(
+                        "[PROMOTE] %s reached %d uses (Tier %d)",
+                        pattern_id, pattern.usage_count + recorded, tier
+                    )
+            pending = len(self._pending)
+
+        if self._stop.is_set():
+            # Closed: no flush thread will run again, so write through
+            self.flush()
+            return
+        if self._thread is None:
+            self._start()
+        if pending >= MAX_PENDING:
+            self._wake.set()
+
+    def uses(self, pattern_id: str) -> int:
+        """Recorded uses of a pattern (flushed + buffered)"""
+        return self._totals.get(pattern_id, 0)
+
+    def promotion_candidates(self) -> List[str]:
+        """Tier 2/3 pattern ids that reached their tier's promotion threshold"""
+        with self._lock:
+            return sorted(self._candidates)
+
+    def flush(self) -> int:
+        """
+        Write buffered counts to SQLite now
+
+        Returns:
+            Number of pattern rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+                rows = [
+                    (pattern_id, count, self._tiers[pattern_id], self._documented[pattern_id])
+                    for pattern_id, count in pending.items()
+                ]
+            if not pending:
+                return 0
+
+            now = time.time()
+            try:
+                with closing(self._connect()) as conn, conn:
+                    conn.executemany(
+                        "INSERT INTO pattern_usage (pattern_id, uses, tier, last_used, documented)"
+                        " VALUES (?, ?, ?, ?, ?)"
+                        " ON CONFLICT(pattern_id) DO UPDATE SET"
+                        " uses = uses + excluded.uses, tier = excluded.tier,"
+                        " last_used = excluded.last_used, documented = excluded.documented",
+                        [(pattern_id, count, tier, now, documented) for pattern_id, count, tier, documented in rows]
+                    )
+            except sqlite3.Error:
+                # Put the counts back; the next flush retries them
+                with self._lock:
+                    self._pending.update(pending)
+                raise
+            return len(pending)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="ares-usage-flush", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logger.error("[ERROR] Usage flush failed: %s", e)
+
+    def close(self):
+        """Stop the flush thread and write anything still buffered (later records write through)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(5.0)
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.error("[ERROR] Final usage flush failed: %s", e)
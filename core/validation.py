@@ -5,10 +5,25 @@ Extracted from ares-core-directives.md v2.1
 The 5-step validation loop that runs before every decision.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from itertools import chain, islice
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 
+from .keyword_automaton import normalize_text
+from .rules import RuleSet, default_rules
+from .tech_matrix import to_tech_matrix
+from .validation_cache import ValidationCache, validation_fingerprint
+from .validation_profile import STEPS, ValidationHooks, ValidationProfile, ValidationProfiler
+
 
 class ConfidenceLevel(Enum):
     """Confidence thresholds from Ares v2.1"""
@@ -17,9 +32,14 @@ class ConfidenceLevel(Enum):
     LOW = "LOW"        # <50% - Escalate to user
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of running the 5-step validation protocol"""
+    """
+    Result of running the 5-step validation protocol
+
+    Slotted with tuple fields (not frozen: frozen construction is about
+    five times slower). ValidationCache hands every caller its own copy.
+    """
 
     # The 5 validation steps
     challenge_response: str  # What could go wrong? Evidence for approach
@@ -31,9 +51,21 @@ class ValidationResult:
     # Derived values
     confidence_level: ConfidenceLevel
     should_proceed: bool
-    alternatives_considered: List[str]
-    patterns_referenced: List[str]
-    warnings: List[str]
+    alternatives_considered: Tuple[str, ...]
+    patterns_referenced: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    pattern_ids: Tuple[str, ...] = ()  # Ids of patterns_referenced, same order
+
+    # Step timings, only when hooks are attached (see core/validation_profile.py)
+    profile: Optional[ValidationProfile] = None
+
+    # Epoch seconds the result was computed (not part of equality)
+    created_at: float = field(default_factory=time.time, compare=False)
+
+    @property
+    def timestamp(self) -> str:
+        """created_at as local ISO-8601 (formatted on demand)"""
+        return datetime.fromtimestamp(self.created_at).isoformat()
 
     @property
     def decision(self) -> str:
@@ -46,6 +78,56 @@ class ValidationResult:
             return "ESCALATE - Present options and ask for input"
 
 
+# run_validation_batch: batches at least this long use worker processes
+BATCH_PARALLEL_THRESHOLD = 2000
+BATCH_CHUNK_SIZE = 500
+# arun_validation_batch, in-process: items per executor hop (the loop
+# regains control and cancellation takes effect between hops)
+ASYNC_CHUNK_SIZE = 50
+
+_batch_validator: Optional['AresValidation'] = None
+
+
+def _init_batch_worker(validator: 'AresValidation'):
+    # Runs once per worker: the pattern index arrives here, not with each chunk
+    global _batch_validator
+    _batch_validator = validator
+
+
+def _validate_chunk(items: Sequence[tuple]) -> List['ValidationResult']:
+    return [_batch_validator.run_validation(*item) for item in items]
+
+
+@dataclass(slots=True)
+class ValidationContext:
+    """
+    Facts shared by the 5 steps of one run_validation call
+
+    The approach is normalized, run through the rule set and matched
+    against the pattern library once; each step reads these and writes
+    its typed findings here for the steps after it.
+    """
+
+    task: str
+    approach: str
+    context: dict
+    normalized: str  # normalize_text(approach)
+    fired: Dict[str, List[str]]  # Rule messages by kind (see core/rules.py)
+    matches: list  # Patterns matching the approach, best first
+
+    # Step outputs
+    warnings: List[str] = field(default_factory=list)
+    evidence: List[str] = field(default_factory=list)
+    alternatives: List[str] = field(default_factory=list)
+    evidence_sources: List[str] = field(default_factory=list)
+    analogy: Optional[str] = None
+
+    @property
+    def tiers(self) -> Set[int]:
+        """Tiers of the matched patterns"""
+        return {p.tier for p in self.matches}
+
+
 class AresValidation:
     """
     The Internal Skeptic validation protocol from Ares v2.1
@@ -58,16 +140,79 @@ class AresValidation:
     5. Confidence: How certain am I?
     """
 
-    def __init__(self, patterns_library=None, tech_matrix=None):
+    def __init__(
+        self,
+        patterns_library=None,
+        tech_matrix=None,
+        rules: Optional[RuleSet] = None,
+        cache: Optional[ValidationCache] = None,
+        hooks: Optional[ValidationHooks] = None,
+        decision_log=None
+    ):
         """
         Initialize with optional knowledge bases
 
         Args:
             patterns_library: AresPatternMatcher instance
-            tech_matrix: Technology success rates
+            tech_matrix: Technology success rates - a TechMatrix (see
+                         core/tech_matrix.py), a KnowledgeBase, or a
+                         {tech: {'success_rate': ...}} dict (compiled once)
+            rules: Warning/alternative/analogy rules
+                   (default: config/validation_rules.json)
+            cache: Result cache for repeated (task, approach, context)
+                   validations (see core/validation_cache.py)
+            hooks: Per-step timing callbacks (see core/validation_profile.py);
+                   None = untimed
+            decision_log: DecisionLog every result is appended to
+                          (see core/decision_log.py)
         """
         self.patterns = patterns_library
-        self.tech_matrix = tech_matrix
+        self.tech_matrix = to_tech_matrix(tech_matrix)
+        self.rules = rules if rules is not None else default_rules()
+        self.cache = cache
+        self.hooks = hooks
+        self.decision_log = decision_log
+
+    def __getstate__(self):
+        # Batch workers never log; the parent logs their results
+        state = self.__dict__.copy()
+        state['decision_log'] = None
+        return state
+
+    def cache_stamp(self) -> str:
+        """
+        Version of everything a cached result depends on
+
+        Pattern library content, rules version and tech matrix version;
+        a reload or a rules change gives a new stamp, so older cached
+        results stop matching. Only file-loaded TechMatrix objects carry
+        a version - clear the cache after refreshing a KnowledgeBase.
+        """
+        library = self.patterns.library_fingerprint if self.patterns else '-'
+        tech = getattr(self.tech_matrix, 'version', '') or '-'
+        return f"{library}:{self.rules.version}:{tech}"
+
+    def build_context(
+        self,
+        task: str,
+        proposed_approach: str,
+        context: Optional[dict] = None
+    ) -> ValidationContext:
+        """Normalize, keyword-scan and pattern-match the approach once"""
+        normalized = normalize_text(proposed_approach)
+        matches = []
+        if self.patterns:
+            matches = self.patterns.find_matching_patterns(normalized, normalized=True)
+
+        context = context or {}
+        return ValidationContext(
+            task=task,
+            approach=proposed_approach,
+            context=context,
+            normalized=normalized,
+            fired=self.rules.evaluate(normalized, context),
+            matches=matches
+        )
 
     def run_validation(
         self,
@@ -85,26 +230,92 @@ class AresValidation:
 
         Returns:
             ValidationResult with all validation checks
-        """
-        context = context or {}
 
-        # Step 1: Challenge
-        challenge = self._challenge_approach(task, proposed_approach, context)
+        With a cache, a repeat of an earlier (task, approach, context)
+        under the same library and rules returns the cached result;
+        cache hits are not counted as pattern uses.
+        """
+        cache = self.cache
+        if cache is None:
+            result = self._validate(task, proposed_approach, context)
+        else:
+            key = validation_fingerprint(task, proposed_approach, context)
+            stamp = self.cache_stamp()
+            result = cache.get(key, stamp)
+            if result is None:
+                result = self._validate(task, proposed_approach, context)
+                cache.put(key, stamp, result)
+
+        if self.decision_log is not None:
+            self.decision_log.log_validation(result, task, proposed_approach)
+        return result
+
+    @contextmanager
+    def profile(self) -> Iterator[ValidationProfiler]:
+        """
+        Time every validation inside the block
 
-        # Step 2: Simplify
-        simplify = self._find_simpler_alternatives(task, proposed_approach, context)
+            with validator.profile() as profiler:
+                validator.run_validation(...)
+            print(profiler.report())
 
-        # Step 3: Validate
-        validate = self._check_evidence(proposed_approach, context)
+        Cache hits are not timed (no steps run).
+        """
+        profiler = ValidationProfiler()
+        previous, self.hooks = self.hooks, profiler
+        try:
+            yield profiler
+        finally:
+            self.hooks = previous
+
+    def _validate(
+        self,
+        task: str,
+        proposed_approach: str,
+        context: Optional[dict]
+    ) -> ValidationResult:
+        """
+        Build the context and run the 5 steps (_STEPS) in order
 
-        # Step 4: Explain
-        explain = self._plain_language_explanation(proposed_approach)
+        With hooks attached, a perf_counter reading follows the context
+        and every step; without, clock is None and nothing is timed.
+        """
+        hooks = self.hooks
+        clock = time.perf_counter if hooks is not None else None
+        readings = [clock()] if clock is not None else None
 
-        # Step 5: Confidence
-        confidence = self._calculate_confidence(
-            challenge, simplify, validate, explain
-        )
+        ctx = self.build_context(task, proposed_approach, context)
+        if clock is not None:
+            readings.append(clock())
 
+        if clock is None:
+            outputs = [step(self, ctx) for step in self._STEPS]
+        else:
+            outputs = []
+            for step in self._STEPS:
+                outputs.append(step(self, ctx))
+                readings.append(clock())
+
+        profile = None
+        if clock is not None:
+            profile = ValidationProfile(
+                steps={name: end - start for name, start, end in zip(STEPS, readings, readings[1:])},
+                pattern_matches=len(ctx.matches),
+                rules_fired=sum(len(messages) for messages in ctx.fired.values())
+            )
+            hooks.on_validation(profile)
+        return self._make_result(ctx, *outputs, profile)
+
+    @staticmethod
+    def _make_result(
+        ctx: ValidationContext,
+        challenge: str,
+        simplify: str,
+        validate: str,
+        explain: str,
+        confidence: float,
+        profile: Optional[ValidationProfile] = None
+    ) -> ValidationResult:
         # Determine confidence level
         if confidence >= 0.80:
             level = ConfidenceLevel.HIGH
@@ -117,86 +328,223 @@ class AresValidation:
             should_proceed = False
 
         return ValidationResult(
-            challenge_response=challenge['response'],
-            simplify_response=simplify['response'],
-            validate_response=validate['response'],
-            explain_response=explain['response'],
+            challenge_response=challenge,
+            simplify_response=simplify,
+            validate_response=validate,
+            explain_response=explain,
             confidence_score=confidence,
             confidence_level=level,
             should_proceed=should_proceed,
-            alternatives_considered=simplify['alternatives'],
-            patterns_referenced=validate['patterns'],
-            warnings=challenge['warnings']
+            alternatives_considered=tuple(ctx.alternatives),
+            patterns_referenced=tuple([p.name for p in ctx.matches]),
+            pattern_ids=tuple([p.pattern_id for p in ctx.matches]),
+            warnings=tuple(ctx.warnings),
+            profile=profile
         )
 
-    def _challenge_approach(self, task: str, approach: str, context: dict) -> dict:
+    def run_validation_batch(
+        self,
+        items: Iterable[tuple],
+        processes: Optional[int] = None
+    ) -> Iterator[ValidationResult]:
         """
-        Step 1: Challenge - What could go wrong? Is this the best approach?
+        Validate many (task, approach[, context]) items, streaming results
+
+        Small batches run in-process. From BATCH_PARALLEL_THRESHOLD items
+        up (or with an explicit processes > 1), chunks fan out to worker
+        processes that each receive this validator - pattern index
+        included - once, via the pool initializer. At most two chunks
+        per worker are in flight, so huge iterables stream in bounded
+        memory.
+
+        Args:
+            items: (task, approach) or (task, approach, context) tuples
+            processes: Worker processes (None = all CPUs for large
+                       batches, 1 = always in-process)
+
+        Yields:
+            ValidationResult per item, in input order
+        """
+        items = iter(items)
+        head = list(islice(items, BATCH_PARALLEL_THRESHOLD))
+        if processes is None:
+            processes = (os.cpu_count() or 1) if len(head) == BATCH_PARALLEL_THRESHOLD else 1
+
+        if processes <= 1:
+            for item in chain(head, items):
+                yield self.run_validation(*item)
+            return
+
+        remaining = chain(head, items)
+        chunks = iter(lambda: list(islice(remaining, BATCH_CHUNK_SIZE)), [])
+
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_batch_worker,
+            initargs=(self,)
+        ) as pool:
+            pending = deque(
+                (pool.submit(_validate_chunk, chunk), chunk) for chunk in islice(chunks, processes * 2)
+            )
+            while pending:
+                future, done = pending.popleft()
+                results = future.result()
+                for chunk in islice(chunks, 1):
+                    pending.append((pool.submit(_validate_chunk, chunk), chunk))
+                self._record_worker_results(done, results)
+                yield from results
+
+    async def arun_validation(
+        self,
+        task: str,
+        proposed_approach: str,
+        context: Optional[dict] = None,
+        executor: Optional[Executor] = None
+    ) -> ValidationResult:
+        """
+        run_validation without blocking the event loop
+
+        Runs in executor (default: the loop's thread pool), so many
+        requests validate concurrently while the loop keeps handling
+        messages. Cancelling the awaiting task abandons the result; a
+        validation already running finishes in its thread.
+
+        Args:
+            task, proposed_approach, context: As for run_validation
+            executor: Where to run (None = loop default)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.run_validation, task, proposed_approach, context)
+        )
 
-        Returns evidence for the approach and potential issues.
+    async def arun_validation_batch(
+        self,
+        items: Iterable[tuple],
+        processes: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> AsyncIterator[ValidationResult]:
         """
-        warnings = []
-        evidence = []
+        Async run_validation_batch: stream results without blocking the loop
+
+        Same process-pool rules as run_validation_batch; in-process
+        batches run ASYNC_CHUNK_SIZE items per hop on executor. At most
+        two chunks per worker are in flight. Cancelling the consumer (or
+        leaving the loop early) cancels queued chunks and stops reading
+        items; chunks already running are discarded.
+
+        Args:
+            items: (task, approach) or (task, approach, context) tuples
+            processes: Worker processes (None = all CPUs for large
+                       batches, 1 = always in-process)
+            executor: Executor for in-process chunks (None = loop default)
 
-        # Check against known anti-patterns
-        if "pure AI without fallback" in approach.lower():
-            warnings.append("Anti-pattern detected: Pure AI without fallbacks")
+        Yields:
+            ValidationResult per item, in input order
+        """
+        loop = asyncio.get_running_loop()
+        items = iter(items)
+        head = list(islice(items, BATCH_PARALLEL_THRESHOLD))
+        if processes is None:
+            processes = (os.cpu_count() or 1) if len(head) == BATCH_PARALLEL_THRESHOLD else 1
+
+        remaining = chain(head, items)
+        pool = None
+        if processes <= 1:
+            chunks = iter(lambda: list(islice(remaining, ASYNC_CHUNK_SIZE)), [])
+            submit = partial(loop.run_in_executor, executor, self._validate_items)
+            in_flight = 2
+        else:
+            chunks = iter(lambda: list(islice(remaining, BATCH_CHUNK_SIZE)), [])
+            pool = ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_init_batch_worker,
+                initargs=(self,)
+            )
+            submit = partial(loop.run_in_executor, pool, _validate_chunk)
+            in_flight = processes * 2
+
+        pending = deque()
+        try:
+            pending.extend((submit(chunk), chunk) for chunk in islice(chunks, in_flight))
+            while pending:
+                future, done = pending[0]
+                results = await future
+                pending.popleft()
+                for chunk in islice(chunks, 1):
+                    pending.append((submit(chunk), chunk))
+                if pool is not None:
+                    self._record_worker_results(done, results)
+                for result in results:
+                    yield result
+        finally:
+            for future, _ in pending:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _validate_items(self, items: Sequence[tuple]) -> List[ValidationResult]:
+        return [self.run_validation(*item) for item in items]
+
+    def _record_worker_results(
+        self,
+        items: Sequence[tuple],
+        results: Sequence[ValidationResult]
+    ):
+        """
+        Parent-side bookkeeping for results from batch worker processes
 
-        if "over-engineer" in approach.lower():
-            warnings.append("Risk: Over-engineering before validation")
+        Workers carry no usage tracker or decision log and time into
+        their own hook copies, so uses, profiles and log records are
+        recorded here.
+        """
+        hooks, log, patterns = self.hooks, self.decision_log, self.patterns
+        for item, result in zip(items, results):
+            if patterns and result.pattern_ids:
+                # By id: pattern names are display text and need not be unique
+                used = [patterns.get_pattern_by_id(pattern_id) for pattern_id in result.pattern_ids]
+                patterns.record_usage([p for p in used if p is not None])
+            if hooks is not None and result.profile is not None:
+                hooks.on_validation(result.profile)
+            if log is not None:
+                log.log_validation(result, item[0], item[1])
+
+    def _challenge_approach(self, ctx: ValidationContext) -> str:
+        """
+        Step 1: Challenge - What could go wrong? Is this the best approach?
 
-        # Check if approach matches context
-        if context.get('complexity') == 'simple' and 'microservice' in approach.lower():
-            warnings.append("May be over-complex for simple task")
+        Records warnings and evidence for the approach on ctx.
+        """
+        warnings = ctx.warnings
+
+        # Anti-pattern and over-complexity rules (context predicates applied)
+        warnings.extend(ctx.fired['warning'])
 
         # Look for positive evidence
-        if self.patterns:
-            matching_patterns = self.patterns.find_matching_patterns(approach)
-            if matching_patterns:
-                evidence.extend([f"Matches proven pattern: {p.name}" for p in matching_patterns])
+        ctx.evidence.extend(f"Matches proven pattern: {p.name}" for p in ctx.matches)
 
-        response = f"Evidence: {'; '.join(evidence) if evidence else 'No proven patterns match'}"
+        response = f"Evidence: {'; '.join(ctx.evidence) if ctx.evidence else 'No proven patterns match'}"
         if warnings:
             response += f" | Warnings: {'; '.join(warnings)}"
+        return response
 
-        return {
-            'response': response,
-            'warnings': warnings,
-            'evidence': evidence
-        }
-
-    def _find_simpler_alternatives(self, task: str, approach: str, context: dict) -> dict:
+    def _find_simpler_alternatives(self, ctx: ValidationContext) -> str:
         """
         Step 2: Simplify - Is there a simpler alternative?
 
         Considers 2-3 alternatives and picks best with reasoning.
         """
-        alternatives = []
-
-        # Generate simpler alternatives based on approach complexity
-        if "microservice" in approach.lower():
-            alternatives.append("Monolithic app with modular structure (simpler deployment)")
-
-        if "kubernetes" in approach.lower():
-            alternatives.append("Docker Compose (simpler orchestration)")
-
-        if "GraphQL" in approach.lower() and context.get('api_needs') == 'simple':
-            alternatives.append("REST API (simpler, well-understood)")
+        alternatives = ctx.alternatives
 
-        if "machine learning" in approach.lower():
-            alternatives.append("Rule-based system (simpler, explainable)")
+        # Simpler alternatives based on approach complexity
+        alternatives.extend(ctx.fired['alternative'])
 
         if not alternatives:
             alternatives.append("Current approach appears appropriately simple")
 
-        response = f"Alternatives considered: {', '.join(alternatives[:3])}"
+        return f"Alternatives considered: {', '.join(alternatives[:3])}"
 
-        return {
-            'response': response,
-            'alternatives': alternatives
-        }
-
-    def _check_evidence(self, approach: str, context: dict) -> dict:
+    def _check_evidence(self, ctx: ValidationContext) -> str:
         """
         Step 3: Validate - Do we have evidence this works?
 
@@ -205,13 +553,11 @@ class AresValidation:
         - External docs (if provided)
         - Industry standards (if provided)
         """
-        patterns = []
-        evidence_sources = []
+        evidence_sources = ctx.evidence_sources
 
         if self.patterns:
-            matching = self.patterns.find_matching_patterns(approach)
-            for pattern in matching:
-                patterns.append(pattern.name)
+            self.patterns.record_usage(ctx.matches)
+            for pattern in ctx.matches:
                 if pattern.tier == 1:
                     evidence_sources.append(f"Tier 1 pattern: {pattern.name} ({pattern.success_rate*100:.0f}% success)")
                 elif pattern.tier == 2:
@@ -219,51 +565,28 @@ class AresValidation:
 
         if self.tech_matrix:
             # Check technology success rates
-            techs = self._extract_technologies(approach)
-            for tech in techs:
+            for tech in self.tech_matrix.extract(ctx.normalized, normalized=True):
                 rate = self.tech_matrix.get(tech)
                 if rate:
                     evidence_sources.append(f"{tech}: {rate['success_rate']*100:.0f}% success rate")
 
-        response = '; '.join(evidence_sources) if evidence_sources else "No direct evidence in proven patterns"
-
-        return {
-            'response': response,
-            'patterns': patterns
-        }
+        return '; '.join(evidence_sources) if evidence_sources else "No direct evidence in proven patterns"
 
-    def _plain_language_explanation(self, approach: str) -> dict:
+    def _plain_language_explanation(self, ctx: ValidationContext) -> str:
         """
         Step 4: Explain - Can I explain this in plain language?
 
         Draft an analogy (LEGO blocks vs glued parts style)
         """
-        # Simple heuristic-based analogies
-        analogies = {
-            'modular': "Like LEGO blocks instead of gluing parts - easy to swap components",
-            'monolithic': "Like a single toolbox - everything in one place",
-            'microservice': "Like a kitchen with specialized stations - each does one job well",
-            'database-centric': "Like a library catalog - single source of truth for all data",
-            'hybrid ai': "Like a calculator with a smart assistant - rules handle basics, AI handles edge cases",
-            'api': "Like a restaurant menu - defined options, consistent service",
-            'fallback': "Like a backup generator - works without main power"
-        }
-
-        explanation = "Complex technical approach"
-        for key, analogy in analogies.items():
-            if key in approach.lower():
-                explanation = analogy
-                break
-
-        return {'response': explanation}
-
-    def _calculate_confidence(
-        self,
-        challenge: dict,
-        simplify: dict,
-        validate: dict,
-        explain: dict
-    ) -> float:
+        # First matching analogy rule wins
+        analogies = ctx.fired['analogy']
+        if analogies:
+            ctx.analogy = analogies[0]
+            return ctx.analogy
+
+        return "Complex technical approach"
+
+    def _calculate_confidence(self, ctx: ValidationContext) -> float:
         """
         Step 5: Confidence - Calculate confidence score (0.0 to 1.0)
 
@@ -275,23 +598,27 @@ class AresValidation:
         confidence = 0.5  # Start at medium
 
         # Boost for proven patterns
-        if "Tier 1" in validate['response']:
+        tiers = ctx.tiers
+        if 1 in tiers:
             confidence += 0.3
-        elif "Tier 2" in validate['response']:
+        elif 2 in tiers:
             confidence += 0.15
 
         # Reduce for warnings
-        confidence -= 0.1 * len(challenge['warnings'])
+        confidence -= 0.1 * len(ctx.warnings)
 
         # Boost for clear explanation
-        if explain['response'] != "Complex technical approach":
+        if ctx.analogy is not None:
             confidence += 0.1
 
         # Cap between 0 and 1
         return max(0.0, min(1.0, confidence))
 
-    def _extract_technologies(self, text: str) -> List[str]:
-        """Extract technology names from text"""
-        # Simple keyword matching (could be enhanced)
-        known_techs = ['python', 'typescript', 'sqlite', 'postgresql', 'fastapi', 'react', 'docker']
-        return [tech for tech in known_techs if tech in text.lower()]
+    # The protocol, in order (timed under the names in validation_profile.STEPS)
+    _STEPS = (
+        _challenge_approach,         # Step 1: Challenge
+        _find_simpler_alternatives,  # Step 2: Simplify
+        _check_evidence,             # Step 3: Validate
+        _plain_language_explanation, # Step 4: Explain
+        _calculate_confidence,       # Step 5: Confidence
+    )
@@ -0,0 +1,194 @@
+"""
+ARES Validation Cache
+Memoized ValidationResults keyed by a (task, approach, context) fingerprint
+
+The fingerprint is a BLAKE2b digest of the normalized task, normalized
+approach and the context serialized with sorted keys, so "Use SQLite!"
+and "use sqlite" with {a: 1, b: 2} / {b: 2, a: 1} share one entry.
+
+Every entry is stamped with the pattern library fingerprint and rules
+version it was computed under; a lookup under a different stamp is a
+miss, so editing proven-patterns.md or the rules file invalidates the
+cache automatically (in memory and on disk).
+
+Memory tier: LRU bounded by size and TTL. Disk tier (optional): a SQLite
+table shared by processes and surviving restarts. The cache keeps its own
+copy of each result and every hit gets a fresh one (a constructor call;
+the fields are tuples), so no caller can change what later hits see.
+Cached copies carry no profile - hits are not timed.
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from dataclasses import fields
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from .keyword_automaton import normalize_text
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_TTL = 24 * 60 * 60
+RESULT_FORMAT = 3  # Bump when ValidationResult's pickled layout changes (disk rows)
+
+ValidationCacheInfo = namedtuple('ValidationCacheInfo', ['hits', 'disk_hits', 'misses', 'maxsize', 'currsize'])
+
+
+def validation_fingerprint(task: str, approach: str, context: Optional[dict]) -> str:
+    """Stable hex digest of normalized task, approach and sorted context"""
+    payload = json.dumps(
+        [normalize_text(task), normalize_text(approach), context or {}],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=repr
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+_field_getters: Dict[type, Callable] = {}
+
+
+def _copy_result(result, **changes):
+    """Shallow copy of a result dataclass (cheaper than dataclasses.replace)"""
+    cls = type(result)
+    getter = _field_getters.get(cls)
+    if getter is None:
+        getter = _field_getters[cls] = attrgetter(*(f.name for f in fields(cls)))
+    copy = cls(*getter(result))
+    for name, value in changes.items():
+        setattr(copy, name, value)
+    return copy
+
+
+class ValidationCache:
+    """Bounded, TTL-expiring ValidationResult cache with an optional disk tier"""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        persist_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            max_size: Max results kept in memory (least recently used evicted)
+            ttl: Seconds a result stays valid
+            persist_path: SQLite file for the disk tier (None = memory only)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Tuple[str, float, object]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_prune = 0.0
+
+        if self.persist_path:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db().execute(
+                "CREATE TABLE IF NOT EXISTS validation_cache ("
+                " key TEXT PRIMARY KEY,"
+                " stamp TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " result BLOB NOT NULL)"
+            )
+
+    def __getstate__(self):
+        # Worker processes start with an empty memory tier and their own connections
+        return {'max_size': self.max_size, 'ttl': self.ttl, 'persist_path': self.persist_path}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _db(self) -> sqlite3.Connection:
+        # One connection per thread, autocommit
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.persist_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, stamp: str):
+        """
+        Cached result for key computed under stamp, or None
+
+        Args:
+            key: validation_fingerprint(...)
+            stamp: Library/rules version the caller is running with
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_stamp, expires_at, result = entry
+                if entry_stamp == stamp and expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _copy_result(result)
+                del self._entries[key]
+
+        if self.persist_path:
+            row = self._db().execute(
+                "SELECT result, expires_at FROM validation_cache"
+                " WHERE key = ? AND stamp = ? AND expires_at > ?",
+                (key, f"{RESULT_FORMAT}:{stamp}", now)
+            ).fetchone()
+            if row is not None:
+                result = pickle.loads(row[0])
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, stamp, row[1], result)
+                return _copy_result(result)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, stamp: str, result):
+        """Store a result computed under stamp (the caller keeps its own object)"""
+        result = _copy_result(result, profile=None)
+        now = time.time()
+        expires_at = now + self.ttl
+        with self._lock:
+            self._remember(key, stamp, expires_at, result)
+
+        if self.persist_path:
+            db = self._db()
+            disk_stamp = f"{RESULT_FORMAT}:{stamp}"
+            db.execute(
+                "INSERT OR REPLACE INTO validation_cache VALUES (?, ?, ?, ?)",
+                (key, disk_stamp, expires_at, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            )
+            if now - self._last_prune > 60:
+                self._last_prune = now
+                db.execute(
+                    "DELETE FROM validation_cache WHERE expires_at <= ? OR stamp != ?",
+                    (now, disk_stamp)
+                )
+
+    def _remember(self, key: str, stamp: str, expires_at: float, result):
+        entries = self._entries
+        entries[key] = (stamp, expires_at, result)
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached result (memory and disk)"""
+        with self._lock:
+            self._entries.clear()
+        if self.persist_path:
+            self._db().execute("DELETE FROM validation_cache")
+
+    def info(self) -> ValidationCacheInfo:
+        with self._lock:
+            return ValidationCacheInfo(self.hits, self.disk_hits, self.misses, self.max_size, len(self._entries))
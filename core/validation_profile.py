@@ -0,0 +1,160 @@
+"""
+ARES Validation Profiling
+Opt-in per-step timing for AresValidation.run_validation
+
+With hooks attached (AresValidation(hooks=...) or `with
+validator.profile() as profiler:`), every validation records the wall
+time of context building and of each of the five steps, plus how many
+patterns matched and rules fired. The numbers ride on the result
+(ValidationResult.profile) and are passed to hooks.on_validation.
+ValidationProfiler aggregates them into log2-bucketed latency
+histograms.
+
+Without hooks the protocol takes its untimed path: one attribute check
+per validation.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+STEPS = ('context', 'challenge', 'simplify', 'validate', 'explain', 'confidence')
+
+
+@dataclass(slots=True)
+class ValidationProfile:
+    """Timings of one run_validation call"""
+
+    steps: Dict[str, float] = field(default_factory=dict)  # step -> seconds, in STEPS order
+    pattern_matches: int = 0
+    rules_fired: int = 0
+
+    @property
+    def total(self) -> float:
+        """Seconds across all steps"""
+        return sum(self.steps.values())
+
+
+class ValidationHooks:
+    """Instrumentation callback interface (override what you need)"""
+
+    def on_validation(self, profile: ValidationProfile):
+        """Called once per timed validation"""
+
+
+class LatencyHistogram:
+    """Latency histogram with power-of-two microsecond buckets"""
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}  # bucket -> count; bucket b holds [2^(b-1), 2^b) us
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        micros = int(seconds * 1e6)
+        bucket = micros.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Approximate percentile in seconds
+
+        Returns:
+            Upper bound of the bucket holding the p-th percentile
+            (capped at the observed max)
+        """
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+
+class ValidationProfiler(ValidationHooks):
+    """Aggregates ValidationProfiles into per-step histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self):
+        # Batch workers get an empty profiler; results carry their
+        # profiles back and the parent's profiler records them
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def reset(self):
+        """Drop everything recorded so far"""
+        with self._lock:
+            self.histograms: Dict[str, LatencyHistogram] = {
+                step: LatencyHistogram() for step in (*STEPS, 'total')
+            }
+            self.pattern_matches: Dict[int, int] = {}  # matches per validation -> count
+
+    def on_validation(self, profile: ValidationProfile):
+        with self._lock:
+            histograms = self.histograms
+            for step, seconds in profile.steps.items():
+                histograms[step].add(seconds)
+            histograms['total'].add(profile.total)
+            matches = profile.pattern_matches
+            self.pattern_matches[matches] = self.pattern_matches.get(matches, 0) + 1
+
+    @property
+    def count(self) -> int:
+        """Validations recorded"""
+        return self.histograms['total'].count
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-step statistics
+
+        Returns:
+            {step: {'count', 'mean_us', 'p50_us', 'p95_us', 'max_us', 'share'}}
+            where share is the step's fraction of total time
+        """
+        with self._lock:
+            overall = self.histograms['total'].total or 1.0
+            return {
+                step: {
+                    'count': h.count,
+                    'mean_us': h.mean * 1e6,
+                    'p50_us': h.percentile(50) * 1e6,
+                    'p95_us': h.percentile(95) * 1e6,
+                    'max_us': h.max * 1e6,
+                    'share': h.total / overall,
+                }
+                for step, h in self.histograms.items()
+            }
+
+    def report(self) -> str:
+        """Summary as a plain-text table"""
+        lines: List[str] = [
+            f"{'step':<11} {'count':>7} {'mean us':>9} {'p50 us':>9} {'p95 us':>9} {'max us':>9} {'share':>6}"
+        ]
+        for step, s in self.summary().items():
+            lines.append(
+                f"{step:<11} {s['count']:>7} {s['mean_us']:>9.1f} {s['p50_us']:>9.1f}"
+                f" {s['p95_us']:>9.1f} {s['max_us']:>9.1f} {s['share']:>6.0%}"
+            )
+        with self._lock:
+            matches = sorted(self.pattern_matches.items())
+        if matches:
+            lines.append("pattern matches per validation: " + ", ".join(f"{m}x{n}" for m, n in matches))
+        return "\n".join(lines)
@@ -0,0 +1,137 @@
+"""
+Ares Message Dedupe - Bounded TTL set of processed WhatsApp message ids
+
+Meta redelivers any webhook that isn't acknowledged quickly. Checking
+each message id here before doing any work turns a redelivery into one
+hash lookup instead of a new task plus another confirmation.
+
+Memory: ids (~60 char wamid strings) are stored as 64-bit BLAKE2b
+digests in an insertion-ordered dict, so expiry and size eviction both
+pop from the front.
+
+Persistence (optional): a SQLite table of the same digests shared by
+every worker process and surviving restarts. INSERT OR IGNORE makes the
+check-and-add atomic across processes.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Meta retries failed deliveries for up to 7 days, but almost all
+# redeliveries land within minutes
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_SIZE = 50_000
+
+
+def message_key(message_id: str) -> int:
+    """Signed 64-bit digest of a message id (fits a SQLite INTEGER)"""
+    digest = hashlib.blake2b(message_id.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+class SeenMessageIds:
+    """Bounded, TTL-expiring set of message ids"""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        persist_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            ttl: Seconds to remember an id
+            max_size: Max ids kept in memory (oldest evicted first)
+            persist_path: SQLite file to share ids across processes/restarts
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._expiry: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_prune = 0.0
+
+        if self.persist_path:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db().execute(
+                "CREATE TABLE IF NOT EXISTS seen_messages ("
+                " key INTEGER PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+
+    def _db(self) -> sqlite3.Connection:
+        # One connection per thread, autocommit
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.persist_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _evict(self, now: float):
+        # Dict order is insertion order, which is expiry order for a fixed TTL
+        expiry = self._expiry
+        while expiry:
+            key = next(iter(expiry))
+            if expiry[key] > now and len(expiry) <= self.max_size:
+                break
+            del expiry[key]
+
+    def add(self, message_id: str) -> bool:
+        """
+        Record a message id
+
+        Returns:
+            True if the id is new (process it), False if already seen
+        """
+        key = message_key(message_id)
+        now = time.time()
+
+        with self._lock:
+            expires_at = self._expiry.get(key)
+            if expires_at is not None and expires_at > now:
+                return False
+            self._expiry.pop(key, None)
+            self._expiry[key] = now + self.ttl
+            self._evict(now)
+
+        if self.persist_path:
+            return self._add_persistent(key, now)
+        return True
+
+    def _add_persistent(self, key: int, now: float) -> bool:
+        db = self._db()
+        if now - self._last_prune > 60:
+            self._last_prune = now
+            db.execute("DELETE FROM seen_messages WHERE expires_at <= ?", (now,))
+
+        inserted = db.execute(
+            "INSERT OR IGNORE INTO seen_messages VALUES (?, ?)", (key, now + self.ttl)
+        ).rowcount
+        if inserted:
+            return True
+
+        # Seen by another worker (or before a restart) - unless it expired
+        return db.execute(
+            "UPDATE seen_messages SET expires_at = ? WHERE key = ? AND expires_at <= ?",
+            (now + self.ttl, key, now)
+        ).rowcount == 1
+
+    def discard(self, message_id: str):
+        """Forget a message id (its processing failed, so a redelivery must run)"""
+        key = message_key(message_id)
+        with self._lock:
+            self._expiry.pop(key, None)
+        if self.persist_path:
+            self._db().execute("DELETE FROM seen_messages WHERE key = ?", (key,))
+
+    def __contains__(self, message_id: str) -> bool:
+        expires_at = self._expiry.get(message_key(message_id))
+        return expires_at is not None and expires_at > time.time()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
@@ -0,0 +1,173 @@
+"""
+Ares Mobile Queue - Shared task queue storage for the mobile bridges
+
+The WhatsApp bridge runs with several worker processes/threads and the
+task processor runs alongside it, all sharing mobile_task_queue.json.
+Every write here is a locked read-modify-write with an atomic replace,
+so concurrent webhooks never lose each other's tasks.
+
+Locking:
+- Threads in one process: threading.Lock
+- Processes: OS file lock on a sidecar .lock file (fcntl / msvcrt)
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Paths
+ARES_DIR = Path.home() / ".ares-mcp"
+TASK_QUEUE_FILE = ARES_DIR / "mobile_task_queue.json"
+
+
+class LockedJsonFile:
+    """JSON file with locked read-modify-write and atomic replace"""
+
+    # One thread lock per file path, shared by every instance in the process
+    _thread_locks: Dict[str, threading.Lock] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: Path, default: Callable[[], Any] = list):
+        self.path = Path(path)
+        self.default = default
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+        key = str(self.path.resolve())
+        with self._registry_lock:
+            self._thread_lock = self._thread_locks.setdefault(key, threading.Lock())
+
+    @contextmanager
+    def locked(self):
+        """Hold the file lock across threads and processes"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._thread_lock:
+            with open(self.lock_path, 'a+b') as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    if fcntl:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    else:
+                        lock_file.seek(0)
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read_unlocked(self) -> Any:
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        return self.default()
+
+    def _write_unlocked(self, data: Any):
+        # Write to a temp file in the same directory, then swap it in
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def read(self) -> Any:
+        """Read a consistent snapshot"""
+        with self.locked():
+            return self._read_unlocked()
+
+    def update(self, mutate: Callable[[Any], Any]) -> Any:
+        """
+        Apply a mutation under the lock and save the result
+
+        Args:
+            mutate: Called with the current data; mutates it in place
+
+        Returns:
+            Whatever mutate returns
+        """
+        with self.locked():
+            data = self._read_unlocked()
+            result = mutate(data)
+            self._write_unlocked(data)
+            return result
+
+
+class MobileTaskQueue(LockedJsonFile):
+    """The shared mobile task queue (mobile_task_queue.json)"""
+
+    def __init__(self, path: Path = TASK_QUEUE_FILE):
+        super().__init__(path, default=list)
+
+    def add_tasks(self, tasks: List[Dict]) -> List[Dict]:
+        """
+        Append tasks with ids assigned under the lock
+
+        Ids continue from the highest id on disk, so two workers adding
+        at the same time never hand out the same task number. Tasks
+        without a status are marked 'queued'.
+        """
+        timestamp = datetime.now().isoformat()
+
+        def append(queue: List[Dict]) -> List[Dict]:
+            next_id = max((t.get('id', 0) for t in queue), default=0) + 1
+            for task in tasks:
+                task['id'] = next_id
+                task['timestamp'] = timestamp
+                task.setdefault('status', 'queued')
+                queue.append(task)
+                next_id += 1
+            return tasks
+
+        return self.update(append)
+
+    def update_task(self, task_id: int, if_status: Optional[str] = None, **fields) -> bool:
+        """
+        Update fields of one task
+
+        Args:
+            task_id: Task to update
+            if_status: Only update while the task still has this status
+
+        Returns:
+            False if the task no longer exists (or moved past if_status)
+        """
+        def apply(queue: List[Dict]) -> bool:
+            for task in queue:
+                if task.get('id') == task_id:
+                    if if_status is not None and task.get('status') != if_status:
+                        return False
+                    task.update(fields)
+                    return True
+            return False
+
+        return self.update(apply)
+
+    def merge_tasks(self, tasks: List[Dict]):
+        """
+        Write back a local copy of tasks, matched by id
+
+        Tasks added on disk since the copy was loaded are kept.
+        """
+        by_id = {t['id']: t for t in tasks if 'id' in t}
+
+        def merge(queue: List[Dict]):
+            for i, task in enumerate(queue):
+                if task.get('id') in by_id:
+                    queue[i] = by_id[task['id']]
+
+        self.update(merge)
@@ -202,7 +202,7 @@ def test_integration():
     # Also show JSON format
     print("\n### JSON Output Format")
     print("-" * 70)
-    print(response.to_json())
+    print(response.to_json(pretty=True))
 
 
 if __name__ == "__main__":
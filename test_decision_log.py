@@ -0,0 +1,102 @@
+"""
+Tests for the ARES decision log (core/decision_log.py)
+"""
+
+import gzip
+import json
+import time
+
+from core.decision_log import DecisionLog
+from core.output import AresOutput
+from core.patterns import AresPatternMatcher
+from core.validation import AresValidation
+
+CASES = [
+    ("Build a scraper", "Modular scrapers with a central coordinator", {}),
+    ("Answer support email", "Over-engineered microservices on Kubernetes", {"complexity": "simple"}),
+    ("Store events", "SQLite as single source of truth", {}),
+]
+
+
+def test_validations_and_decisions_are_logged_and_queryable(tmp_path):
+    """Records land in gzip NDJSON and the index filters by level, time and pattern"""
+    log = DecisionLog(log_dir=tmp_path / "logs")
+    validator = AresValidation(patterns_library=AresPatternMatcher(cache_dir=tmp_path), decision_log=log)
+
+    start = time.time()
+    results = [validator.run_validation(*CASES[0])]
+    assert log.flush()  # Separate gzip members from here on
+    results += [validator.run_validation(*case) for case in CASES[1:]]
+    response = AresOutput.format_validation_result(results[0], decision_log=log)
+    assert log.flush()
+
+    everything = log.query()
+    assert [r['kind'] for r in everything] == ['validation'] * 3 + ['decision']
+    assert everything[1]['approach'] == CASES[1][1]
+    assert everything[3]['reasoning'] == response.reasoning
+
+    low = log.query(since=start, level="LOW")
+    assert [r['task'] for r in low] == ["Answer support email"]
+    assert log.query(until=start) == []
+
+    pattern_id = results[0].pattern_ids[0]
+    assert everything[0]['pattern_ids'] == list(results[0].pattern_ids)
+    assert {r['kind'] for r in log.query(pattern_id=pattern_id)} == {'validation', 'decision'}
+    assert len(log.query(kind='validation', limit=2)) == 2
+
+    # Segments are plain (multi-member) gzip NDJSON
+    (segment,) = (tmp_path / "logs").glob("decisions-*.ndjson.gz")
+    with gzip.open(segment, 'rt', encoding='utf-8') as f:
+        assert [json.loads(line)['kind'] for line in f] == [r['kind'] for r in everything]
+    log.close()
+
+
+def test_rotation_retention_and_config(tmp_path):
+    """Segments rotate by size, old ones expire with their index rows"""
+    log = DecisionLog(log_dir=tmp_path / "logs", max_segment_bytes=1, max_segments=2)
+    response = AresOutput.format_high_confidence("Done", "Proven", ["Modular Scraper"], [])
+    for _ in range(4):
+        log.log_decision(response, ["modular_architecture_v1"])
+        log.flush()
+
+    assert len(list((tmp_path / "logs").glob("decisions-*.ndjson.gz"))) == 2
+    assert len(log.query(pattern_id="modular_architecture_v1")) == 2
+    log.close()
+
+    # A segment deleted behind the index is skipped and its rows dropped
+    oldest = min((tmp_path / "logs").glob("decisions-*.ndjson.gz"))
+    oldest.unlink()
+    assert len(log.query(limit=1)) == 1
+    assert len(log.query()) == 1
+
+    # A new instance continues after the last segment
+    assert DecisionLog(log_dir=tmp_path / "logs")._seq == 4
+
+    assert DecisionLog.from_config({'logging': {'enabled': False}}) is None
+    configured = DecisionLog.from_config(
+        {'logging': {'log_dir': str(tmp_path / "cfg"), 'log_validations': False}}
+    )
+    assert configured.log_dir == tmp_path / "cfg" and not configured.log_validations
+
+
+def test_writer_survives_bad_records_and_restarts(tmp_path):
+    """Unencodable values are stored as str(), and a dead writer is restarted"""
+    log = DecisionLog(log_dir=tmp_path / "logs")
+    circular = []
+    circular.append(circular)
+
+    for result in ({1: 'x'}, {'when': object()}, circular, "fine"):
+        log.log_decision(AresOutput.format_high_confidence(result, "Because", [], []))
+    assert log.flush()
+    assert log._thread.is_alive()
+    results = [r['result'] for r in log.query()]
+    assert results[0] == {'1': 'x'} and results[1]['when'].startswith("<object object")
+    assert results[2:] == ["fine"]  # The circular record alone was dropped
+
+    # Writer gone without close(): the next record brings it back
+    log._queue.put(None)
+    log._thread.join()
+    log.log_decision(AresOutput.format_high_confidence("after restart", "Because", [], []))
+    assert log.flush()
+    assert log.query()[-1]['result'] == "after restart"
+    log.close()
@@ -0,0 +1,125 @@
+"""
+Tests for the ARES knowledge base (core/knowledge.py)
+"""
+
+import os
+
+from core.knowledge import KnowledgeBase, chunk_markdown
+from core.validation import AresValidation
+
+SAMPLE_MATRIX = """# Tech Success Matrix
+
+## ✅ Proven Winners
+
+### Python Ecosystem
+**Success Rate: 95%** | **Usage: Primary language**
+
+#### What Works
+- Requests + BeautifulSoup
+
+```python
+# not a heading
+```
+
+### TypeScript + Node.js
+**Success Rate: 85%** | **Usage: MCP servers**
+
+### Pure AI Approach
+**Success Rate: N/A** | **Why avoided**
+"""
+
+SAMPLE_DECISIONS = """# Decision Causality
+
+## Database Decisions
+
+### Why SQLite for Development/POC?
+**Decision:** Zero configuration, single file
+"""
+
+
+def write_sources(base):
+    (base / "tech-success-matrix.md").write_text(SAMPLE_MATRIX, encoding='utf-8')
+    (base / "decision-causality.md").write_text(SAMPLE_DECISIONS, encoding='utf-8')
+
+
+def test_chunks_split_on_headings_up_to_level_3():
+    """#### sections and code comments stay inside their ### chunk"""
+    chunks = chunk_markdown(SAMPLE_MATRIX.splitlines(), "tech-success-matrix")
+
+    assert [c.title for c in chunks] == [
+        "Tech Success Matrix", "✅ Proven Winners", "Python Ecosystem",
+        "TypeScript + Node.js", "Pure AI Approach",
+    ]
+    python = chunks[2]
+    assert python.path == ("Tech Success Matrix", "✅ Proven Winners")
+    assert python.success_rate == 0.95
+    assert "# not a heading" in python.body
+    assert chunks[4].success_rate is None
+
+
+def test_refresh_rewrites_only_changed_chunks(tmp_path):
+    """Unchanged files are skipped; edited files only rewrite changed chunks"""
+    write_sources(tmp_path)
+    kb = KnowledgeBase(base_dir=tmp_path, db_path=tmp_path / "kb.db")
+    assert len(kb.chunks) == 8
+    assert kb.refresh() == {'added': 0, 'removed': 0, 'unchanged': 0}
+
+    matrix = tmp_path / "tech-success-matrix.md"
+    matrix.write_text(SAMPLE_MATRIX.replace("85%", "90%"), encoding='utf-8')
+    stat = matrix.stat()
+    os.utime(matrix, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert kb.refresh() == {'added': 1, 'removed': 1, 'unchanged': 4}
+    assert kb.tech_success_rate("typescript") == 0.90
+
+    # A new instance reads the stored chunks without re-parsing
+    assert KnowledgeBase(base_dir=tmp_path, db_path=tmp_path / "kb.db").refresh()['added'] == 0
+
+
+def test_lookups_feed_validation(tmp_path):
+    """Tech rates and decision rationale come from the indexed files"""
+    write_sources(tmp_path)
+    kb = KnowledgeBase(base_dir=tmp_path, db_path=tmp_path / "kb.db")
+
+    assert kb.get("Python")['success_rate'] == 0.95
+    assert kb.get("Pure AI") is None
+    assert set(kb.as_tech_matrix()) >= {"python", "python ecosystem", "typescript"}
+    assert kb.decision_rationale("why sqlite") == [
+        ("SQLite for Development/POC?", "**Decision:** Zero configuration, single file")
+    ]
+
+    result = AresValidation(tech_matrix=kb).run_validation(
+        task="Build an API",
+        proposed_approach="Python service"
+    )
+    assert "python: 95% success rate" in result.validate_response
+
+
+def test_tech_matrix_compiles_once_and_extracts_in_mention_order(tmp_path):
+    """Names and lead aliases resolve; same content reuses the compiled matrix"""
+    from core.tech_matrix import TechMatrix
+
+    matrix_file = tmp_path / "tech-success-matrix.md"
+    matrix_file.write_text(SAMPLE_MATRIX, encoding='utf-8')
+    matrix = TechMatrix.from_file(matrix_file)
+
+    assert [e.name for e in matrix.entries] == ["Python Ecosystem", "TypeScript + Node.js"]
+    assert matrix.get("TypeScript")['success_rate'] == 0.85
+    assert matrix.extract("Python ecosystem glue, a TypeScript UI, more python, pythonic") == ["python", "typescript"]
+    assert TechMatrix.from_file(matrix_file) is matrix
+
+    # Small matrices scan name by name; the automaton path finds the same, in the same order
+    automaton_only = TechMatrix(matrix.entries)
+    automaton_only._needles = None
+    for text in ("TypeScript Node.js then python", "python ecosystem and typescript", "pythonic typescripts"):
+        assert matrix.extract(text) == automaton_only.extract(text)
+
+    matrix_file.write_text(SAMPLE_MATRIX.replace("85%", "90%"), encoding='utf-8')
+    assert TechMatrix.from_file(matrix_file).get("typescript")['success_rate'] == 0.90
+
+
+def test_plain_dict_tech_matrix_still_supported():
+    """{tech: {'success_rate': ...}} dicts are compiled for extraction"""
+    validator = AresValidation(tech_matrix={"PostgreSQL": {'success_rate': 0.7}})
+    result = validator.run_validation("Store orders", "PostgreSQL behind a small API")
+    assert "postgresql: 70% success rate" in result.validate_response
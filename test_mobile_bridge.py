@@ -0,0 +1,378 @@
+"""
+Tests for the mobile bridge support modules
+
+Covers the pieces that run without WhatsApp credentials or network
+access: the shared task queue storage, message dedupe, the
+transcription queue, media downloads over a fake session, and the
+bridge itself with send_message stubbed
+and storage under tmp_path.
+"""
+
+import threading
+import time
+
+import pytest
+
+from message_dedupe import SeenMessageIds
+from mobile_queue import MobileTaskQueue
+from transcription import StubBackend, TranscriptCache, TranscriptionQueue
+import whatsapp_bridge
+import whatsapp_media
+
+
+def test_concurrent_adds_keep_every_task(tmp_path):
+    """Concurrent writers never lose tasks or reuse ids"""
+    queue_file = tmp_path / "mobile_task_queue.json"
+
+    def writer(worker):
+        queue = MobileTaskQueue(queue_file)
+        for i in range(25):
+            queue.add_tasks([{'content': f"{worker}-{i}"}])
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    tasks = MobileTaskQueue(queue_file).read()
+    assert len(tasks) == 200
+    assert sorted(t['id'] for t in tasks) == list(range(1, 201))
+
+
+def test_merge_keeps_tasks_added_since_load(tmp_path):
+    """The processor writing back its copy does not drop new tasks"""
+    queue = MobileTaskQueue(tmp_path / "mobile_task_queue.json")
+    queue.add_tasks([{'content': 'first'}])
+
+    local_copy = queue.read()
+    queue.add_tasks([{'content': 'second'}])
+
+    local_copy[0]['status'] = 'completed'
+    queue.merge_tasks(local_copy)
+
+    tasks = queue.read()
+    assert [t['content'] for t in tasks] == ['first', 'second']
+    assert [t['status'] for t in tasks] == ['completed', 'queued']
+
+
+def test_transcription_queue_caches_by_content_hash(tmp_path):
+    """A re-sent voice note is served from the cache, not the backend"""
+    backend = StubBackend(text="buy milk")
+    completed = []
+    transcriber = TranscriptionQueue(
+        backend,
+        cache=TranscriptCache(tmp_path / "transcripts.db"),
+        on_complete=lambda context, text, error: completed.append((context, text, error))
+    )
+
+    original = tmp_path / "voice_a.ogg"
+    forwarded = tmp_path / "voice_b.ogg"
+    original.write_bytes(b"OggS same audio")
+    forwarded.write_bytes(b"OggS same audio")
+
+    assert transcriber.submit(original, context=1).result() == "buy milk"
+    assert transcriber.submit(forwarded, context=2).result() == "buy milk"
+    transcriber.shutdown()
+
+    assert backend.calls == 1
+    assert sorted(completed) == [(1, "buy milk", None), (2, "buy milk", None)]
+
+
+def test_transcription_failure_reaches_callback(tmp_path):
+    """Backend errors are reported to the callback instead of raised"""
+    class BrokenBackend(StubBackend):
+        def transcribe(self, audio_path):
+            raise RuntimeError("backend down")
+
+    completed = []
+    transcriber = TranscriptionQueue(
+        BrokenBackend(),
+        on_complete=lambda context, text, error: completed.append((text, str(error)))
+    )
+
+    audio = tmp_path / "voice.ogg"
+    audio.write_bytes(b"OggS")
+    assert transcriber.submit(audio).result() is None
+    transcriber.shutdown()
+
+    assert completed == [(None, "backend down")]
+
+
+class FakeResponse:
+    """requests.Response stand-in: JSON body or streamed chunks"""
+
+    def __init__(self, body=None, chunks=(), headers=None, delay=0.0):
+        self.body = body
+        self.chunks = chunks
+        self.headers = headers or {}
+        self.delay = delay
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+    def iter_content(self, chunk_size=None):
+        for chunk in self.chunks:
+            if self.delay:
+                time.sleep(self.delay)
+            yield chunk
+
+
+class FakeSession:
+    """Serves media metadata and one media file, recording requested URLs"""
+
+    def __init__(self, chunks=(b"OggS",), headers=None, delay=0.0):
+        self.file = FakeResponse(chunks=chunks, headers=headers, delay=delay)
+        self.urls = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.urls.append(url)
+        if stream:
+            return self.file
+        return FakeResponse(body={'url': f"https://media.example/{url.rsplit('/', 1)[-1]}"})
+
+
+def test_media_download_aborts_past_max_bytes(tmp_path):
+    """Oversized media is rejected by Content-Length or while streaming, leaving no file"""
+    dest = tmp_path / "voice.ogg"
+
+    declared = whatsapp_media.MediaFetcher(
+        "token", session=FakeSession(headers={'Content-Length': "11"}), max_bytes=10
+    )
+    with pytest.raises(whatsapp_media.MediaDownloadError, match="too large"):
+        declared.fetch("m1", dest)
+
+    streamed = whatsapp_media.MediaFetcher("token", session=FakeSession(chunks=[b"x" * 6] * 2), max_bytes=10)
+    with pytest.raises(whatsapp_media.MediaDownloadError, match="exceeded 10 bytes"):
+        streamed.fetch("m1", dest)
+    assert list(tmp_path.iterdir()) == []
+
+    assert streamed.fetch_many([("m1", dest)]) == {"m1": None}
+
+
+def test_media_download_deadline(tmp_path):
+    """A download still streaming past the deadline is abandoned"""
+    fetcher = whatsapp_media.MediaFetcher(
+        "token", session=FakeSession(chunks=[b"x"] * 5, delay=0.01), deadline=0.02
+    )
+    with pytest.raises(whatsapp_media.MediaDownloadError, match="Download exceeded"):
+        fetcher.fetch("m1", tmp_path / "voice.ogg")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_media_url_cached_until_expiry(tmp_path):
+    """The media_id -> url lookup is reused within its TTL and refetched after"""
+    session = FakeSession()
+    fetcher = whatsapp_media.MediaFetcher("token", session=session)
+    lookup = f"{whatsapp_media.WHATSAPP_API_URL}/m1"
+
+    assert fetcher.fetch("m1", tmp_path / "a.ogg").read_bytes() == b"OggS"
+    fetcher.fetch("m1", tmp_path / "b.ogg")
+    assert session.urls.count(lookup) == 1
+    assert session.urls.count("https://media.example/m1") == 2
+
+    url, _ = fetcher._url_cache["m1"]
+    fetcher._url_cache["m1"] = (url, time.monotonic() - 1)
+    fetcher.fetch("m1", tmp_path / "c.ogg")
+    assert session.urls.count(lookup) == 2
+
+
+def test_redelivered_message_ids_are_rejected(tmp_path):
+    """Redeliveries are caught in memory and across processes via SQLite"""
+    seen = SeenMessageIds(persist_path=tmp_path / "seen.db")
+    assert seen.add("wamid.A") is True
+    assert seen.add("wamid.A") is False
+    assert "wamid.A" in seen
+
+    # Another worker sharing the same store
+    other_worker = SeenMessageIds(persist_path=tmp_path / "seen.db")
+    assert other_worker.add("wamid.A") is False
+    assert other_worker.add("wamid.B") is True
+
+
+def test_seen_ids_expire_and_stay_bounded():
+    """Expired ids are processed again and the set never exceeds max_size"""
+    seen = SeenMessageIds(ttl=0, max_size=3)
+    assert seen.add("wamid.A") is True
+    assert seen.add("wamid.A") is True
+
+    bounded = SeenMessageIds(max_size=3)
+    for i in range(10):
+        bounded.add(f"wamid.{i}")
+    assert len(bounded) == 3
+    assert "wamid.9" in bounded and "wamid.0" not in bounded
+
+
+@pytest.fixture
+def bridge(tmp_path, monkeypatch):
+    """Bridge with storage under tmp_path and outbound messages captured in bridge.sent"""
+    monkeypatch.setenv("WHATSAPP_PHONE_NUMBER_ID", "123")
+    monkeypatch.setenv("WHATSAPP_ACCESS_TOKEN", "token")
+    monkeypatch.setenv("YOUR_PHONE_NUMBER", "15550001111")
+    monkeypatch.setattr(whatsapp_bridge, "ARES_DIR", tmp_path)
+    monkeypatch.setattr(whatsapp_bridge, "TASK_QUEUE_FILE", tmp_path / "mobile_task_queue.json")
+    monkeypatch.setattr(whatsapp_bridge, "CONFIG_FILE", tmp_path / "whatsapp_config.json")
+    monkeypatch.setattr(whatsapp_bridge, "STATUS_FILE", tmp_path / "whatsapp_message_status.json")
+    monkeypatch.setattr(whatsapp_bridge, "SEEN_MESSAGES_FILE", tmp_path / "seen.db")
+    monkeypatch.setattr(
+        whatsapp_bridge, "TranscriptCache", lambda: TranscriptCache(tmp_path / "transcripts.db")
+    )
+
+    bridge = whatsapp_bridge.AresWhatsAppBridge(StubBackend(text="call the plumber"))
+    bridge.sent = []
+    monkeypatch.setattr(bridge, "send_message", lambda to, message: bridge.sent.append((to, message)) or True)
+    yield bridge
+    bridge.transcriber.shutdown()
+
+
+def webhook_payload(*changes):
+    """Webhook body with one entry per change value"""
+    return {'entry': [{'changes': [{'value': value}]} for value in changes]}
+
+
+def text_message(message_id, body, sender="15550001111"):
+    return {'id': message_id, 'from': sender, 'type': 'text', 'text': {'body': body}}
+
+
+def test_webhook_batch_is_committed_once(bridge):
+    """Every entry, change and message of one POST lands in a single queue write"""
+    writes = []
+    write = bridge.queue._write_unlocked
+    bridge.queue._write_unlocked = lambda data: writes.append(len(data)) or write(data)
+
+    payload = {'entry': [
+        {'changes': [
+            {'value': {'messages': [text_message("wamid.1", "first"), text_message("wamid.2", "second")]}},
+            {'value': {'messages': [text_message("wamid.3", "third")]}},
+        ]},
+        {'changes': [{'value': {'messages': [text_message("wamid.4", "fourth")]}}]},
+    ]}
+    summary = bridge.process_webhook(payload)
+
+    assert summary == {'messages': 4, 'duplicates': 0, 'statuses': 0, 'tasks': 4}
+    assert writes == [4]
+    assert [t['content'] for t in bridge.task_queue] == ["first", "second", "third", "fourth"]
+    assert [message.split("\n")[0] for _, message in bridge.sent] == [
+        f"✅ Task #{n} queued!" for n in range(1, 5)
+    ]
+
+
+def test_late_statuses_never_downgrade(bridge):
+    """A 'delivered' arriving after 'read' (same or later POST) is ignored"""
+    def status(name, timestamp):
+        return {'id': "wamid.out", 'status': name, 'recipient_id': "15550001111", 'timestamp': timestamp}
+
+    bridge.process_webhook(webhook_payload(
+        {'statuses': [status('sent', "1")]},
+        {'statuses': [status('read', "3"), status('delivered', "2")]}
+    ))
+    assert bridge.message_statuses["wamid.out"]['status'] == 'read'
+
+    bridge.process_webhook(webhook_payload({'statuses': [status('delivered', "2")]}))
+    assert bridge.message_statuses["wamid.out"] == {
+        'status': 'read', 'recipient': "15550001111", 'timestamp': "3"
+    }
+
+
+def test_status_trimming_evicts_least_recently_updated(bridge, monkeypatch):
+    """An old message that just progressed survives trimming"""
+    monkeypatch.setattr(whatsapp_bridge, 'MAX_TRACKED_STATUSES', 2)
+
+    def status(message_id, name):
+        return {'id': message_id, 'status': name, 'recipient_id': "15550001111", 'timestamp': "1"}
+
+    bridge.record_statuses([status("wamid.a", 'sent'), status("wamid.b", 'sent')])
+    bridge.record_statuses([status("wamid.a", 'read'), status("wamid.c", 'sent')])
+
+    assert list(bridge.message_statuses) == ["wamid.a", "wamid.c"]
+
+
+def test_failed_commit_lets_redelivery_through(bridge):
+    """A batch that never reached the queue is not remembered as processed"""
+    payload = webhook_payload({'messages': [text_message("wamid.1", "first")]})
+    add_tasks = bridge.queue.add_tasks
+
+    def locked_out(tasks):
+        raise OSError("lock timeout")
+
+    bridge.queue.add_tasks = locked_out
+    with pytest.raises(OSError):
+        bridge.process_webhook(payload)
+    assert "wamid.1" not in bridge.seen_messages
+
+    bridge.queue.add_tasks = add_tasks
+    assert bridge.process_webhook(payload)['tasks'] == 1
+    assert bridge.process_webhook(payload)['duplicates'] == 1
+    assert [t['content'] for t in bridge.task_queue] == ["first"]
+
+
+def test_lost_transcription_jobs_are_recovered(bridge, tmp_path):
+    """Tasks left 'transcribing' by a dead process are re-submitted or failed"""
+    audio = tmp_path / "voice_kept.ogg"
+    audio.write_bytes(b"OggS kept")
+    sender = bridge.your_phone
+    bridge.queue.add_tasks([
+        {'type': 'voice', 'from': sender, 'status': 'transcribing', 'voice_file': str(audio)},
+        {'type': 'voice', 'from': sender, 'status': 'transcribing', 'voice_file': str(tmp_path / "gone.ogg")},
+        {'type': 'voice', 'from': sender, 'status': 'transcribing', 'voice_file': str(audio),
+         'transcribing_since': time.time()},
+    ])
+
+    recovered = bridge.recover_voice_tasks()
+    bridge.transcriber.shutdown()
+
+    assert [task['id'] for task in recovered] == [1]
+    tasks = bridge.task_queue
+    assert [(t['status'], t['content']) for t in tasks[:2]] == [
+        ('queued', "call the plumber"), ('failed', "[Voice message - transcription failed]")
+    ]
+    assert tasks[2]['status'] == 'transcribing'  # Still within its timeout
+    assert sorted(message.split("\n")[0] for _, message in bridge.sent) == [
+        "✅ Voice message queued as Task #1!", "❌ Transcription failed for Task #2"
+    ]
+
+    # A duplicate completion (original job finishing late) changes nothing
+    bridge.complete_voice_task(recovered[0], "stale transcript", None)
+    assert bridge.task_queue[0]['content'] == "call the plumber"
+    assert len(bridge.sent) == 2
+
+
+def test_bridge_shares_the_pooled_media_session(bridge):
+    """Sends and downloads share MediaFetcher's session, pooled for max_workers"""
+    assert bridge.session is bridge.media.session
+    adapter = bridge.session.get_adapter("https://graph.facebook.com")
+    assert adapter._pool_maxsize == bridge.media.max_workers * 2
+
+
+def test_missing_credentials_fail_before_opening_storage(tmp_path, monkeypatch):
+    """No queue, dedupe database or worker pool is created for a bridge that can't run"""
+    monkeypatch.delenv("WHATSAPP_ACCESS_TOKEN", raising=False)
+    monkeypatch.setattr(whatsapp_bridge, "ARES_DIR", tmp_path)
+    monkeypatch.setattr(whatsapp_bridge, "SEEN_MESSAGES_FILE", tmp_path / "seen.db")
+    monkeypatch.setattr(whatsapp_bridge, "TranscriptionQueue", None)
+
+    with pytest.raises(ValueError):
+        whatsapp_bridge.AresWhatsAppBridge(StubBackend())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_app_factory_recovers_lost_jobs(bridge, monkeypatch):
+    """Recovery runs once per app built from the environment, not per bridge"""
+    calls = []
+    monkeypatch.setattr(whatsapp_bridge.AresWhatsAppBridge, "recover_voice_tasks", lambda self: calls.append(self))
+
+    whatsapp_bridge.create_app(bridge)
+    assert calls == []
+
+    app = whatsapp_bridge.create_app()
+    assert calls == [app.config['ARES_BRIDGE']]
+    app.config['ARES_BRIDGE'].transcriber.shutdown()
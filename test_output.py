@@ -0,0 +1,84 @@
+"""
+Tests for the ARES output protocol (core/output.py)
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+import core.output as output
+from core.output import AresOutput, dumps_many
+
+
+def make_response():
+    return AresOutput.format_medium_confidence(
+        result="Implement sentiment analysis ✓",
+        reasoning="Rules catch 80%, AI enhances edge cases",
+        patterns_used=["Hybrid AI + Rules"],
+        caveats=["37% accuracy is low"]
+    )
+
+
+def test_response_is_slotted_and_lazily_timestamped():
+    """Tuple fields, no instance dict, epoch stored and formatted on output"""
+    response = make_response()
+
+    assert not hasattr(response, '__dict__')
+    assert response.warnings == ("37% accuracy is low",)
+    with pytest.raises(AttributeError):
+        response.extra = 1
+    assert isinstance(response.created_at, float)
+    assert datetime.fromisoformat(response.timestamp).timestamp() == pytest.approx(response.created_at)
+
+    data = response.to_dict()
+    assert list(data) == [
+        'result', 'reasoning', 'confidence_score', 'confidence_level', 'patterns_used',
+        'alternatives_considered', 'evidence', 'warnings', 'timestamp', 'ares_version',
+    ]
+    assert data['warnings'] == ["37% accuracy is low"] and data['timestamp'] == response.timestamp
+
+
+def test_json_is_compact_by_default_and_backends_agree(monkeypatch):
+    """Compact output is identical with and without orjson; both keep non-ASCII unescaped"""
+    response = make_response()
+    compact = response.to_json()
+
+    assert '\n' not in compact and ', ' not in compact.split('"reasoning"')[0]
+    assert json.loads(compact) == response.to_dict()
+    pretty = response.to_json(pretty=True)
+    assert pretty == json.dumps(response.to_dict(), indent=2, ensure_ascii=False)
+    assert "analysis ✓" in pretty
+
+    monkeypatch.setattr(output, 'orjson', None)
+    assert response.to_json() == compact
+    ndjson = dumps_many([response, response])
+
+    monkeypatch.undo()
+    assert dumps_many([response, response]) == ndjson
+    assert [json.loads(line) for line in ndjson.splitlines()] == [response.to_dict()] * 2
+    assert dumps_many([]) == ''
+
+
+def test_backends_agree_on_non_str_keys_and_reject_the_same_values(monkeypatch):
+    """orjson falls back to the stdlib encoder instead of diverging from it"""
+    pytest.importorskip("orjson")
+    keyed = AresOutput.format_high_confidence(
+        result={1: 'x', 2.5: 'y', None: 'z', 'big': 2 ** 70},
+        reasoning="Keys as the stdlib writes them",
+        patterns_used=[],
+        evidence=[]
+    )
+    unsupported = AresOutput.format_high_confidence(
+        result=datetime(2025, 1, 1), reasoning="Not JSON", patterns_used=[], evidence=[]
+    )
+
+    with_orjson = keyed.to_json()
+    with pytest.raises(TypeError):
+        unsupported.to_json()
+
+    monkeypatch.setattr(output, 'orjson', None)
+    assert keyed.to_json() == with_orjson
+    assert json.loads(with_orjson)['result'] == {'1': 'x', '2.5': 'y', 'null': 'z', 'big': 2 ** 70}
+    with pytest.raises(TypeError):
+        unsupported.to_json()
@@ -0,0 +1,327 @@
+"""
+Tests for the ARES pattern library (core/patterns.py and friends)
+
+Uses small markdown libraries written to tmp_path, plus the real
+proven-patterns.md where noted.
+"""
+
+import os
+
+from core.keyword_automaton import KeywordAutomaton
+from core.pattern_index import PatternIndex
+from core.pattern_parser import load_pattern_records, parse_patterns
+from core.patterns import AresPatternMatcher, Pattern
+
+SAMPLE_LIBRARY = """# Proven Patterns
+
+## Core Architecture Patterns
+
+### 1. Modular Things ⭐⭐⭐ TIER 1
+**Pattern ID:** modular_v1 | **Success Rate:** 95% | **Uses:** 12
+**Applies to:** modular, scraping
+**Pattern:** Small parts, one coordinator
+
+**Evidence:**
+- Used in: Project A
+  - nested detail is ignored
+- Metric: 95% success
+
+**Trade-offs:**
+- ✅ Benefit: Easy to extend
+
+### 2. Untiered Section
+**Pattern:** Not loaded
+
+### 3. Sentiment Rules ⭐⭐ TIER 2 - NEEDS IMPROVEMENT
+**Pattern:** Keyword lexicon
+
+```python
+### not a heading
+```
+
+## Anti-Patterns Identified ❌
+
+### 1. Pure AI ⭐ TIER 3
+**Pattern:** Never loaded
+"""
+
+
+def test_parser_extracts_tiered_sections():
+    """Only tiered sections outside the anti-pattern list become patterns"""
+    patterns = parse_patterns(SAMPLE_LIBRARY.splitlines(keepends=True))
+
+    assert [p.pattern_id for p in patterns] == ['modular_v1', 'sentiment_rules']
+
+    modular, sentiment = patterns
+    assert modular.tier == 1
+    assert modular.name == 'Modular Things'
+    assert modular.description == 'Small parts, one coordinator'
+    assert modular.success_rate == 0.95
+    assert modular.usage_count == 12
+    assert modular.category == 'core_architecture'
+    assert modular.applies_to == ('modular', 'scraping')
+    assert modular.evidence == ('Used in: Project A', 'Metric: 95% success')
+    assert modular.trade_offs == '✅ Benefit: Easy to extend'
+
+    # Defaults come from the tier definitions
+    assert sentiment.tier == 2
+    assert sentiment.success_rate == 0.50
+    assert sentiment.usage_count == 2
+    assert sentiment.applies_to == ('sentiment', 'rules')
+
+
+def test_compiled_cache_skips_parsing_until_file_changes(tmp_path):
+    """Warm loads come from the cache; edits invalidate it"""
+    source = tmp_path / "proven-patterns.md"
+    source.write_text(SAMPLE_LIBRARY, encoding='utf-8')
+    cache_dir = tmp_path / "cache"
+
+    cold = load_pattern_records(source, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    assert load_pattern_records(source, cache_dir=cache_dir) == cold
+
+    source.write_text(SAMPLE_LIBRARY.replace("Uses:** 12", "Uses:** 13"), encoding='utf-8')
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_pattern_records(source, cache_dir=cache_dir)[0][5] == 13
+
+
+def test_real_library_loads_curated_patterns(tmp_path):
+    """proven-patterns.md as written provides the curated Tier 1/2 patterns"""
+    matcher = AresPatternMatcher(cache_dir=tmp_path)
+
+    assert matcher.get_pattern_by_id('database_centric_v1').success_rate == 1.0
+    assert matcher.get_pattern_by_id('local_sentiment_v2').name == 'Local Sentiment Analysis'
+    assert matcher.get_pattern_by_id('local_sentiment_v2').tier == 2
+    assert matcher.get_pattern_by_id('hybrid_ai_rules_v1').description == 'Rules catch 80%, AI enhances edge cases'
+    assert [p.pattern_id for p in matcher.get_tier_1_patterns()] == [
+        'modular_architecture_v1', 'database_centric_v1', 'hybrid_ai_rules_v1',
+        'comprehensive_cli_v1', 'graceful_degradation_v1'
+    ]
+
+
+def make_pattern(pattern_id, tier, success_rate, applies_to, description="", evidence=(), usage_count=1):
+    return Pattern(
+        pattern_id=pattern_id,
+        tier=tier,
+        name=pattern_id,
+        description=description,
+        success_rate=success_rate,
+        usage_count=usage_count,
+        category="test",
+        applies_to=applies_to,
+        evidence=evidence,
+        trade_offs=""
+    )
+
+
+def test_patterns_are_compact_and_columnar():
+    """Patterns are frozen slotted records; the index answers lookups from columns"""
+    import dataclasses
+
+    import pytest
+
+    low = make_pattern('t1_low', 1, 0.8, ['ai'], usage_count=7)
+    patterns = [make_pattern('t2', 2, 0.9, ['sentiment']), low, make_pattern('t1_high', 1, 0.95, ['ai'])]
+    assert not hasattr(low, '__dict__')
+    assert low.applies_to == ('ai',)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        low.tier = 2
+
+    index = PatternIndex(patterns)
+    assert list(index.tiers) == [1, 1, 2]
+    assert index.by_id['t1_low'] is low
+    assert [p.pattern_id for p in index.tier_buckets[1]] == ['t1_low', 't1_high']
+    assert [p.pattern_id for p in index.select(min_success_rate=0.9)] == ['t1_high', 't2']
+    assert [p.pattern_id for p in index.select(tier=1, min_uses=5)] == ['t1_low']
+
+
+def test_index_matches_whole_keywords_in_rank_order():
+    """Keywords match as whole words/phrases; results sorted by tier then rate"""
+    index = PatternIndex([
+        make_pattern('t2', 2, 0.9, ['sentiment']),
+        make_pattern('t1_low', 1, 0.8, ['ai']),
+        make_pattern('t1_high', 1, 0.95, ['data_collection', 'sentiment']),
+    ])
+
+    assert [p.pattern_id for p in index.match("Sentiment for data collection")] == ['t1_high', 't2']
+    assert [p.pattern_id for p in index.match("AI-driven sentiment")] == ['t1_high', 't1_low', 't2']
+    assert [p.pattern_id for p in index.match("maintain the data")] == []
+    assert [p.pattern_id for p in index.match("sentiment", tier_filter=2)] == ['t2']
+
+
+def test_automaton_respects_word_boundaries():
+    """Whole-word keywords skip partial words; '*' keywords match prefixes"""
+    automaton = KeywordAutomaton([
+        ('ai', 'ai'),
+        ('cli', 'cli'),
+        ('microservice*', 'microservice'),
+        ('data_collection', 'data_collection'),
+    ])
+
+    assert automaton.find_payloads("maintain a client") == set()
+    assert automaton.find_payloads("AI + CLI") == {'ai', 'cli'}
+    assert automaton.find_payloads("Split into microservices") == {'microservice'}
+    assert automaton.find_payloads("Data-Collection jobs") == {'data_collection'}
+    assert automaton.find_all("ai and ai") == [(0, 2, 'ai'), (7, 9, 'ai')]
+
+
+def test_scan_backend_equals_automaton():
+    """Small vocabularies default to plain scans with identical hits"""
+    import random
+
+    from core.keyword_automaton import normalize_text
+
+    keywords = [(k, k) for k in ('ai', 'api', 'data', 'data collection', 'tab', 'modular*', 'a')]
+    keywords.append(('ai*', 'ai_prefix'))
+    scan = KeywordAutomaton(keywords)
+    automaton = KeywordAutomaton(keywords, backend='python')
+    assert scan.backend == 'scan'
+
+    rng = random.Random(5)
+    words = ['ai', 'aim', 'api', 'data', 'collection', 'modular', 'modularity', 'tab', 'stab', 'a', 'x']
+    for _ in range(500):
+        text = normalize_text(' '.join(rng.choice(words) for _ in range(rng.randint(0, 8))))
+        assert list(scan.iter_hits(text)) == list(automaton.iter_hits(text))
+        assert scan.find_payloads(text, normalized=True) == automaton.find_payloads(text, normalized=True)
+
+
+def test_ranked_retrieval_blends_text_score_with_tier():
+    """BM25 scores every text field; tier and success rate break near-ties"""
+    sentiment = make_pattern(
+        'sentiment_t2', 2, 0.6, ['sentiment'],
+        description="Keyword lexicon for customer review sentiment"
+    )
+    hybrid = make_pattern(
+        'hybrid_t1', 1, 0.9, ['hybrid'],
+        evidence=["Scored customer review sentiment with rules plus AI"]
+    )
+    unrelated = make_pattern('cli_t1', 1, 1.0, ['cli'])
+    index = PatternIndex([sentiment, hybrid, unrelated])
+
+    ranked = index.ranker.top_k("customer review sentiment", k=5)
+    assert [p.pattern_id for p, _ in ranked] == ['hybrid_t1', 'sentiment_t2']
+    assert ranked[0][1] > ranked[1][1]
+
+    assert [p.pattern_id for p, _ in index.ranker.top_k("lexicon", k=5)] == ['sentiment_t2']
+    assert index.ranker.top_k("customer sentiment", k=1, tier_filter=2)[0][0] is sentiment
+    assert index.ranker.top_k("blockchain voting", k=5) == []
+
+
+def test_match_many_keeps_input_order_in_process_and_pool(monkeypatch):
+    """Batch results equal per-call results, in order, with or without workers"""
+    import core.pattern_index as pattern_index
+
+    index = PatternIndex([
+        make_pattern('t2', 2, 0.9, ['sentiment']),
+        make_pattern('t1', 1, 0.8, ['ai', 'data_collection']),
+    ])
+    texts = ["AI sentiment", "nothing here", "data collection", "AI sentiment", "Sentiment"] * 3
+    expected = [index.match(t) for t in texts]
+
+    assert index.match_many(texts, processes=1) == expected
+    assert index.match_many(texts, tier_filter=2, processes=1) == [index.match(t, 2) for t in texts]
+
+    monkeypatch.setattr(pattern_index, 'CHUNK_SIZE', 4)
+    assert index.match_many(texts, processes=2) == expected
+
+
+def test_watcher_swaps_in_edited_library(tmp_path):
+    """Edits to the library file show up without rebuilding the matcher"""
+    import time
+
+    source = tmp_path / "proven-patterns.md"
+    source.write_text(SAMPLE_LIBRARY, encoding='utf-8')
+    matcher = AresPatternMatcher(patterns_file=str(source), cache_dir=tmp_path / "cache")
+    old_index = matcher._index
+    assert matcher.reload_if_changed() is False
+
+    matcher.watch(interval=0.01)
+    try:
+        source.write_text(SAMPLE_LIBRARY.replace("modular, scraping", "modular, crawling"), encoding='utf-8')
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        deadline = time.time() + 5
+        while matcher.library_version == 1 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        matcher.stop_watching()
+
+    assert matcher.library_version == 2
+    assert [p.pattern_id for p in matcher.find_matching_patterns("crawling")] == ['modular_v1']
+    # The old snapshot is untouched for anyone still holding it
+    assert [p.pattern_id for p in old_index.match("scraping")] == ['modular_v1']
+
+
+def test_usage_is_buffered_then_flushed_with_promotion_candidates(tmp_path):
+    """Documented plus recorded uses reaching the tier threshold make a candidate"""
+    from core.usage import UsageTracker
+
+    source = tmp_path / "proven-patterns.md"
+    source.write_text(SAMPLE_LIBRARY, encoding='utf-8')
+    tracker = UsageTracker(db_path=tmp_path / "usage.db", promote_threshold=2, flush_interval=3600)
+    matcher = AresPatternMatcher(patterns_file=str(source), cache_dir=None, usage_tracker=tracker)
+    assert tracker.thresholds == {3: 2, 2: 5}
+
+    # Tier 2 with 2 documented uses: 3 more reach the Tier 1 bar of 5
+    matcher.recommend_pattern("sentiment rules")
+    matcher.recommend_many(["sentiment", "scraping", "nothing"])
+    assert tracker.promotion_candidates() == []
+    matcher.recommend_pattern("sentiment")
+    assert tracker.promotion_candidates() == ['sentiment_rules']
+    assert matcher.usage_count('modular_v1') == 13
+
+    # Nothing reached disk until the flush
+    assert UsageTracker(db_path=tmp_path / "usage.db").uses('sentiment_rules') == 0
+    tracker.close()
+    reopened = UsageTracker(db_path=tmp_path / "usage.db", promote_threshold=2)
+    assert reopened.uses('sentiment_rules') == 3
+    assert reopened.promotion_candidates() == ['sentiment_rules']
+
+    # After close() there is no flush thread: records are written through
+    matcher.recommend_pattern("scraping")
+    assert UsageTracker(db_path=tmp_path / "usage.db").uses('modular_v1') == 2
+
+    assert UsageTracker.from_config({'tech_matrix': {'track_usage': False}}) is None
+    assert UsageTracker(db_path=tmp_path / "other.db", promote_threshold=3).thresholds == {3: 3, 2: 5}
+
+
+def test_match_cache_hits_and_invalidates_on_reload(tmp_path):
+    """Repeated texts are served from the LRU; a library swap invalidates it"""
+    source = tmp_path / "proven-patterns.md"
+    source.write_text(SAMPLE_LIBRARY, encoding='utf-8')
+    matcher = AresPatternMatcher(patterns_file=str(source), cache_dir=None, match_cache_size=2)
+
+    first = matcher.find_matching_patterns("Modular scraping")
+    first.clear()  # Callers get their own list
+    assert [p.pattern_id for p in matcher.find_matching_patterns("modular   SCRAPING!")] == ['modular_v1']
+    assert matcher.cache_info() == (1, 1, 2, 1)
+
+    matcher.find_matching_patterns("sentiment")
+    matcher.find_matching_patterns("rules")
+    assert matcher.cache_info().currsize == 2
+
+    source.write_text(SAMPLE_LIBRARY.replace("modular, scraping", "crawling"), encoding='utf-8')
+    matcher.reload()
+    assert matcher.cache_info().currsize == 0
+    assert matcher.find_matching_patterns("modular scraping") == []
+    assert AresPatternMatcher(patterns_file=str(source), cache_dir=None, match_cache_size=0).cache_info() is None
+
+
+def test_word_start_walk_equals_full_automaton():
+    """The word-start trie walk finds exactly the boundary hits of the full scan"""
+    import random
+
+    from core.keyword_automaton import normalize_text
+
+    automaton = KeywordAutomaton(
+        [(k, k) for k in ('ai', 'api', 'data', 'data collection', 'tab', 'modular*', 'a')],
+        backend='python'
+    )
+    rng = random.Random(3)
+    words = ['ai', 'api', 'data', 'collection', 'modular', 'modularity', 'tab', 'stab', 'a', 'x']
+    for _ in range(500):
+        text = normalize_text(' '.join(rng.choice(words) for _ in range(rng.randint(0, 8))))
+        full = [h for h in automaton._raw_hits(text) if h[0] == 0 or text[h[0] - 1] == ' ']
+        assert automaton._word_start_hits(text) == full
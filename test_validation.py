@@ -0,0 +1,315 @@
+"""
+Tests for the ARES validation protocol (core/validation.py)
+"""
+
+import dataclasses
+
+import pytest
+
+from core.patterns import AresPatternMatcher
+from core.validation import AresValidation, ConfidenceLevel
+
+
+@pytest.fixture
+def validator(tmp_path):
+    return AresValidation(patterns_library=AresPatternMatcher(cache_dir=tmp_path))
+
+
+def test_mixed_case_rules_fire(validator):
+    """Anti-pattern and GraphQL rules match regardless of case"""
+    result = validator.run_validation(
+        task="Answer support emails",
+        proposed_approach="Pure AI without fallback, exposed over GraphQL",
+        context={'api_needs': 'simple'}
+    )
+
+    assert "Anti-pattern detected: Pure AI without fallbacks" in result.warnings
+    assert "REST API (simpler, well-understood)" in result.alternatives_considered
+
+
+def test_tier_1_pattern_gives_high_confidence(validator):
+    """A Tier 1 match plus an analogy is enough to execute autonomously"""
+    result = validator.run_validation(
+        task="Build a web scraping system for multiple data sources",
+        proposed_approach="Create a modular architecture with separate scrapers",
+        context={"complexity": "medium"}
+    )
+
+    assert result.confidence_level == ConfidenceLevel.HIGH
+    assert result.patterns_referenced == ("Modular Scraper Architecture",)
+    assert result.explain_response.startswith("Like LEGO blocks")
+
+
+def test_validation_context_matches_once(validator, monkeypatch):
+    """One pattern match per validation; confidence comes from the typed context"""
+    calls = []
+    original = validator.patterns.find_matching_patterns
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(validator.patterns, 'find_matching_patterns', counting)
+    ctx = validator.build_context(
+        task="Automate workflows",
+        proposed_approach="Use SQLite as single source of truth with hybrid AI + rules"
+    )
+    assert len(calls) == 1
+    assert ctx.normalized == "use sqlite as single source of truth with hybrid ai rules"
+    assert ctx.tiers == {1}
+
+    result = validator.run_validation(
+        task="Automate workflows",
+        proposed_approach="Use SQLite as single source of truth with hybrid AI + rules"
+    )
+    assert len(calls) == 2
+    assert result.confidence_score == pytest.approx(0.9)
+    assert result.explain_response.startswith("Like a calculator")
+
+
+def test_validation_never_builds_the_bm25_ranker(validator):
+    """Ranked retrieval is opt-in; keyword validation doesn't pay for it"""
+    validator.run_validation(
+        task="Automate workflows",
+        proposed_approach="Use SQLite as single source of truth with hybrid AI + rules"
+    )
+    validator.patterns.recommend_pattern("hybrid ai with rules")
+    assert validator.patterns._index._ranker is None
+
+    validator.patterns.recommend_pattern("hybrid ai with rules", ranked=True)
+    assert validator.patterns._index._ranker is not None
+
+
+def test_batch_streams_results_in_order(validator, monkeypatch):
+    """Batch results match one-at-a-time validation, in-process or in workers"""
+    import core.validation as validation
+
+    items = [
+        ("Scrape sites", "Create a modular architecture with separate scrapers"),
+        ("Answer email", "Pure AI without fallback", {}),
+        ("Vote", "Use Ethereum smart contracts", {}),
+        ("Automate", "Use SQLite as single source of truth with hybrid AI + rules", None),
+    ] * 3
+    expected = [validator.run_validation(*item) for item in items]
+
+    assert list(validator.run_validation_batch(items, processes=1)) == expected
+
+    monkeypatch.setattr(validation, 'BATCH_CHUNK_SIZE', 5)
+    assert list(validator.run_validation_batch(iter(items), processes=2)) == expected
+
+
+def test_worker_results_record_usage_by_pattern_id(tmp_path, monkeypatch):
+    """Two patterns sharing a display name are each counted once"""
+    source = tmp_path / "proven-patterns.md"
+    source.write_text(
+        "## Core Patterns\n\n"
+        "### 1. Scrapers ⭐⭐⭐ TIER 1\n**Pattern ID:** scrapers_a\n**Applies to:** scraping\n\n"
+        "### 2. Scrapers ⭐⭐ TIER 2\n**Pattern ID:** scrapers_b\n**Applies to:** crawling\n",
+        encoding='utf-8'
+    )
+    validator = AresValidation(patterns_library=AresPatternMatcher(patterns_file=str(source), cache_dir=None))
+    item = ("Collect data", "scraping only")
+    result = validator.run_validation(*item)
+    assert result.pattern_ids == ('scrapers_a',)
+
+    recorded = []
+    monkeypatch.setattr(validator.patterns, 'record_usage', lambda patterns: recorded.append(patterns))
+    validator._record_worker_results([item], [result])
+    assert [[p.pattern_id for p in used] for used in recorded] == [['scrapers_a']]
+
+
+def test_matcher_pickles_without_threads_or_tracker(tmp_path):
+    """Workers receive patterns and index only"""
+    import pickle
+
+    from core.usage import UsageTracker
+
+    matcher = AresPatternMatcher(
+        cache_dir=tmp_path,
+        usage_tracker=UsageTracker(db_path=tmp_path / "usage.db")
+    )
+    matcher.watch(interval=60)
+    try:
+        copy = pickle.loads(pickle.dumps(matcher))
+    finally:
+        matcher.stop_watching()
+
+    assert copy.usage_tracker is None and copy._watcher is None
+    assert copy.cache_info() == (0, 0, 1024, 0)
+    assert copy.find_matching_patterns("modular scrapers") == matcher.find_matching_patterns("modular scrapers")
+
+
+def test_rules_load_from_file_with_context_predicates(tmp_path):
+    """Custom rule files compile into one matcher; predicates gate firing"""
+    import json
+
+    from core.rules import RuleSet
+
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps({"rules": [
+        {"id": "mongo", "kind": "warning", "keywords": ["mongodb", "mongo"],
+         "when": {"team": ["solo", "small"]}, "message": "Prefer SQLite for small teams"},
+        {"id": "serverless", "kind": "alternative", "keywords": ["lambda*"],
+         "message": "A single VPS"},
+        {"id": "analogy", "kind": "analogy", "keywords": ["queue"], "message": "Like a ticket line"},
+    ]}), encoding='utf-8')
+    rules = RuleSet.from_file(rules_file)
+    validator = AresValidation(rules=rules)
+
+    small = validator.run_validation("Store events", "Mongo plus Lambdas feeding a queue", {"team": "small"})
+    assert small.warnings == ("Prefer SQLite for small teams",)
+    assert small.alternatives_considered == ("A single VPS",)
+    assert small.explain_response == "Like a ticket line"
+
+    large = validator.run_validation("Store events", "Mongo plus Lambdas feeding a queue", {"team": "large"})
+    assert large.warnings == ()
+
+    rules_file.write_text(json.dumps({"rules": [{"id": "x", "kind": "nope", "keywords": ["a"], "message": "m"}]}))
+    with pytest.raises(ValueError, match="Rule x"):
+        RuleSet.from_file(rules_file)
+
+
+def test_result_cache_hits_expires_and_invalidates(tmp_path, monkeypatch):
+    """Equivalent inputs share a result until the TTL, library or rules change"""
+    import time
+
+    from core.rules import RuleSet
+    from core.validation_cache import ValidationCache
+
+    matcher = AresPatternMatcher(cache_dir=tmp_path)
+    validator = AresValidation(patterns_library=matcher, cache=ValidationCache(ttl=60))
+    calls = []
+    real_validate = validator._validate
+    monkeypatch.setattr(validator, '_validate', lambda *a: calls.append(a) or real_validate(*a))
+
+    first = validator.run_validation("Scrape sites", "Modular scrapers", {"a": 1, "b": 2})
+    again = validator.run_validation("scrape  SITES", "modular scrapers!", {"b": 2, "a": 1})
+    assert len(calls) == 1 and again == first
+
+    # Every caller gets its own copy: changing one never reaches later hits
+    original = first.warnings
+    first.warnings = again.warnings = ("edited",)
+    hit = validator.run_validation("Scrape sites", "Modular scrapers", {"a": 1, "b": 2})
+    assert len(calls) == 1 and hit.warnings == original
+
+    # Library edit -> new fingerprint -> recompute
+    matcher.patterns = [dataclasses.replace(p, success_rate=0.5) for p in matcher.patterns]
+    matcher.rebuild_index()
+    validator.run_validation("Scrape sites", "Modular scrapers", {"a": 1, "b": 2})
+    assert len(calls) == 2
+
+    validator.rules = RuleSet(validator.rules.rules, version="edited")
+    validator.run_validation("Scrape sites", "Modular scrapers", {"a": 1, "b": 2})
+    assert len(calls) == 3
+
+    monkeypatch.setattr(time, 'time', lambda: 1e12)
+    validator.run_validation("Scrape sites", "Modular scrapers", {"a": 1, "b": 2})
+    assert len(calls) == 4
+
+    # Cached copies drop the profile: hits are not timed
+    with validator.profile():
+        timed = validator.run_validation("Timed", "Modular scrapers")
+    assert timed.profile is not None
+    assert validator.run_validation("Timed", "Modular scrapers").profile is None
+
+
+def test_result_cache_persists_across_instances(tmp_path):
+    """A fresh cache on the same file is warm"""
+    from core.validation_cache import ValidationCache
+
+    db_path = tmp_path / "validation-cache.db"
+    matcher = AresPatternMatcher(cache_dir=tmp_path)
+    cold = AresValidation(patterns_library=matcher, cache=ValidationCache(persist_path=db_path))
+    expected = cold.run_validation("Build a scraper", "Modular scrapers with a coordinator")
+
+    warm = AresValidation(
+        patterns_library=AresPatternMatcher(cache_dir=tmp_path),
+        cache=ValidationCache(persist_path=db_path)
+    )
+    assert warm.run_validation("Build a scraper", "Modular scrapers with a coordinator") == expected
+    assert warm.cache.info().disk_hits == 1 and warm.cache.info().misses == 0
+
+
+def test_async_validation_matches_sync_and_streams_in_order(validator):
+    """arun_validation and arun_validation_batch agree with the sync API"""
+    import asyncio
+
+    from core.output import AresOutput
+
+    items = [(f"Task {i}", approach) for i, approach in enumerate(
+        ["Modular scrapers", "Microservices on Kubernetes", "Pure AI without fallback"] * 40
+    )]
+
+    async def run():
+        single = await validator.arun_validation(*items[0])
+        streamed = [r async for r in validator.arun_validation_batch(items, processes=1)]
+        response = await AresOutput.avalidate_and_format(validator, *items[1])
+        return single, streamed, response
+
+    single, streamed, response = asyncio.run(run())
+    expected = [validator.run_validation(*item) for item in items]
+    assert single == expected[0]
+    assert streamed == expected
+    assert response.confidence_score == expected[1].confidence_score
+
+
+def test_async_batch_cancellation_stops_reading_items(validator):
+    """Leaving the stream early cancels queued chunks and pulls no more items"""
+    import asyncio
+
+    pulled = []
+
+    def items():
+        for i in range(10000):
+            pulled.append(i)
+            yield ("Scrape", "Modular scrapers")
+
+    async def run():
+        stream = validator.arun_validation_batch(items(), processes=1)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        task = asyncio.ensure_future(validator.arun_validation("Scrape", "Modular scrapers"))
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert len(pulled) < 10000
+
+
+def test_profiling_is_opt_in_and_times_every_step(validator):
+    """Profiles ride on results and aggregate only while hooks are attached"""
+    from core.validation_profile import STEPS, ValidationHooks
+
+    assert validator.run_validation("Scrape", "Modular scrapers").profile is None
+
+    with validator.profile() as profiler:
+        for _ in range(10):
+            result = validator.run_validation("Scrape", "Modular scrapers with a fallback")
+    assert validator.hooks is None
+    assert tuple(result.profile.steps) == STEPS
+    assert result.profile.pattern_matches == len(result.patterns_referenced)
+    assert result.profile.rules_fired >= 2
+
+    # Timed and untimed runs share one step sequence
+    untimed = validator.run_validation("Scrape", "Modular scrapers with a fallback")
+    assert untimed.profile is None
+    assert dataclasses.replace(result, profile=None) == untimed
+
+    summary = profiler.summary()
+    assert profiler.count == 10 and summary['challenge']['count'] == 10
+    assert summary['total']['p95_us'] <= summary['total']['max_us']
+    assert profiler.pattern_matches == {result.profile.pattern_matches: 10}
+    assert "confidence" in profiler.report()
+
+    seen = []
+
+    class Collect(ValidationHooks):
+        def on_validation(self, profile):
+            seen.append(profile)
+
+    validator.hooks = Collect()
+    validator.run_validation("Scrape", "Microservices")
+    assert len(seen) == 1 and seen[0].total > 0
@@ -0,0 +1,195 @@
+"""
+Ares Transcription - Voice message transcription job queue
+
+Transcription runs off the webhook thread:
+- Pluggable backends (OpenAI Whisper, local stub for tests)
+- Bounded concurrency (fixed worker pool)
+- Persistent result cache keyed by the audio content hash, so a
+  re-sent or forwarded voice note is never transcribed twice
+- Completion callback, used by the bridge to update the task and
+  notify the sender
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Paths
+ARES_DIR = Path.home() / ".ares-mcp"
+TRANSCRIPT_CACHE_FILE = ARES_DIR / "transcripts.db"
+
+FAILED_TRANSCRIPTION = "[Voice message - transcription failed]"
+
+
+class TranscriptionBackend:
+    """Interface for speech-to-text backends"""
+
+    name = "base"
+
+    def transcribe(self, audio_path: Path) -> str:
+        """Return the transcript of an audio file (raise on failure)"""
+        raise NotImplementedError
+
+
+class WhisperBackend(TranscriptionBackend):
+    """OpenAI Whisper API (openai>=1.0 client, legacy SDK as fallback)"""
+
+    name = "whisper-1"
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "whisper-1"):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model
+        self.name = model
+        self._client = None
+
+    def transcribe(self, audio_path: Path) -> str:
+        import openai
+
+        with open(audio_path, 'rb') as f:
+            if hasattr(openai, "OpenAI"):
+                if self._client is None:
+                    self._client = openai.OpenAI(api_key=self.api_key)
+                return self._client.audio.transcriptions.create(model=self.model, file=f).text
+
+            # Legacy SDK (openai<1.0)
+            openai.api_key = self.api_key
+            return openai.Audio.transcribe(self.model, f)['text']
+
+
+class StubBackend(TranscriptionBackend):
+    """Local backend for tests and offline runs - no network calls"""
+
+    name = "stub"
+
+    def __init__(self, text: str = "[stub transcript]", delay: float = 0.0):
+        self.text = text
+        self.delay = delay
+        self.calls = 0
+
+    def transcribe(self, audio_path: Path) -> str:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.text
+
+
+def get_backend(name: Optional[str] = None) -> TranscriptionBackend:
+    """Backend by name (default: ARES_TRANSCRIPTION_BACKEND or whisper)"""
+    name = name or os.getenv("ARES_TRANSCRIPTION_BACKEND", "whisper")
+    if name == "stub":
+        return StubBackend()
+    if name == "whisper":
+        return WhisperBackend()
+    raise ValueError(f"Unknown transcription backend: {name}")
+
+
+def hash_audio(audio_path: Path) -> str:
+    """SHA-256 of the audio content"""
+    digest = hashlib.sha256()
+    with open(audio_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Persistent transcript cache (SQLite), keyed by content hash + backend"""
+
+    def __init__(self, path: Path = TRANSCRIPT_CACHE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcripts ("
+                " audio_hash TEXT NOT NULL,"
+                " backend TEXT NOT NULL,"
+                " text TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " PRIMARY KEY (audio_hash, backend))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps this safe across threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, audio_hash: str, backend: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT text FROM transcripts WHERE audio_hash = ? AND backend = ?",
+                (audio_hash, backend)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, audio_hash: str, backend: str, text: str):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?)",
+                (audio_hash, backend, text, time.time())
+            )
+
+
+class TranscriptionQueue:
+    """
+    Background transcription jobs with bounded concurrency
+
+    on_complete(context, text, error) is called from a worker thread when
+    a job finishes; text is None and error is set if it failed.
+    """
+
+    def __init__(
+        self,
+        backend: TranscriptionBackend,
+        cache: Optional[TranscriptCache] = None,
+        max_workers: int = 2,
+        on_complete: Optional[Callable[[Any, Optional[str], Optional[Exception]], None]] = None
+    ):
+        self.backend = backend
+        self.cache = cache
+        self.on_complete = on_complete
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transcribe")
+
+    def transcribe(self, audio_path: Path) -> str:
+        """Transcribe synchronously, using the cache"""
+        audio_hash = hash_audio(audio_path)
+
+        if self.cache:
+            cached = self.cache.get(audio_hash, self.backend.name)
+            if cached is not None:
+                logger.info(f"[CACHE HIT] Transcript for {audio_path.name}")
+                return cached
+
+        text = self.backend.transcribe(audio_path)
+
+        if self.cache:
+            self.cache.put(audio_hash, self.backend.name, text)
+        return text
+
+    def submit(self, audio_path: Path, context: Any = None) -> Future:
+        """Queue a transcription job; returns a Future for the transcript"""
+        return self._executor.submit(self._run, Path(audio_path), context)
+
+    def _run(self, audio_path: Path, context: Any) -> Optional[str]:
+        text, error = None, None
+        try:
+            text = self.transcribe(audio_path)
+        except Exception as e:
+            error = e
+            logger.error(f"[ERROR] Transcription failed: {str(e)}")
+
+        if self.on_complete:
+            try:
+                self.on_complete(context, text, error)
+            except Exception as e:
+                logger.error(f"[ERROR] Transcription callback failed: {str(e)}")
+        return text
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting jobs (optionally wait for running ones or drop queued ones)"""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -15,17 +15,30 @@ Setup:
    - WHATSAPP_PHONE_NUMBER_ID
    - WHATSAPP_ACCESS_TOKEN
    - YOUR_PHONE_NUMBER (format: 1234567890, no +)
+
+Production serving:
+    python whatsapp_bridge.py --workers 4 --threads 8
+    gunicorn -w 4 --threads 8 "whatsapp_bridge:create_app()"
 """
 
 import os
 import json
+import time
+import atexit
+import argparse
 import requests
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
-from flask import Flask, request, jsonify
+from typing import Dict, List, Optional
+from flask import Blueprint, Flask, current_app, request, jsonify
 import logging
 
+from message_dedupe import SeenMessageIds
+from mobile_queue import LockedJsonFile, MobileTaskQueue
+from whatsapp_media import MediaFetcher
+from transcription import (
+    FAILED_TRANSCRIPTION, TranscriptCache, TranscriptionBackend, TranscriptionQueue, get_backend
+)
+
 # Setup logging
 logging.basicConfig(
     format='[%(asctime)s] %(levelname)s - %(message)s',
@@ -37,41 +50,68 @@ logger = logging.getLogger(__name__)
 ARES_DIR = Path.home() / ".ares-mcp"
 TASK_QUEUE_FILE = ARES_DIR / "mobile_task_queue.json"
 CONFIG_FILE = ARES_DIR / "whatsapp_config.json"
+STATUS_FILE = ARES_DIR / "whatsapp_message_status.json"
+SEEN_MESSAGES_FILE = ARES_DIR / "whatsapp_seen_messages.db"
+
+# Delivery status tracking (Meta sends sent -> delivered -> read, or failed)
+STATUS_RANK = {'sent': 1, 'delivered': 2, 'read': 3, 'failed': 4}
+MAX_TRACKED_STATUSES = 1000
+
+# Voice tasks whose transcription job was lost (crash, redeploy, worker
+# recycle) stay 'transcribing'; past this many seconds they are re-submitted
+TRANSCRIPTION_TIMEOUT = int(os.getenv("ARES_TRANSCRIPTION_TIMEOUT", "300"))
+RECOVERY_INTERVAL = 60  # seconds between checks for lost transcription jobs
 
 # WhatsApp API
 WHATSAPP_API_URL = "https://graph.facebook.com/v18.0"
 
-# Flask app for webhook
-app = Flask(__name__)
+# Webhook routes (registered on an app by create_app)
+webhook = Blueprint('webhook', __name__)
 
 
 class AresWhatsAppBridge:
     """Bridge between WhatsApp and Ares Master Control Program"""
 
-    def __init__(self):
+    def __init__(self, transcription_backend: Optional[TranscriptionBackend] = None):
         self.phone_number_id = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
         self.access_token = os.getenv("WHATSAPP_ACCESS_TOKEN")
         self.your_phone = os.getenv("YOUR_PHONE_NUMBER")
-        self.task_queue = self.load_task_queue()
-        self.config = self.load_config()
 
+        # Before opening any storage, pools or worker threads
         if not all([self.phone_number_id, self.access_token, self.your_phone]):
             logger.error("[ERROR] Missing WhatsApp credentials")
             raise ValueError("Missing WhatsApp credentials. Check environment variables.")
 
+        self.queue = MobileTaskQueue(TASK_QUEUE_FILE)
+        self.statuses = LockedJsonFile(STATUS_FILE, default=dict)
+        self.seen_messages = SeenMessageIds(persist_path=SEEN_MESSAGES_FILE)
+        self.config = self.load_config()
+        # One pooled session (sized by MediaFetcher) for media and sends
+        self.media = MediaFetcher(self.access_token)
+        self.session = self.media.session
+        self.transcriber = TranscriptionQueue(
+            transcription_backend or get_backend(),
+            cache=TranscriptCache(),
+            max_workers=int(os.getenv("ARES_TRANSCRIPTION_WORKERS", "2")),
+            on_complete=self.complete_voice_task
+        )
+
+        # Queued jobs are dropped at exit; their tasks are recovered on restart
+        # (create_app runs the first recovery pass)
+        atexit.register(self.transcriber.shutdown, wait=False, cancel_futures=True)
+        self._last_recovery = 0.0
+
+    @property
+    def task_queue(self) -> List[Dict]:
+        """Current task queue, read from shared storage"""
+        return self.queue.read()
+
     def load_task_queue(self):
         """Load task queue"""
-        if TASK_QUEUE_FILE.exists():
-            with open(TASK_QUEUE_FILE, 'r') as f:
-                return json.load(f)
-        return []
-
-    def save_task_queue(self):
-        """Save task queue"""
-        with open(TASK_QUEUE_FILE, 'w') as f:
-            json.dump(self.task_queue, f, indent=2)
+        return self.queue.read()
 
-    def load_config(self):
+    @staticmethod
+    def load_config() -> Dict:
         """Load configuration"""
         if CONFIG_FILE.exists():
             with open(CONFIG_FILE, 'r') as f:
@@ -83,6 +123,11 @@ class AresWhatsAppBridge:
         with open(CONFIG_FILE, 'w') as f:
             json.dump(self.config, f, indent=2)
 
+    @property
+    def message_statuses(self) -> Dict:
+        """Delivery/read statuses of sent messages, read from shared storage"""
+        return self.statuses.read()
+
     def send_message(self, to: str, message: str) -> bool:
         """Send WhatsApp message"""
         url = f"{WHATSAPP_API_URL}/{self.phone_number_id}/messages"
@@ -98,7 +143,7 @@ class AresWhatsAppBridge:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = self.session.post(url, headers=headers, json=data, timeout=(5, 30))
             response.raise_for_status()
             logger.info(f"[OK] Sent message to {to}")
             return True
@@ -108,120 +153,344 @@ class AresWhatsAppBridge:
 
     def download_audio(self, media_id: str) -> Optional[Path]:
         """Download voice message from WhatsApp"""
-        # Get media URL
-        url = f"{WHATSAPP_API_URL}/{media_id}"
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            media_url = response.json()['url']
+        return self.download_audio_many([media_id])[media_id]
 
-            # Download file
-            audio_response = requests.get(media_url, headers=headers)
-            audio_response.raise_for_status()
-
-            # Save to file
-            audio_path = ARES_DIR / f"voice_{media_id}.ogg"
-            with open(audio_path, 'wb') as f:
-                f.write(audio_response.content)
-
-            logger.info(f"[OK] Downloaded audio: {audio_path}")
-            return audio_path
-
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to download audio: {str(e)}")
-            return None
+    def download_audio_many(self, media_ids: List[str]) -> Dict[str, Optional[Path]]:
+        """Download several voice messages concurrently (None where failed)"""
+        return self.media.fetch_many(
+            (media_id, ARES_DIR / f"voice_{media_id}.ogg") for media_id in media_ids
+        )
 
     def transcribe_audio(self, audio_path: Path) -> str:
-        """Transcribe audio using OpenAI Whisper API"""
+        """Transcribe audio synchronously (cached by content hash)"""
         try:
-            import openai
-            openai.api_key = os.getenv("OPENAI_API_KEY")
-
-            with open(audio_path, 'rb') as f:
-                transcript = openai.Audio.transcribe("whisper-1", f)
-                return transcript['text']
+            return self.transcriber.transcribe(audio_path)
         except Exception as e:
             logger.error(f"[ERROR] Transcription failed: {str(e)}")
-            return "[Voice message - transcription failed]"
+            return FAILED_TRANSCRIPTION
+
+    def complete_voice_task(self, task: Dict, transcription: Optional[str], error: Optional[Exception]):
+        """
+        Finish a voice task once its transcription job is done
+
+        Only a task still 'transcribing' is updated, so a job that was
+        recovered and ran twice completes (and notifies) once.
+        """
+        if transcription is None:
+            if self.queue.update_task(
+                task['id'], if_status='transcribing',
+                content=FAILED_TRANSCRIPTION, status='failed', error=str(error)
+            ):
+                self.send_message(task['from'], f"❌ Transcription failed for Task #{task['id']}")
+            return
+
+        if not self.queue.update_task(task['id'], if_status='transcribing', content=transcription, status='queued'):
+            logger.warning(f"[WARNING] Task #{task['id']} was completed or removed before transcription finished")
+            return
+
+        logger.info(f"[TRANSCRIBED] Task #{task['id']}: {transcription[:50]}...")
+        self.send_message(
+            task['from'],
+            f"✅ Voice message queued as Task #{task['id']}!\n\n"
+            f"Transcription:\n{transcription}"
+        )
+
+    def recover_voice_tasks(self, stale_after: float = TRANSCRIPTION_TIMEOUT) -> List[Dict]:
+        """
+        Re-submit voice tasks whose transcription job was lost
+
+        Jobs live in this process's worker pool only, so a crash or
+        restart leaves their tasks 'transcribing'. Tasks in that state
+        for stale_after seconds are re-submitted if their audio is still
+        on disk and marked 'failed' otherwise. Runs from create_app and every
+        RECOVERY_INTERVAL seconds from process_webhook; the timeout keeps
+        one worker from taking over another live worker's jobs.
+
+        Returns:
+            Tasks re-submitted
+        """
+        now = time.time()
+        self._last_recovery = now
+        resubmit, failed = [], []
+
+        def is_stale(task: Dict) -> bool:
+            return task.get('status') == 'transcribing' and now - task.get('transcribing_since', 0) >= stale_after
+
+        # Read first: the common case (nothing lost) never rewrites the queue
+        if not any(is_stale(task) for task in self.queue.read()):
+            return resubmit
+
+        def reclaim(queue: List[Dict]):
+            for task in queue:
+                if not is_stale(task):
+                    continue
+                if Path(task.get('voice_file', '')).is_file():
+                    task['transcribing_since'] = now
+                    resubmit.append(dict(task))
+                else:
+                    task.update(status='failed', content=FAILED_TRANSCRIPTION, error="Voice file missing")
+                    failed.append(dict(task))
+
+        self.queue.update(reclaim)
+
+        for task in resubmit:
+            logger.info(f"[RECOVER] Re-submitting transcription for Task #{task['id']}")
+            self.transcriber.submit(Path(task['voice_file']), context=task)
+        for task in failed:
+            logger.warning(f"[WARNING] Task #{task['id']} lost its voice file before transcription")
+            self.send_message(task['from'], f"❌ Transcription failed for Task #{task['id']}")
+        return resubmit
 
     def add_task(self, task: Dict):
         """Add task to queue"""
-        task['id'] = len(self.task_queue) + 1
-        task['timestamp'] = datetime.now().isoformat()
-        task['status'] = 'queued'
-        self.task_queue.append(task)
-        self.save_task_queue()
-        logger.info(f"[TASK QUEUED] #{task['id']}: {task['content'][:50]}...")
+        self.add_tasks([task])
 
-    def handle_text_message(self, from_number: str, message_body: str):
-        """Handle text message"""
+    def add_tasks(self, tasks: List[Dict]):
+        """Add a batch of tasks to the queue with a single save"""
+        self.queue.add_tasks(tasks)
+        for task in tasks:
+            logger.info(f"[TASK QUEUED] #{task['id']}: {task['content'][:50]}...")
+
+    def build_text_task(self, from_number: str, message_body: str) -> Optional[Dict]:
+        """Build a task from a text message (None if rejected)"""
         logger.info(f"[MESSAGE] From {from_number}: {message_body[:50]}...")
 
         # Check if it's from authorized number
         if from_number != self.your_phone:
             logger.warning(f"[WARNING] Unauthorized number: {from_number}")
             self.send_message(from_number, "🚫 Unauthorized")
-            return
+            return None
 
-        # Add to task queue
-        task = {
+        return {
             'content': message_body,
             'type': 'text',
             'from': from_number,
             'priority': False
         }
-        self.add_task(task)
 
-        # Send confirmation
-        self.send_message(
-            from_number,
-            f"✅ Task #{task['id']} queued!\n\n"
-            f"Will be executed when terminal comes online.\n\n"
-            f"Reply 'status' to check queue."
-        )
-
-    def handle_audio_message(self, from_number: str, media_id: str):
-        """Handle voice message"""
+    def build_audio_task(
+        self,
+        from_number: str,
+        media_id: str,
+        prefetched: Optional[Dict[str, Optional[Path]]] = None
+    ) -> Optional[Dict]:
+        """Build a task from a voice message (None if rejected or failed)"""
         logger.info(f"[VOICE] From {from_number}: {media_id}")
 
         if from_number != self.your_phone:
             logger.warning(f"[WARNING] Unauthorized number: {from_number}")
-            return
+            return None
 
-        # Download audio
-        audio_path = self.download_audio(media_id)
+        # Download audio (unless it was prefetched with the rest of the batch)
+        if prefetched is not None and media_id in prefetched:
+            audio_path = prefetched[media_id]
+        else:
+            audio_path = self.download_audio(media_id)
         if not audio_path:
             self.send_message(from_number, "❌ Failed to download voice message")
-            return
-
-        # Transcribe
-        self.send_message(from_number, "🎤 Transcribing voice message...")
-        transcription = self.transcribe_audio(audio_path)
+            return None
 
-        # Add to task queue
-        task = {
-            'content': transcription,
+        # Queued as 'transcribing' so the processor skips it until the
+        # transcription job completes it
+        return {
+            'content': "[Voice message - transcribing]",
             'type': 'voice',
             'voice_file': str(audio_path),
             'from': from_number,
-            'priority': False
+            'priority': False,
+            'status': 'transcribing',
+            'transcribing_since': time.time()
         }
-        self.add_task(task)
 
-        # Send confirmation with transcription
-        self.send_message(
-            from_number,
-            f"✅ Voice message queued as Task #{task['id']}!\n\n"
-            f"Transcription:\n{transcription}"
-        )
+    def send_confirmation(self, task: Dict):
+        """Confirm a queued task back to its sender"""
+        if task['type'] == 'voice':
+            # Transcript follows from complete_voice_task
+            self.send_message(task['from'], f"🎤 Voice message received as Task #{task['id']} - transcribing...")
+        else:
+            self.send_message(
+                task['from'],
+                f"✅ Task #{task['id']} queued!\n\n"
+                f"Will be executed when terminal comes online.\n\n"
+                f"Reply 'status' to check queue."
+            )
+
+    def handle_text_message(self, from_number: str, message_body: str):
+        """Handle text message"""
+        self.handle_messages([
+            {'from': from_number, 'type': 'text', 'text': {'body': message_body}}
+        ])
+
+    def handle_audio_message(self, from_number: str, media_id: str):
+        """Handle voice message"""
+        self.handle_messages([
+            {'from': from_number, 'type': 'audio', 'audio': {'id': media_id}}
+        ])
+
+    def handle_messages(self, messages: List[Dict]) -> List[Dict]:
+        """
+        Handle a batch of inbound messages
+
+        Every accepted message becomes a task, all tasks are committed
+        to the queue with one save, and confirmations go out afterwards
+        so task numbers are final. Status requests are answered last so
+        the counts include this batch.
+
+        Returns:
+            List of tasks that were queued
+        """
+        tasks = []
+        status_requests = []
+
+        # Download all authorized voice messages in the batch concurrently
+        audio_ids = [
+            m['audio']['id'] for m in messages
+            if m.get('type') == 'audio' and m.get('from') == self.your_phone
+        ]
+        audio_paths = self.download_audio_many(audio_ids) if audio_ids else {}
+
+        for message in messages:
+            from_number = message.get('from')
+            message_type = message.get('type')
+
+            if message_type == 'text':
+                message_body = message['text']['body']
+
+                # Check for commands
+                if message_body.lower() == 'status':
+                    status_requests.append(from_number)
+                    continue
+                task = self.build_text_task(from_number, message_body)
+
+            elif message_type == 'audio':
+                task = self.build_audio_task(from_number, message['audio']['id'], audio_paths)
+
+            else:
+                logger.info(f"[SKIP] Unsupported message type from {from_number}: {message_type}")
+                continue
+
+            if task:
+                tasks.append(task)
+
+        if tasks:
+            self.add_tasks(tasks)
+
+        # The batch is committed: later failures are logged, not raised, so
+        # a queued batch is never reported as failed (and released for
+        # redelivery). Lost transcription jobs are picked up by
+        # recover_voice_tasks.
+        for task in tasks:
+            try:
+                self.send_confirmation(task)
+                if task['type'] == 'voice':
+                    self.transcriber.submit(Path(task['voice_file']), context=task)
+            except Exception as e:
+                logger.error(f"[ERROR] Follow-up for Task #{task['id']} failed: {str(e)}")
+
+        for from_number in status_requests:
+            try:
+                self.handle_status_request(from_number)
+            except Exception as e:
+                logger.error(f"[ERROR] Status request from {from_number} failed: {str(e)}")
+
+        return tasks
+
+    def record_statuses(self, statuses: List[Dict]):
+        """
+        Track delivery/read statuses for sent messages
+
+        Statuses can arrive out of order across batches, so a status only
+        replaces the stored one if it is further along (sent < delivered
+        < read < failed).
+        """
+        def apply(tracked: Dict):
+            for status in statuses:
+                message_id = status.get('id')
+                new_status = status.get('status')
+                if not message_id or new_status not in STATUS_RANK:
+                    continue
+
+                current = tracked.get(message_id)
+                if current and STATUS_RANK[current['status']] >= STATUS_RANK[new_status]:
+                    continue
+
+                # Re-insert so dict (and file) order runs least to most recently updated
+                tracked.pop(message_id, None)
+                tracked[message_id] = {
+                    'status': new_status,
+                    'recipient': status.get('recipient_id'),
+                    'timestamp': status.get('timestamp')
+                }
+
+                if new_status == 'failed':
+                    logger.warning(f"[WARNING] Delivery failed for {message_id}: {status.get('errors')}")
+
+            # Keep only the most recently updated statuses
+            overflow = len(tracked) - MAX_TRACKED_STATUSES
+            if overflow > 0:
+                for message_id in list(tracked)[:overflow]:
+                    del tracked[message_id]
+
+        self.statuses.update(apply)
+
+    def process_webhook(self, data: Dict) -> Dict:
+        """
+        Process a full webhook payload
+
+        Meta batches several entries, changes, messages and statuses into
+        a single POST under load, so every one of them is walked here.
+        Messages already processed (Meta redeliveries) are dropped before
+        any other work. Ids are claimed up front, so concurrent deliveries
+        of one message to two workers run it once, and released again if
+        the batch fails, so Meta's redelivery after the 500 is processed.
+
+        Returns:
+            Counts of messages, duplicates, statuses and queued tasks
+        """
+        messages = []
+        statuses = []
+        claimed = []
+        duplicates = 0
+
+        try:
+            for entry in data.get('entry', []):
+                for change in entry.get('changes', []):
+                    value = change.get('value', {})
+                    for message in value.get('messages', []):
+                        if 'id' in message:
+                            if not self.seen_messages.add(message['id']):
+                                duplicates += 1
+                                continue
+                            claimed.append(message['id'])
+                        messages.append(message)
+                    statuses.extend(value.get('statuses', []))
+
+            if statuses:
+                self.record_statuses(statuses)
+
+            tasks = self.handle_messages(messages) if messages else []
+        except Exception:
+            # Nothing was queued (see handle_messages): let the redelivery through
+            for message_id in claimed:
+                self.seen_messages.discard(message_id)
+            raise
+
+        if time.time() - self._last_recovery >= RECOVERY_INTERVAL:
+            self.recover_voice_tasks()
+
+        return {
+            'messages': len(messages),
+            'duplicates': duplicates,
+            'statuses': len(statuses),
+            'tasks': len(tasks)
+        }
 
     def handle_status_request(self, from_number: str):
         """Handle status request"""
-        total = len(self.task_queue)
-        queued = len([t for t in self.task_queue if t['status'] == 'queued'])
-        completed = len([t for t in self.task_queue if t['status'] == 'completed'])
+        task_queue = self.task_queue
+        total = len(task_queue)
+        queued = len([t for t in task_queue if t['status'] == 'queued'])
+        completed = len([t for t in task_queue if t['status'] == 'completed'])
 
         status_msg = f"""
 📊 *Ares System Status*
@@ -235,11 +504,7 @@ Total tasks: {total}
         self.send_message(from_number, status_msg)
 
 
-# Global bridge instance
-bridge = None
-
-
-@app.route('/webhook', methods=['GET'])
+@webhook.route('/webhook', methods=['GET'])
 def webhook_verify():
     """Verify webhook (Meta requirement)"""
     mode = request.args.get('hub.mode')
@@ -257,50 +522,99 @@ def webhook_verify():
         return 'Forbidden', 403
 
 
-@app.route('/webhook', methods=['POST'])
+@webhook.route('/webhook', methods=['POST'])
 def webhook_receive():
     """Receive webhook from WhatsApp"""
-    global bridge
+    bridge = current_app.config['ARES_BRIDGE']
 
     try:
         data = request.get_json()
-        logger.info(f"[WEBHOOK] Received: {json.dumps(data, indent=2)}")
+        logger.debug(f"[WEBHOOK] Received: {json.dumps(data)}")
 
-        # Extract message data
-        entry = data['entry'][0]
-        changes = entry['changes'][0]
-        value = changes['value']
+        summary = bridge.process_webhook(data)
+        logger.info(
+            f"[WEBHOOK] {summary['messages']} messages "
+            f"({summary['duplicates']} redelivered), "
+            f"{summary['statuses']} statuses, {summary['tasks']} tasks queued"
+        )
 
-        if 'messages' not in value:
-            return jsonify({"status": "ok"}), 200
+        return jsonify({"status": "ok"}), 200
 
-        message = value['messages'][0]
-        from_number = message['from']
+    except Exception as e:
+        logger.error(f"[ERROR] Webhook processing failed: {str(e)}")
+        return jsonify({"status": "error", "message": str(e)}), 500
 
-        # Handle different message types
-        if message['type'] == 'text':
-            message_body = message['text']['body']
 
-            # Check for commands
-            if message_body.lower() == 'status':
-                bridge.handle_status_request(from_number)
-            else:
-                bridge.handle_text_message(from_number, message_body)
+def create_app(bridge: Optional[AresWhatsAppBridge] = None) -> Flask:
+    """
+    Build the webhook app
 
-        elif message['type'] == 'audio':
-            media_id = message['audio']['id']
-            bridge.handle_audio_message(from_number, media_id)
+    Each worker process calls this once and gets its own bridge; all
+    queue and status state lives in shared storage (see mobile_queue.py).
+    A bridge built here also re-submits transcription jobs lost by a
+    previous run (the stale timeout keeps workers from double-claiming).
 
-        return jsonify({"status": "ok"}), 200
+    Args:
+        bridge: Bridge instance to serve (default: built from environment)
+    """
+    if bridge is None:
+        bridge = AresWhatsAppBridge()
+        bridge.recover_voice_tasks()
 
-    except Exception as e:
-        logger.error(f"[ERROR] Webhook processing failed: {str(e)}")
-        return jsonify({"status": "error", "message": str(e)}), 500
+    app = Flask(__name__)
+    app.config['ARES_BRIDGE'] = bridge
+    app.register_blueprint(webhook)
+    return app
+
+
+def serve_production(host: str, port: int, workers: int, threads: int):
+    """
+    Serve with a production WSGI server
+
+    Uses gunicorn (worker processes x threads) where available, waitress
+    (threads only, works on Windows) otherwise, and falls back to Flask's
+    threaded server if neither is installed.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+
+    if BaseApplication is not None:
+        class GunicornApp(BaseApplication):
+            def load_config(self):
+                self.cfg.set('bind', f"{host}:{port}")
+                self.cfg.set('workers', workers)
+                self.cfg.set('threads', threads)
+
+            def load(self):
+                return create_app()
+
+        logger.info(f"[OK] gunicorn: {workers} workers x {threads} threads")
+        GunicornApp().run()
+        return
+
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("[WARNING] gunicorn/waitress not installed - using Flask threaded server")
+        create_app().run(host=host, port=port, debug=False, threaded=True)
+        return
+
+    logger.info(f"[OK] waitress: {workers * threads} threads")
+    serve(create_app(), host=host, port=port, threads=workers * threads)
 
 
 def main():
     """Main entry point"""
-    global bridge
+    parser = argparse.ArgumentParser(description="Ares WhatsApp Bridge webhook server")
+    parser.add_argument('--host', default='0.0.0.0', help='Bind address (default: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=5000, help='Port (default: 5000)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per worker (default: 4)')
+    parser.add_argument('--dev', action='store_true', help="Use Flask's single-process dev server")
+    args = parser.parse_args()
 
     print("=" * 70)
     print("ARES WHATSAPP BRIDGE - End-to-End Encrypted Mobile Communication")
@@ -331,27 +645,30 @@ def main():
         print()
         return
 
-    # Initialize bridge
+    # Workers build their own bridges (see create_app); the master only
+    # checks configuration, so it opens no storage and starts no threads
     try:
-        bridge = AresWhatsAppBridge()
-    except ValueError as e:
-        print(f"[ERROR] {str(e)}")
+        AresWhatsAppBridge.load_config()
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Unreadable config {CONFIG_FILE}: {str(e)}")
         return
 
-    print("[OK] WhatsApp Bridge initialized")
-    print(f"[OK] Authorized number: {bridge.your_phone}")
+    print("[OK] WhatsApp Bridge configured")
+    print(f"[OK] Authorized number: {os.getenv('YOUR_PHONE_NUMBER')}")
     print(f"[OK] Task queue: {TASK_QUEUE_FILE}")
     print()
     print("Starting webhook server...")
-    print("Listening on http://localhost:5000/webhook")
+    print(f"Listening on http://localhost:{args.port}/webhook")
     print()
     print("⚠️  IMPORTANT: You need to expose this to the internet")
-    print("   Use ngrok: ngrok http 5000")
+    print(f"   Use ngrok: ngrok http {args.port}")
     print("   Then configure webhook URL in Meta dashboard")
     print()
 
-    # Run Flask app
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    if args.dev:
+        create_app().run(host=args.host, port=args.port, debug=False)
+    else:
+        serve_production(args.host, args.port, args.workers, args.threads)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+"""
+Ares WhatsApp Media - Pooled, streaming Graph API media downloads
+
+Voice messages arrive as a media id. Fetching one takes two requests:
+1. GET /{media_id}  -> short-lived download URL (valid ~5 minutes)
+2. GET {url}        -> the file itself
+
+MediaFetcher keeps one pooled HTTP session for both, streams files to
+disk in chunks with size and time limits, caches the media_id -> url
+lookup for its validity window, and downloads batches concurrently.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# WhatsApp API
+WHATSAPP_API_URL = "https://graph.facebook.com/v18.0"
+
+# Limits
+MEDIA_URL_TTL = 270  # seconds; Meta URLs expire after 5 minutes
+MAX_MEDIA_BYTES = 16 * 1024 * 1024  # WhatsApp audio limit is 16 MB
+DOWNLOAD_DEADLINE = 60  # seconds for a whole file
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024
+
+
+class MediaDownloadError(Exception):
+    """Media could not be downloaded within limits"""
+
+
+class MediaFetcher:
+    """Download WhatsApp media over a persistent, pooled session"""
+
+    def __init__(
+        self,
+        access_token: str,
+        session: Optional[requests.Session] = None,
+        max_workers: int = 4,
+        max_bytes: int = MAX_MEDIA_BYTES,
+        deadline: float = DOWNLOAD_DEADLINE
+    ):
+        """
+        Args:
+            access_token: WhatsApp Cloud API token
+            session: Session to reuse as-is (default: a new session pooled
+                     for max_workers concurrent downloads)
+            max_workers: Concurrent downloads for fetch_many
+            max_bytes: Reject files larger than this
+            deadline: Give up on a single download after this many seconds
+        """
+        self.access_token = access_token
+        self.max_workers = max_workers
+        self.max_bytes = max_bytes
+        self.deadline = deadline
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers * 2)
+            session.mount("https://", adapter)
+        self.session = session
+
+        self._url_cache: Dict[str, Tuple[str, float]] = {}
+        self._url_lock = threading.Lock()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    def get_media_url(self, media_id: str, refresh: bool = False) -> str:
+        """Resolve a media id to its download URL (cached until it expires)"""
+        now = time.monotonic()
+
+        if not refresh:
+            with self._url_lock:
+                cached = self._url_cache.get(media_id)
+            if cached and cached[1] > now:
+                return cached[0]
+
+        response = self.session.get(
+            f"{WHATSAPP_API_URL}/{media_id}",
+            headers=self.headers,
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+        )
+        response.raise_for_status()
+        media_url = response.json()['url']
+
+        with self._url_lock:
+            # Drop expired entries while we hold the lock
+            for key in [k for k, (_, expires) in self._url_cache.items() if expires <= now]:
+                del self._url_cache[key]
+            self._url_cache[media_id] = (media_url, now + MEDIA_URL_TTL)
+
+        return media_url
+
+    def fetch(self, media_id: str, dest: Path) -> Path:
+        """
+        Stream one media file to disk
+
+        Retries once with a fresh URL if the cached one was rejected.
+
+        Raises:
+            MediaDownloadError: File too large or deadline exceeded
+            requests.RequestException: Network/HTTP failure
+        """
+        try:
+            return self._stream(self.get_media_url(media_id), dest)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in (401, 403, 404):
+                raise
+            logger.info(f"[RETRY] Media URL rejected, refreshing: {media_id}")
+            return self._stream(self.get_media_url(media_id, refresh=True), dest)
+
+    def _stream(self, media_url: str, dest: Path) -> Path:
+        dest = Path(dest)
+        partial = dest.with_name(dest.name + ".part")
+        started = time.monotonic()
+
+        with self.session.get(
+            media_url,
+            headers=self.headers,
+            stream=True,
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+        ) as response:
+            response.raise_for_status()
+
+            declared = int(response.headers.get('Content-Length') or 0)
+            if declared > self.max_bytes:
+                raise MediaDownloadError(f"Media too large: {declared} bytes")
+
+            received = 0
+            try:
+                with open(partial, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        received += len(chunk)
+                        if received > self.max_bytes:
+                            raise MediaDownloadError(f"Media exceeded {self.max_bytes} bytes")
+                        if time.monotonic() - started > self.deadline:
+                            raise MediaDownloadError(f"Download exceeded {self.deadline}s")
+                        f.write(chunk)
+                os.replace(partial, dest)
+            finally:
+                if partial.exists():
+                    partial.unlink()
+
+        logger.info(f"[OK] Downloaded media: {dest} ({received} bytes)")
+        return dest
+
+    def fetch_many(self, downloads: Iterable[Tuple[str, Path]]) -> Dict[str, Optional[Path]]:
+        """
+        Download several media files concurrently
+
+        Args:
+            downloads: (media_id, dest) pairs
+
+        Returns:
+            media_id -> path, or None where the download failed
+        """
+        downloads = list(downloads)
+        if not downloads:
+            return {}
+
+        def fetch_one(item: Tuple[str, Path]) -> Optional[Path]:
+            media_id, dest = item
+            try:
+                return self.fetch(media_id, dest)
+            except Exception as e:
+                logger.error(f"[ERROR] Failed to download media {media_id}: {str(e)}")
+                return None
+
+        workers = min(self.max_workers, len(downloads))
+        if workers == 1:
+            return {downloads[0][0]: fetch_one(downloads[0])}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(fetch_one, downloads)
+            return {media_id: path for (media_id, _), path in zip(downloads, results)}